@@ -1,14 +1,14 @@
 import logging
 from importlib import metadata
-from typing import Dict, Iterable, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+from textual import work
 from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.timer import Timer
 from textual.widgets import Footer, Header
-from textual.worker import Worker
 
 from DockTUI.config import config
 from DockTUI.docker_mgmt.manager import DockerManager
@@ -28,13 +28,13 @@ from DockTUI.ui.dialogs.confirm import (
 )
 from DockTUI.ui.viewers.log_pane import LogPane
 from DockTUI.ui.widgets.status import ErrorDisplay, StatusBar
-from DockTUI.utils.logging import setup_logging
+from DockTUI.utils.logging import setup_logging, stop_logging
 
 # Initialize logging
 log_file = setup_logging()
 logger = logging.getLogger("DockTUI")
 if log_file:  # Only log if debug mode is enabled
-    logger.info(f"Logging initialized. Log file: {log_file}")
+    logger.info("Logging initialized. Log file: %s", log_file)
 
 
 class DockTUIApp(App, DockerActions, RefreshActions):
@@ -75,57 +75,8 @@ class DockTUIApp(App, DockerActions, RefreshActions):
             return f"{base_title} - {suffix}"
         return base_title
 
-    CSS = """
-    /* Remove generic container styling that might affect command palette */
-
-    #left-pane {
-        width: 50%;
-        height: 100%;
-        padding: 0 1;
-    }
-
-    /* Only apply to Vertical containers inside left-pane */
-    #left-pane Vertical {
-        height: auto;
-        width: 100%;
-        padding: 0 1;
-    }
-
-    /* Ensure ContainerList fills available space and scrolls independently */
-    ContainerList {
-        height: 100%;
-    }
-
-    DataTable {
-        background: $surface;
-        border: none;
-    }
-
-    DataTable > .datatable--header {
-        background: $surface;
-        color: $text;
-        text-style: bold;
-        border-bottom: solid $primary-darken-2;
-    }
-
-    Header {
-        background: $surface-darken-2;
-        color: $primary-lighten-2;
-        border-bottom: solid $primary-darken-3;
-        text-style: bold;
-        height: 3;
-        padding: 0 1;
-    }
-
-    Footer {
-        background: $primary-darken-2;
-        color: $primary-lighten-2;
-        border-top: solid $primary-darken-3;
-        text-style: bold;
-        height: 2;
-        padding: 0 0;
-    }
-    """
+    # Loaded from a file so Textual reads and parses it once per app start
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
@@ -145,19 +96,20 @@ class DockTUIApp(App, DockerActions, RefreshActions):
             super().__init__()
             DockerActions.__init__(self)
             RefreshActions.__init__(self)
-            self.docker = DockerManager()
+            self.docker = DockerManager(
+                follow_stats=config.get("app.stream_stats", False)
+            )
             self.container_list: ContainerList | None = None
             self.log_pane: LogPane | None = None
             self.error_display: ErrorDisplay | None = None
             self.refresh_timer: Timer | None = None
-            self._current_worker: Worker | None = None
             self.footer: Footer | None = None
             self.status_bar: StatusBar | None = None
             # Track current selection type for dynamic bindings
             self._current_selection_type = "none"
             self._current_selection_status = "none"
         except Exception as e:
-            logger.error(f"Error during initialization: {str(e)}", exc_info=True)
+            logger.error("Error during initialization: %s", e, exc_info=True)
             raise
 
     def get_system_commands(self, screen: Screen) -> Iterable[SystemCommand]:
@@ -174,7 +126,7 @@ class DockTUIApp(App, DockerActions, RefreshActions):
 
             # Yield default system commands
             for cmd in super().get_system_commands(screen):
-                logger.info(f"Yielding default command: {cmd.title}")
+                logger.info("Yielding default command: %s", cmd.title)
                 yield cmd
 
             # Yield custom commands
@@ -227,11 +179,11 @@ class DockTUIApp(App, DockerActions, RefreshActions):
             ]
 
             for title, help_text, callback in custom_commands:
-                logger.info(f"Yielding custom command: {title}")
+                logger.info("Yielding custom command: %s", title)
                 yield SystemCommand(title, help_text, callback)
 
         except Exception as e:
-            logger.error(f"Error in get_system_commands: {str(e)}", exc_info=True)
+            logger.error("Error in get_system_commands: %s", e, exc_info=True)
             # Re-raise to ensure Textual sees the error
             raise
 
@@ -260,7 +212,7 @@ class DockTUIApp(App, DockerActions, RefreshActions):
             footer.id = "footer"
             yield footer
         except Exception as e:
-            logger.error(f"Error during composition: {str(e)}", exc_info=True)
+            logger.error("Error during composition: %s", e, exc_info=True)
             raise
 
     def on_mount(self) -> None:
@@ -277,30 +229,35 @@ class DockTUIApp(App, DockerActions, RefreshActions):
             self.footer = self.query_one("#footer", Footer)
             self.status_bar = self.query_one("#status_bar", StatusBar)
 
-            # Start the auto-refresh timer with interval from config
+            # Start the auto-refresh timer with interval from config. Ticks back
+            # off on their own when Docker takes long to respond.
             refresh_interval = config.get("app.refresh_interval", 5.0)
             self.refresh_timer = self.set_interval(
-                refresh_interval, self.action_refresh
+                refresh_interval, self._refresh_on_timer
             )
             # Trigger initial refresh immediately
-            self.call_after_refresh(self.action_refresh)
+            self.action_refresh()
         except Exception as e:
-            logger.error(f"Error during mount: {str(e)}", exc_info=True)
+            logger.error("Error during mount: %s", e, exc_info=True)
             raise
 
     def action_quit(self) -> None:
         """Handle the quit action by stopping the refresh timer and exiting."""
         if self.refresh_timer:
             self.refresh_timer.stop()
+        # Drop the results of a refresh still in flight rather than render them
+        if self._current_worker is not None:
+            self._current_worker.cancel()
+        self.docker.close()
         self.exit()
 
     def action_refresh(self) -> None:
         """Trigger an asynchronous refresh of the container list."""
         try:
-            # Use call_after_refresh to ensure we're in the right context
-            self.call_after_refresh(self.refresh_containers)
+            # Starting the refresh worker doesn't block, so no task is needed
+            self.refresh_containers()
         except Exception as e:
-            logger.error(f"Error scheduling refresh: {str(e)}", exc_info=True)
+            logger.error("Error starting refresh: %s", e, exc_info=True)
 
     def action_start(self) -> None:
         """Start the selected container or stack."""
@@ -508,8 +465,25 @@ class DockTUIApp(App, DockerActions, RefreshActions):
         self.push_screen(modal, handle_remove_confirmation)
 
     def action_remove_unused_images(self) -> None:
-        """Remove all unused images with confirmation dialog."""
+        """Remove all unused images with confirmation dialog.
+
+        Finding them lists every image and container, so it runs in a background
+        thread instead of stalling the UI while Docker responds.
+        """
+        self._find_unused_images()
+
+    @work(thread=True, group="unused")
+    def _find_unused_images(self) -> None:
+        """Look up the unused images, then ask to confirm removing them."""
         unused_images = self.docker.get_unused_images()
+        self.call_from_thread(self._confirm_remove_unused_images, unused_images)
+
+    def _confirm_remove_unused_images(self, unused_images: List[Dict]) -> None:
+        """Ask to confirm removing the unused images.
+
+        Args:
+            unused_images: The unused images found
+        """
         unused_count = len(unused_images)
 
         if unused_count == 0:
@@ -521,13 +495,30 @@ class DockTUIApp(App, DockerActions, RefreshActions):
         def handle_remove_all_confirmation(confirmed: bool) -> None:
             """Handle the result from the confirmation modal."""
             if confirmed:
-                self.execute_image_command("remove_unused_images")
+                self.execute_image_command("remove_unused_images", unused_images)
 
         self.push_screen(modal, handle_remove_all_confirmation)
 
     def action_prune_unused_volumes(self) -> None:
-        """Remove all unused volumes with confirmation dialog."""
+        """Remove all unused volumes with confirmation dialog.
+
+        Finding them lists every volume and container, so it runs in a
+        background thread instead of stalling the UI while Docker responds.
+        """
+        self._find_unused_volumes()
+
+    @work(thread=True, group="unused")
+    def _find_unused_volumes(self) -> None:
+        """Look up the unused volumes, then ask to confirm removing them."""
         unused_volumes = self.docker.get_unused_volumes()
+        self.call_from_thread(self._confirm_prune_unused_volumes, unused_volumes)
+
+    def _confirm_prune_unused_volumes(self, unused_volumes: List[Dict]) -> None:
+        """Ask to confirm removing the unused volumes.
+
+        Args:
+            unused_volumes: The unused volumes found
+        """
         unused_count = len(unused_volumes)
 
         if unused_count == 0:
@@ -539,7 +530,7 @@ class DockTUIApp(App, DockerActions, RefreshActions):
         def handle_remove_all_confirmation(confirmed: bool) -> None:
             """Handle the result from the confirmation modal."""
             if confirmed:
-                self.execute_volume_command("remove_unused_volumes")
+                self.execute_volume_command("remove_unused_volumes", unused_volumes)
 
         self.push_screen(modal, handle_remove_all_confirmation)
 
@@ -718,8 +709,11 @@ def main():
         app = DockTUIApp()
         app.run()
     except Exception as e:
-        logger.error(f"Error running app: {str(e)}", exc_info=True)
+        logger.error("Error running app: %s", e, exc_info=True)
         raise
+    finally:
+        # Write out buffered log records as soon as the UI has exited
+        stop_logging()
 
 
 __all__ = ["main", "DockTUIApp"]
@@ -1,17 +1,21 @@
 """Configuration management for DockTUI."""
 
+import hashlib
+import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
-
-import yaml
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger("DockTUI.config")
 
+# File in DockTUI's user cache directory holding the last parsed config file
+CONFIG_CACHE_NAME = "config.json"
+
 # Default configuration values
 DEFAULT_CONFIG = {
-    "app": {"refresh_interval": 5.0},
+    "app": {"refresh_interval": 5.0, "stream_stats": False},
     "log": {
         "max_lines": 2000,
         "tail": 200,
@@ -19,15 +23,76 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Dotted config keys mapped to their environment variable and path segments
+_key_paths: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+
+
+def _split_key(key: str) -> Tuple[str, Tuple[str, ...]]:
+    """Get the environment variable name and path segments for a dotted key.
+
+    Args:
+        key: Dotted config key, e.g. 'log.max_lines'
+
+    Returns:
+        Tuple of the overriding environment variable name and the key's segments
+    """
+    key_path = _key_paths.get(key)
+    if key_path is None:
+        key_path = (f"DOCKTUI_{key.upper().replace('.', '_')}", tuple(key.split(".")))
+        _key_paths[key] = key_path
+    return key_path
+
+
+def _index_keys(config: Dict[str, Any], prefix: str = "") -> None:
+    """Precompute the key lookups of every setting in a loaded config.
+
+    Args:
+        config: Config dictionary (or nested section) to index
+        prefix: Dotted path of the section, empty for the top level
+    """
+    for name, value in config.items():
+        key = f"{prefix}{name}"
+        _split_key(key)
+        if isinstance(value, dict):
+            _index_keys(value, f"{key}.")
+
+
+@lru_cache(maxsize=128)
+def _convert_env_value(value: str) -> Any:
+    """Convert an environment variable override to an int, bool or float.
+
+    Args:
+        value: Raw environment variable value
+
+    Returns:
+        The converted value, or the original string if it isn't a number or bool
+    """
+    if value.isdigit():
+        return int(value)
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    if "." in value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
 
 class Config:
-    """Configuration manager for DockTUI."""
+    """Configuration manager for DockTUI.
+
+    Construction does no I/O. The config file is located, created and loaded
+    on first access, so importing the module-level instance is free.
+    """
 
     def __init__(self):
         self._config = None
         self._config_file = None
         self._loaded = False
         self._loading = False
+        # Set when the default config file was just written, so it needn't be parsed
+        self._created_default_config = False
 
     def _get_config_path(self) -> Path:
         """Get the configuration file path."""
@@ -67,6 +132,12 @@ app:
   # Default: 5.0
   refresh_interval: 5.0
 
+  # Keep a stats stream open per running container instead of asking Docker
+  # for a fresh sample on every refresh. At most 8 streams are kept open, and
+  # any further containers are sampled on each refresh
+  # Default: false
+  stream_stats: false
+
 # Log Display Settings
 log:
   # Maximum number of log lines to keep in memory per container/stack
@@ -87,12 +158,14 @@ log:
 
 # Note: You can also override these settings with environment variables:
 # - DOCKTUI_APP_REFRESH_INTERVAL
+# - DOCKTUI_APP_STREAM_STATS
 # - DOCKTUI_LOG_MAX_LINES
 # - DOCKTUI_LOG_TAIL
 # - DOCKTUI_LOG_SINCE
 """
         try:
             config_file.write_text(default_config_content)
+            self._created_default_config = True
             logger.info(f"Created default configuration file at {config_file}")
         except Exception as e:
             logger.warning(f"Failed to create default config file: {e}")
@@ -102,9 +175,17 @@ log:
         try:
             self._config_file = self._get_config_path()
 
+            # The default config file holds DEFAULT_CONFIG, nothing to merge
+            if self._created_default_config:
+                return
+
             if self.config_file.exists():
-                with open(self.config_file, "r") as f:
-                    loaded_config = yaml.safe_load(f) or {}
+                data = self._config_file.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                loaded_config = self._read_config_cache(digest)
+                if loaded_config is None:
+                    loaded_config = self._parse_config_file(data)
+                    self._write_config_cache(digest, loaded_config)
 
                 # Merge with defaults
                 self._merge_config(self._config, loaded_config)
@@ -112,6 +193,87 @@ log:
         except Exception as e:
             logger.warning(f"Failed to load config file, using defaults: {e}")
 
+    def _parse_config_file(self, data: bytes) -> Dict[str, Any]:
+        """Parse the YAML config file.
+
+        PyYAML is imported here rather than at module level, so startups that
+        use the defaults or the JSON cache never load it.
+
+        Args:
+            data: Contents of the config file
+
+        Returns:
+            The parsed config, or an empty dict for an empty file
+        """
+        import yaml
+
+        # Use the libyaml-backed loader when PyYAML was built with it
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        return yaml.load(data, Loader=SafeLoader) or {}
+
+    def _config_cache_path(self) -> Path:
+        """Get the path of the parsed config cache, in the user cache directory."""
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        cache_dir = Path(cache_home) if cache_home else Path.home() / ".cache"
+        return cache_dir / "DockTUI" / CONFIG_CACHE_NAME
+
+    def _read_config_cache(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Read the parsed config from the cache.
+
+        Args:
+            digest: SHA-256 hex digest of the config file's contents
+
+        Returns:
+            The cached config, or None if the cache doesn't hold a config file
+            with these contents
+        """
+        try:
+            with open(self._config_cache_path(), "rb") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("digest") != digest:
+            return None
+        loaded_config = cached.get("config")
+        return loaded_config if isinstance(loaded_config, dict) else None
+
+    def _write_config_cache(self, digest: str, loaded_config: Any):
+        """Write the parsed config to the cache.
+
+        Configs that don't come back from JSON unchanged (non-string keys,
+        dates, ...) aren't cached, so a cache hit always matches a fresh parse.
+        The cache is written to a temporary file and moved into place so a
+        concurrent reader never sees a partial file. Failures are only logged,
+        the config file is simply parsed again next time.
+
+        Args:
+            digest: SHA-256 hex digest of the config file's contents
+            loaded_config: The config parsed from the config file
+        """
+        try:
+            encoded = json.dumps({"digest": digest, "config": loaded_config})
+        except (TypeError, ValueError):
+            return
+        if json.loads(encoded)["config"] != loaded_config:
+            return
+
+        cache_path = self._config_cache_path()
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(encoded)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Failed to write config cache %s: %s", cache_path, e)
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     def _merge_config(self, base: Dict[str, Any], update: Dict[str, Any]):
         """Recursively merge configuration dictionaries."""
         for key, value in update.items():
@@ -127,6 +289,7 @@ log:
             try:
                 self._config = DEFAULT_CONFIG.copy()
                 self._load_config()
+                _index_keys(self._config)
                 self._loaded = True
             finally:
                 self._loading = False
@@ -146,30 +309,16 @@ log:
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation (e.g., 'log.max_lines')."""
         self._ensure_loaded()
+        env_key, path = _split_key(key)
+
         # Check environment variable override first
-        env_key = f"DOCKTUI_{key.upper().replace('.', '_')}"
-        if env_key in os.environ:
-            value = os.environ[env_key]
-            # Try to convert to appropriate type
-            try:
-                if value.isdigit():
-                    return int(value)
-                elif value.lower() in ("true", "false"):
-                    return value.lower() == "true"
-                elif "." in value:
-                    try:
-                        return float(value)
-                    except ValueError:
-                        pass
-            except:
-                pass
-            return value
+        env_value = os.environ.get(env_key)
+        if env_value is not None:
+            return _convert_env_value(env_value)
 
         # Navigate through nested config
-        keys = key.split(".")
         value = self._config
-
-        for k in keys:
+        for k in path:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -0,0 +1,269 @@
+"""Container stats read straight from the host's cgroup filesystem."""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..utils.formatting import format_memory
+
+logger = logging.getLogger("DockTUI.docker_mgmt.cgroup")
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Memory limits at or above this are cgroup v1's "unlimited"
+_V1_UNLIMITED = 1 << 62
+
+
+# Largest cgroup file read; memory.stat is the biggest at a few KiB
+_READ_SIZE = 64 * 1024
+
+# Stat -> (cgroup v1 controller, file) read for each container
+_V1_FILES = {
+    "cpu": ("cpuacct", "cpuacct.usage"),
+    "memory": ("memory", "memory.usage_in_bytes"),
+    "memory_stat": ("memory", "memory.stat"),
+    "limit": ("memory", "memory.limit_in_bytes"),
+    "pids": ("pids", "pids.current"),
+}
+
+# Stat -> file read for each container on cgroup v2
+_V2_FILES = {
+    "cpu": "cpu.stat",
+    "memory": "memory.current",
+    "memory_stat": "memory.stat",
+    "limit": "memory.max",
+    "pids": "pids.current",
+}
+
+
+def _parse_int(data: bytes) -> Optional[int]:
+    """Parse a cgroup file holding a single integer.
+
+    Args:
+        data: Contents of the file
+
+    Returns:
+        The value, or None for "max" (no limit)
+    """
+    value = data.strip()
+    return None if value == b"max" else int(value)
+
+
+def _keyed_value(data: bytes, key: bytes) -> Optional[int]:
+    """Find one value in a cgroup file of "key value" lines, such as memory.stat.
+
+    Only the wanted line is parsed, rather than splitting the whole file.
+
+    Args:
+        data: Contents of the file
+        key: Key of the line to find
+
+    Returns:
+        The value, or None if the file has no such key
+    """
+    prefix = key + b" "
+    if data.startswith(prefix):
+        start = len(prefix)
+    else:
+        start = data.find(b"\n" + prefix)
+        if start < 0:
+            return None
+        start += len(prefix) + 1
+    end = data.find(b"\n", start)
+    return int(data[start:end] if end >= 0 else data[start:])
+
+
+def _host_memory() -> int:
+    """Get the host's total memory, the limit of containers without one.
+
+    Returns:
+        int: Total memory in bytes, or 0 if it can't be determined
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def _close_all(files: Dict[str, int]) -> None:
+    """Close the file descriptors of a container's stat files.
+
+    Args:
+        files: Open file descriptor of each stat
+    """
+    for fd in files.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+class CgroupStatsReader:
+    """Reads container CPU, memory and PIDs usage from the cgroup filesystem.
+
+    Reading a few small files per container skips the Docker daemon entirely.
+    It only works where the host's cgroups are visible under the default Docker
+    layout (cgroup v2 or v1), so not on Docker Desktop or when DockTUI itself
+    runs in a container. read() returns None there and callers fall back to the
+    Docker API.
+
+    Each container's files are opened once and kept open across refreshes.
+    cgroup files regenerate their contents on every read from offset 0, so a
+    refresh costs one pread() per file instead of an open, read and close.
+    """
+
+    def __init__(self, root: Path = CGROUP_ROOT):
+        """Initialize the reader.
+
+        Args:
+            root: Mount point of the cgroup filesystem
+        """
+        self._root = root
+        self._v2 = (root / "cgroup.controllers").exists()
+        self._host_memory = _host_memory()
+        # Container ID -> open file descriptor of each stat file
+        self._files: Dict[str, Dict[str, int]] = {}
+        # Container ID -> (CPU usage in ns, monotonic time in ns) of the last read
+        self._prev_cpu: Dict[str, Tuple[int, int]] = {}
+
+    def _cgroup_dir(self, controller: str, container_id: str) -> Optional[Path]:
+        """Find a container's cgroup directory for a controller.
+
+        Args:
+            controller: cgroup v1 controller directory (ignored on cgroup v2)
+            container_id: Full container ID
+
+        Returns:
+            The directory, or None if the container's cgroup isn't visible
+        """
+        if self._v2:
+            candidates = (
+                self._root / "system.slice" / f"docker-{container_id}.scope",
+                self._root / "docker" / container_id,
+            )
+        else:
+            candidates = (
+                self._root / controller / "docker" / container_id,
+                self._root
+                / controller
+                / "system.slice"
+                / f"docker-{container_id}.scope",
+            )
+        for candidate in candidates:
+            if candidate.is_dir():
+                return candidate
+        return None
+
+    def _open_files(self, container_id: str) -> Optional[Dict[str, int]]:
+        """Open a container's stat files.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            The open file descriptor of each stat, or None if the container's
+            cgroup isn't visible
+        """
+        if self._v2:
+            cgroup = self._cgroup_dir("", container_id)
+            if cgroup is None:
+                return None
+            paths = {stat: cgroup / name for stat, name in _V2_FILES.items()}
+        else:
+            paths = {}
+            for stat, (controller, name) in _V1_FILES.items():
+                cgroup = self._cgroup_dir(controller, container_id)
+                if cgroup is None:
+                    return None
+                paths[stat] = cgroup / name
+
+        files = {}
+        try:
+            for stat, path in paths.items():
+                files[stat] = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            _close_all(files)
+            raise
+        return files
+
+    def read(self, container_id: str) -> Optional[Dict[str, str]]:
+        """Read a running container's stats.
+
+        CPU usage is measured since the previous read of the same container, so
+        the first read reports 0%.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            The stats in the shape of DockerManager.get_all_container_stats(),
+            or None if the container's cgroup can't be read
+        """
+        try:
+            files = self._files.get(container_id)
+            if files is None:
+                files = self._open_files(container_id)
+                if files is None:
+                    return None
+                self._files[container_id] = files
+            data = {stat: os.pread(fd, _READ_SIZE, 0) for stat, fd in files.items()}
+
+            if self._v2:
+                cpu_usec = _keyed_value(data["cpu"], b"usage_usec")
+                if cpu_usec is None:
+                    raise KeyError("usage_usec")
+                cpu_usage = cpu_usec * 1000
+                inactive = _keyed_value(data["memory_stat"], b"inactive_file")
+            else:
+                cpu_usage = _parse_int(data["cpu"])
+                inactive = _keyed_value(data["memory_stat"], b"total_inactive_file")
+            mem_usage = _parse_int(data["memory"])
+            mem_limit = _parse_int(data["limit"])
+            pids = _parse_int(data["pids"])
+        except (OSError, ValueError, KeyError) as e:
+            # The container is gone or its cgroup isn't laid out as expected
+            logger.debug("Can't read cgroup stats for %s: %s", container_id, e)
+            _close_all(self._files.pop(container_id, {}))
+            return None
+
+        # CPU percentage of one core since the last read, like the docker stats CLI
+        now = time.monotonic_ns()
+        previous = self._prev_cpu.get(container_id)
+        self._prev_cpu[container_id] = (cpu_usage, now)
+        cpu_percent = 0.0
+        if previous is not None and now > previous[1]:
+            cpu_percent = (cpu_usage - previous[0]) / (now - previous[1]) * 100.0
+
+        # Page cache isn't counted as used memory (same as docker stats CLI)
+        if inactive and mem_usage > inactive:
+            mem_usage -= inactive
+        if mem_limit is None or mem_limit >= _V1_UNLIMITED:
+            mem_limit = self._host_memory
+        mem_percent = (mem_usage / mem_limit * 100.0) if mem_limit > 0 else 0.0
+
+        return {
+            "cpu": f"{max(cpu_percent, 0.0):.2f}%",
+            "memory": f"{format_memory(mem_usage)} / {format_memory(mem_limit)}",
+            "memory_percent": f"{mem_percent:.2f}",
+            "pids": str(pids or 0),
+        }
+
+    def forget_others(self, container_ids: Iterable[str]) -> None:
+        """Close the files and drop the CPU samples of containers not given.
+
+        Args:
+            container_ids: Full IDs of the containers still being read
+        """
+        keep = set(container_ids)
+        for container_id in list(self._files):
+            if container_id not in keep:
+                _close_all(self._files.pop(container_id))
+        for container_id in list(self._prev_cpu):
+            if container_id not in keep:
+                del self._prev_cpu[container_id]
+
+    def close(self) -> None:
+        """Close every open stat file."""
+        self.forget_others(())
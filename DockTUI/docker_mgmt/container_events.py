@@ -0,0 +1,97 @@
+"""Docker container events, used to tell which containers changed."""
+
+import logging
+import threading
+from typing import Optional, Set
+
+from .json_lines import decode_json_lines
+
+logger = logging.getLogger("DockTUI.docker_mgmt.events")
+
+
+def _event_container_id(event) -> Optional[str]:
+    """Get the ID of the container an event is about.
+
+    Args:
+        event: A decoded Docker event
+
+    Returns:
+        The full container ID, or None if the event doesn't name one
+    """
+    if not isinstance(event, dict):
+        return None
+    return event.get("id") or event.get("Actor", {}).get("ID")
+
+
+class ContainerEventWatcher:
+    """Follows Docker's container events in a background thread.
+
+    Every container event (start, die, health_status, rename, destroy, ...)
+    marks the container as changed until take_changed() collects it, so a
+    refresh only needs to inspect containers that something happened to.
+    """
+
+    def __init__(self, client):
+        """Subscribe to container events.
+
+        The subscription is made before returning, so no event that happens
+        afterwards is missed.
+
+        Args:
+            client: Docker client to read events from
+        """
+        self._changed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._ended = threading.Event()
+        self._events = None
+        try:
+            self._events = client.events(decode=False, filters={"type": "container"})
+        except Exception as e:
+            logger.debug("Can't follow container events: %s", e)
+            self._ended.set()
+            return
+        self._thread = threading.Thread(
+            target=self._follow, name="container-events", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def active(self) -> bool:
+        """Whether events are still being followed."""
+        return not self._ended.is_set()
+
+    def take_changed(self) -> Set[str]:
+        """Collect the containers that changed since the last call.
+
+        Returns:
+            Set[str]: Full IDs of the containers that had events
+        """
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def stop(self) -> None:
+        """Stop following events and close the connection to Docker."""
+        self._ended.set()
+        close = getattr(self._events, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Error closing container events: %s", e)
+
+    def _follow(self) -> None:
+        """Record the container of each event until the stream ends."""
+        try:
+            for event in decode_json_lines(self._events):
+                if self._ended.is_set():
+                    break
+                container_id = _event_container_id(event)
+                if container_id:
+                    with self._lock:
+                        self._changed.add(container_id)
+        except Exception as e:
+            if not self._ended.is_set():
+                logger.debug("Stopped following container events: %s", e)
+        finally:
+            self._ended.set()
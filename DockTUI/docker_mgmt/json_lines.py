@@ -0,0 +1,41 @@
+"""Decoding of the newline-delimited JSON streams sent by the Docker API."""
+
+import json
+from typing import Any, Iterable, Iterator, Union
+
+# Optional faster JSON decoding of the streamed objects
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def decode_json_lines(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """Decode a raw Docker stream of one JSON object per line.
+
+    docker-py's decode=True decodes every chunk to text and scans it with the
+    standard library decoder. Stats and events arrive one object per line, so
+    the raw bytes are split on newlines instead and each line is parsed as a
+    whole, with orjson when it's installed.
+
+    Args:
+        chunks: Raw chunks as read from the stream (decode=False)
+
+    Yields:
+        The decoded objects, in the order they were sent
+    """
+    buffer = b""
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _loads(line)
+    if buffer.strip():
+        yield _loads(buffer)
@@ -1,27 +1,133 @@
 import logging
+import shutil
 import subprocess
 import threading
 import time
 from collections import defaultdict
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import docker
 
 from ..utils.formatting import format_bytes
 from ..utils.time_utils import format_uptime
+from .cgroup_stats import CgroupStatsReader
+from .container_events import ContainerEventWatcher
+from .stats_stream import ContainerStatsStream
+from .types import ContainerInfo, NetworkContainerInfo, StackInfo
 
 logger = logging.getLogger("DockTUI.docker_mgmt")
 
+# Seconds a compose file accessibility check is reused before hitting the disk again
+COMPOSE_FILE_CHECK_TTL = 30.0
+
+# Seconds stacks are reused when the container listing hasn't changed
+STACKS_CACHE_TTL = 0.5
+
+# Stats shown for containers without a stats snapshot. Shared, so never mutate it
+EMPTY_STATS = {"cpu": "0%", "memory": "0B / 0B", "memory_percent": "0", "pids": "0"}
+
+# Seconds a refresh waits for new stats streams' first frames, across all containers
+STATS_COLLECTION_TIMEOUT = 5.0
+
+# Most stats streams kept open at once. docker-py pools at most 10 connections
+# to the daemon, so this leaves room for the app's other requests; containers
+# beyond it take a one-shot sample on each refresh instead.
+MAX_FOLLOWED_STATS_STREAMS = 8
+
+
+def _new_stack(name: str, config_file: str, can_recreate: bool) -> StackInfo:
+    """Create the entry for a stack, before any of its containers are counted.
+
+    Args:
+        name: Stack (compose project) name
+        config_file: The stack's compose config file(s), or "N/A"
+        can_recreate: Whether the compose file is accessible
+
+    Returns:
+        StackInfo: Stack details in the shape returned by get_compose_stacks()
+    """
+    return StackInfo(
+        name=name,
+        config_file=config_file,
+        can_recreate=can_recreate,
+        has_compose_file=config_file != "N/A",
+    )
+
+
+def _copy_stacks(stacks: Dict[str, StackInfo]) -> Dict[str, StackInfo]:
+    """Copy stacks, so the copies can be changed without touching the originals.
+
+    Args:
+        stacks: Stacks as returned by get_compose_stacks()
+
+    Returns:
+        Dict[str, StackInfo]: New stack records with their own container lists
+    """
+    return {
+        name: replace(stack, containers=list(stack.containers))
+        for name, stack in stacks.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _docker_executable() -> str:
+    """Resolve the docker CLI once, so compose commands skip the PATH search.
+
+    Returns:
+        str: Absolute path of the docker CLI, or "docker" if it isn't on PATH
+    """
+    return shutil.which("docker") or "docker"
+
+
+@lru_cache(maxsize=128)
+def _split_config_files(config_files: str) -> Tuple[str, ...]:
+    """Split a compose config_files label into its paths, once per label.
+
+    Args:
+        config_files: Path(s) to the compose config file(s), comma-separated if
+            multiple, or "N/A"
+
+    Returns:
+        Tuple[str, ...]: The paths, empty if there are none
+    """
+    if not config_files or config_files == "N/A":
+        return ()
+    return tuple(f.strip() for f in config_files.split(","))
+
+
+def _compose_command(stack_name: str, config_files: str) -> List[str]:
+    """Start a docker compose command line for a stack.
+
+    Args:
+        stack_name: Stack (compose project) name
+        config_files: The stack's compose config_files label
+
+    Returns:
+        List[str]: The command up to the compose subcommand, to be extended
+    """
+    cmd = [_docker_executable(), "compose", "-p", stack_name]
+    for config_file in _split_config_files(config_files):
+        cmd.extend(("-f", config_file))
+    return cmd
+
 
 class DockerManager:
     """Manages Docker interactions."""
 
-    def __init__(self):
-        """Initialize the Docker client connection."""
+    def __init__(self, follow_stats: bool = False):
+        """Initialize the Docker client connection.
+
+        Args:
+            follow_stats: Whether to keep stats streams open between refreshes,
+                rather than taking a one-shot sample on each refresh
+        """
         try:
             self.client = docker.from_env()
-            self.last_error = None
+            # Error from the last Docker call, checked by the UI after each refresh
+            self.last_error: Optional[str] = None
             # Track containers in transition (starting/stopping)
             self._transition_states = (
                 {}
@@ -31,10 +137,44 @@ class DockerManager:
             self._volume_usage = defaultdict(
                 set
             )  # volume_name -> set of container names
+            # config_files label -> (accessible, monotonic time of the check)
+            self._compose_file_checks: Dict[str, Tuple[bool, float]] = {}
+            # Container ID -> (listing summary key, status text, inspected object)
+            self._inspected_containers: Dict[str, Tuple[Tuple, Any, Any]] = {}
+            # Tells which containers changed between listings, see _list_containers
+            self._container_events: Optional[ContainerEventWatcher] = None
+            # Listings from several threads must not split up the changed containers
+            self._list_containers_lock = threading.Lock()
+            # Stats sources, see get_all_container_stats
+            self._cgroup_stats = CgroupStatsReader()
+            # Container short ID -> open stats stream
+            self._stats_streams: Dict[str, ContainerStatsStream] = {}
+            # Keep stats streams open between refreshes, rather than polling
+            self._follow_stats = follow_stats
+            self._stats_streams_lock = threading.Lock()
+            # Container ID -> (container object, formatted ports), see get_containers
+            self._ports_cache: Dict[str, Tuple[Any, str]] = {}
+            # (monotonic time, stacks, container listing) of the last stacks built.
+            # Reset whenever a container is inspected again, see _list_containers
+            self._stacks_cache: Tuple[float, Optional[Dict], Dict] = (0.0, None, {})
         except Exception as e:
-            logger.error(f"Failed to initialize Docker client: {str(e)}", exc_info=True)
+            logger.error("Failed to initialize Docker client: %s", e, exc_info=True)
             raise
 
+    def close(self) -> None:
+        """Stop collecting stats, then close the Docker client and its connections."""
+        with self._stats_streams_lock:
+            for stream in self._stats_streams.values():
+                stream.stop()
+            self._stats_streams = {}
+            self._cgroup_stats.close()
+        if self._container_events is not None:
+            self._container_events.stop()
+        try:
+            self.client.close()
+        except Exception as e:
+            logger.error("Error closing Docker client: %s", e, exc_info=True)
+
     def _check_compose_file_accessible(self, config_file_path: str) -> bool:
         """Check if a Docker Compose config file is accessible.
 
@@ -48,29 +188,107 @@ class DockerManager:
             return False
 
         try:
-            # Config files can be comma-separated
-            config_files = [f.strip() for f in config_file_path.split(",")]
-
             # Check if at least one file is accessible
-            for config_file in config_files:
+            for config_file in _split_config_files(config_file_path):
                 if Path(config_file).is_file():
-                    logger.debug(f"Compose file accessible: {config_file}")
+                    logger.debug("Compose file accessible: %s", config_file)
                     return True
 
-            logger.debug(f"No accessible compose files found in: {config_file_path}")
+            logger.debug("No accessible compose files found in: %s", config_file_path)
             return False
 
         except Exception as e:
             logger.error(
-                f"Error checking compose file accessibility: {str(e)}", exc_info=True
+                "Error checking compose file accessibility: %s", e, exc_info=True
             )
             return False
 
-    def get_compose_stacks(self) -> Dict[str, Dict]:
+    def _is_compose_file_accessible(self, config_file_path: str) -> bool:
+        """Check a compose file's accessibility, reusing recent results.
+
+        Every container in a stack shares the same config_files label, and the
+        label rarely changes between refreshes, so the filesystem is only checked
+        again once COMPOSE_FILE_CHECK_TTL has passed.
+
+        Args:
+            config_file_path: Path to the compose config file(s) (comma-separated if multiple)
+
+        Returns:
+            bool: True if at least one compose file is accessible, False otherwise
+        """
+        now = time.monotonic()
+        cached = self._compose_file_checks.get(config_file_path)
+        if cached is not None and now - cached[1] < COMPOSE_FILE_CHECK_TTL:
+            return cached[0]
+
+        accessible = self._check_compose_file_accessible(config_file_path)
+        self._compose_file_checks[config_file_path] = (accessible, now)
+        return accessible
+
+    def _list_containers(self) -> List:
+        """List all containers, only inspecting the ones that changed.
+
+        containers.list() inspects every container it returns, one API call each.
+        Instead the containers are listed sparse in a single call, and a container
+        is only inspected again when its state or names differ from the previous
+        listing, or Docker reported an event for it (a restart, health change,
+        ...) since then.
+
+        While container events can't be followed, such as for the first listing,
+        a container is inspected again whenever its status text changed instead.
+        That text includes the time since the last start or exit, so restarts
+        are still picked up, at the cost of more inspections.
+
+        Returns:
+            List: Fully inspected container objects
+        """
+        with self._list_containers_lock:
+            watcher = self._container_events
+            if watcher is not None and watcher.active:
+                changed = watcher.take_changed()
+            else:
+                # Events before the subscription are unknown, so compare status text
+                self._container_events = ContainerEventWatcher(self.client)
+                changed = None
+
+            previous = self._inspected_containers
+            inspected = {}
+            containers = []
+            reloaded = False
+            for container in self.client.containers.list(all=True, sparse=True):
+                attrs = container.attrs
+                key = (attrs.get("State"), str(attrs.get("Names")))
+                status = attrs.get("Status")
+                cached = previous.get(container.id)
+                if cached is None or cached[0] != key:
+                    current = False
+                elif changed is None:
+                    current = cached[1] == status
+                else:
+                    current = container.id not in changed
+                if current:
+                    container = cached[2]
+                else:
+                    try:
+                        container.reload()
+                    except docker.errors.NotFound:
+                        # Removed since it was listed
+                        continue
+                    reloaded = True
+                inspected[container.id] = (key, status, container)
+                containers.append(container)
+            self._inspected_containers = inspected
+            if reloaded:
+                # Cached stacks hold the replaced container objects, whose
+                # status, health and ports are now stale
+                self._stacks_cache = (0.0, None, {})
+        return containers
+
+    def get_compose_stacks(self) -> Dict[str, StackInfo]:
         """Retrieve all Docker Compose stacks and their containers.
 
         Returns:
-            Dict[str, Dict]: A dictionary mapping stack names to their details including:
+            Dict[str, StackInfo]: A dictionary mapping stack names to their details including:
                 - name: Stack name
                 - config_file: Path to compose config file
                 - containers: List of container objects
@@ -80,63 +298,75 @@ class DockerManager:
                 - can_recreate: Whether the stack can be recreated (compose file accessible)
                 - has_compose_file: Whether a compose file path is defined
         """
-        stacks = defaultdict(
-            lambda: {
-                "name": "",
-                "config_file": "",
-                "containers": [],
-                "running": 0,
-                "exited": 0,
-                "total": 0,
-                "can_recreate": False,
-                "has_compose_file": False,
-            }
-        )
-
-        # Track volume usage across all containers
-        self._volume_usage = defaultdict(set)  # volume_name -> set of container names
+        stacks: Dict[str, StackInfo] = {}
 
         try:
-            containers = self.client.containers.list(all=True)
+            containers = self._list_containers()
+
+            # Reuse the last result while it's fresh and no container changed
+            listing = {
+                container_id: entry[0]
+                for container_id, entry in self._inspected_containers.items()
+            }
+            cached_at, cached_stacks, cached_listing = self._stacks_cache
+            if (
+                cached_stacks is not None
+                and listing == cached_listing
+                and time.monotonic() - cached_at < STACKS_CACHE_TTL
+            ):
+                self.last_error = None
+                return _copy_stacks(cached_stacks)
+
+            # Track volume usage across all containers (volume name -> container names)
+            self._volume_usage = defaultdict(set)
 
             # Filter out the DockTUI container itself to prevent users from stopping their own session
             containers = [c for c in containers if c.name != "docktui-app"]
 
             for container in containers:
                 try:
-                    project = container.labels.get(
-                        "com.docker.compose.project", "ungrouped"
-                    )
-                    config_file = container.labels.get(
-                        "com.docker.compose.project.config_files", "N/A"
-                    )
-
-                    if project not in stacks:
-                        stacks[project]["name"] = project
-                        stacks[project]["config_file"] = config_file
-                        stacks[project]["has_compose_file"] = config_file != "N/A"
-                        stacks[project]["can_recreate"] = (
-                            self._check_compose_file_accessible(config_file)
+                    labels = container.labels
+                    project = labels.get("com.docker.compose.project", "ungrouped")
+                    stack = stacks.get(project)
+
+                    # First container of this stack, create it with its details
+                    if stack is None:
+                        config_file = labels.get(
+                            "com.docker.compose.project.config_files", "N/A"
+                        )
+                        stack = stacks[project] = _new_stack(
+                            project,
+                            config_file,
+                            self._is_compose_file_accessible(config_file),
                         )
 
-                    stacks[project]["containers"].append(container)
-                    stacks[project]["total"] += 1
-                    if container.status == "running":
-                        stacks[project]["running"] += 1
-                    elif "exited" in container.status:
-                        stacks[project]["exited"] += 1
-
-                    # Track volume usage for this container
-                    if hasattr(container, "attrs") and "Mounts" in container.attrs:
-                        for mount in container.attrs["Mounts"]:
+                    stack.containers.append(container)
+                    stack.total += 1
+                    # Inspected containers report Docker's bare state name
+                    # (created, running, exited, ...), so compare it exactly
+                    status = container.status
+                    if status == "running":
+                        stack.running += 1
+                    elif status == "exited":
+                        stack.exited += 1
+
+                    # Track volume usage for this container, reading the inspect
+                    # data and name once rather than per mount
+                    mounts = getattr(container, "attrs", {}).get("Mounts")
+                    if mounts:
+                        name = container.name
+                        for mount in mounts:
                             if mount.get("Type") == "volume" and "Name" in mount:
-                                volume_name = mount["Name"]
-                                self._volume_usage[volume_name].add(container.name)
+                                self._volume_usage[mount["Name"]].add(name)
 
                 except Exception as container_error:
+                    # Per-container errors come in storms (e.g. while the daemon
+                    # restarts), so tracebacks are only logged with debug on
                     logger.error(
-                        f"Error processing container {container.name}: {str(container_error)}",
-                        exc_info=True,
+                        "Error processing container %s: %s",
+                        container.name,
+                        container_error,
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
                     )
                     continue
 
@@ -146,13 +376,23 @@ class DockerManager:
             self.last_error = error_msg
             return {}
 
+        # Callers get their own records, so they can't change the cached ones
+        self._stacks_cache = (time.monotonic(), _copy_stacks(stacks), listing)
+
         # Clear any previous error if the operation succeeded
         self.last_error = None
-        return dict(stacks)
+        return stacks
 
-    def get_all_container_stats(self) -> Dict[str, Dict[str, str]]:
+    def get_all_container_stats(
+        self, containers: Optional[List] = None
+    ) -> Dict[str, Dict[str, str]]:
         """Retrieve stats for all containers in a single operation.
 
+        Args:
+            containers: Already-listed container objects to collect stats for.
+                Only the running ones are used. When omitted, running containers
+                are listed from Docker.
+
         Returns:
             Dict[str, Dict[str, str]]: A dictionary mapping container IDs to their stats including:
                 - cpu: CPU usage percentage
@@ -160,136 +400,108 @@ class DockerManager:
                 - memory_percent: Memory usage percentage
                 - pids: Number of processes
 
-        PERFORMANCE NOTE: This method uses the Docker SDK with concurrent stats collection
-        to efficiently retrieve stats for all containers. We use threading to parallelize
-        the stats collection while maintaining good performance with many containers.
+        PERFORMANCE NOTE: Where the host's cgroups are visible, stats are read
+        straight from the cgroup filesystem without asking the daemon at all (see
+        CgroupStatsReader). Otherwise, since a one-shot stats request makes the
+        daemon sample the container twice, taking a second or more, each running
+        container's stats stream is kept open between refreshes (see
+        ContainerStatsStream) and a refresh reads the latest frame. Only
+        containers that just started running wait for their first frame. With
+        the app.stream_stats setting off (the default), and for containers
+        beyond MAX_FOLLOWED_STATS_STREAMS, every refresh takes a one-shot sample.
         """
-        stats_dict = {}
         try:
             logger.debug("Starting Docker SDK stats collection")
-            collection_start = time.time()
-
-            # Get all running containers
-            containers = self.client.containers.list(filters={"status": "running"})
-
-            # Filter out the DockTUI container
-            containers = [c for c in containers if c.name != "docktui-app"]
-            logger.debug(f"Found {len(containers)} running containers")
-
-            if not containers:
-                return {}
-
-            # Use threading to collect stats concurrently
-            stats_lock = threading.Lock()
-            threads = []
-
-            def collect_container_stats(container):
-                """Collect stats for a single container."""
-                try:
-                    # Get stats without streaming (single snapshot)
-                    stats = container.stats(stream=False)
-
-                    # Calculate CPU percentage
-                    cpu_delta = (
-                        stats["cpu_stats"]["cpu_usage"]["total_usage"]
-                        - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-                    )
-                    system_delta = (
-                        stats["cpu_stats"]["system_cpu_usage"]
-                        - stats["precpu_stats"]["system_cpu_usage"]
-                    )
-                    cpu_count = len(
-                        stats["cpu_stats"]["cpu_usage"].get("percpu_usage", [None])
-                    )
-
-                    if system_delta > 0:
-                        cpu_percent = (cpu_delta / system_delta) * cpu_count * 100.0
-                    else:
-                        cpu_percent = 0.0
-
-                    # Calculate memory usage
-                    mem_stats = stats["memory_stats"]
-                    mem_usage = mem_stats.get("usage", 0)
-                    mem_limit = mem_stats.get("limit", 0)
-
-                    # Account for cache in memory usage (same as docker stats CLI)
-                    cache = mem_stats.get("stats", {}).get("cache", 0)
-                    mem_usage = mem_usage - cache if mem_usage > cache else mem_usage
-
-                    mem_percent = (
-                        (mem_usage / mem_limit * 100.0) if mem_limit > 0 else 0.0
-                    )
-
-                    # Format memory strings
-                    def format_bytes(bytes_val):
-                        """Format bytes to human readable format."""
-                        for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
-                            if bytes_val < 1024.0:
-                                return f"{bytes_val:.1f}{unit}"
-                            bytes_val /= 1024.0
-                        return f"{bytes_val:.1f}PiB"
-
-                    mem_usage_str = format_bytes(mem_usage)
-                    mem_limit_str = format_bytes(mem_limit)
-
-                    # Get PIDs count
-                    pids_stats = stats.get("pids_stats", {})
-                    pids_current = pids_stats.get("current", 0)
-
-                    # Store the stats
-                    with stats_lock:
-                        stats_dict[container.short_id] = {
-                            "cpu": f"{cpu_percent:.2f}%",
-                            "memory": f"{mem_usage_str} / {mem_limit_str}",
-                            "memory_percent": f"{mem_percent:.2f}",
-                            "pids": str(pids_current),
-                        }
-
-                except Exception as e:
-                    logger.error(
-                        f"Error collecting stats for container {container.short_id}: {str(e)}",
-                        exc_info=True,
-                    )
-                    # Provide default values on error
-                    with stats_lock:
-                        stats_dict[container.short_id] = {
-                            "cpu": "0%",
-                            "memory": "0B / 0B",
-                            "memory_percent": "0",
-                            "pids": "0",
-                        }
-
-            # Create and start threads for each container
-            for container in containers:
-                thread = threading.Thread(
-                    target=collect_container_stats, args=(container,)
+            # Skip the timing probes entirely unless debug logging is on
+            timed = logger.isEnabledFor(logging.DEBUG)
+            if timed:
+                collection_start = time.perf_counter_ns()
+
+            if containers is None:
+                # Reuse the cached inspections rather than inspecting every
+                # running container again, and filter out the DockTUI container
+                containers = [
+                    c for c in self._list_containers() if c.name != "docktui-app"
+                ]
+            containers = [c for c in containers if c.status == "running"]
+            logger.debug("Found %s running containers", len(containers))
+
+            with self._stats_streams_lock:
+                # Read stats straight from the cgroup filesystem where possible,
+                # and follow the stats stream of every other running container,
+                # in a single pass
+                collected = {}
+                cgroup_ids = []
+                streams = {}
+                # Streams kept open count towards MAX_FOLLOWED_STATS_STREAMS
+                followed = sum(
+                    1
+                    for c in containers
+                    if (s := self._stats_streams.get(c.short_id)) is not None
+                    and s.active
+                    and s.follow
+                )
+                for container in containers:
+                    short_id = container.short_id
+                    stats = self._cgroup_stats.read(container.id)
+                    if stats is not None:
+                        collected[short_id] = stats
+                        cgroup_ids.append(container.id)
+                        continue
+                    # Start streams for newly running containers
+                    stream = self._stats_streams.get(short_id)
+                    if stream is None or not stream.active:
+                        follow = (
+                            self._follow_stats and followed < MAX_FOLLOWED_STATS_STREAMS
+                        )
+                        if follow:
+                            followed += 1
+                        stream = ContainerStatsStream(container, follow=follow)
+                    streams[short_id] = stream
+                self._cgroup_stats.forget_others(cgroup_ids)
+
+                # Stop the streams no longer needed
+                for short_id, stream in self._stats_streams.items():
+                    if short_id not in streams:
+                        stream.stop()
+                self._stats_streams = streams
+
+            # New streams get until a single deadline to deliver their first frame
+            deadline = time.monotonic() + STATS_COLLECTION_TIMEOUT
+            for stream in streams.values():
+                stream.ready.wait(timeout=max(0.0, deadline - time.monotonic()))
+
+            # Streams that failed before parsing a frame show zeroed stats
+            for short_id, stream in streams.items():
+                if stream.ready.is_set():
+                    collected[short_id] = stream.latest or EMPTY_STATS
+
+            if timed:
+                logger.debug(
+                    "Collected stats for %s containers in %.1fms",
+                    len(collected),
+                    (time.perf_counter_ns() - collection_start) / 1e6,
                 )
-                thread.daemon = True
-                threads.append(thread)
-                thread.start()
-
-            # Wait for all threads to complete with a timeout
-            timeout = 5.0  # 5 second timeout for stats collection
-            for thread in threads:
-                thread.join(timeout=timeout)
-
-            collection_end = time.time()
-            logger.debug(
-                f"Collected stats for {len(stats_dict)} containers in {collection_end - collection_start:.3f}s"
-            )
 
         except Exception as e:
             error_msg = f"Error getting container stats: {str(e)}"
             logger.error(error_msg, exc_info=True)
             return {}
 
-        return stats_dict
+        return collected
 
-    def get_containers(self) -> List[Dict]:
+    def get_containers(
+        self, stacks: Optional[Dict[str, StackInfo]] = None
+    ) -> List[ContainerInfo]:
         """Retrieve all containers with their current stats.
 
+        Args:
+            stacks: Result of a previous get_compose_stacks() call to reuse. When
+                omitted, the stacks are fetched from Docker again.
+
         Returns:
-            List[Dict]: A list of container information dictionaries including:
+            List[ContainerInfo]: A list of container records, grouped by stack in
+            the order of the stacks mapping, including:
                 - id: Container short ID
                 - name: Container name
                 - status: Current status
@@ -301,81 +513,88 @@ class DockerManager:
         """
         containers = []
         try:
-            # Get all container stats in a single call first (this is the most time-consuming operation)
-            all_stats = self.get_all_container_stats()
+            # Get the stacks information, unless the caller already has it
+            if stacks is None:
+                stacks = self.get_compose_stacks()
 
-            # Then get the stacks information
-            stacks = self.get_compose_stacks()
+            # Collect stats for the containers already listed with the stacks rather
+            # than listing (and inspecting) every running container again
+            all_stats = self.get_all_container_stats(
+                [
+                    container
+                    for stack_info in stacks.values()
+                    for container in stack_info["containers"]
+                ]
+            )
+
+            # Container ID -> (container object, formatted ports). An inspected
+            # object is reused until Docker reports a change to its container
+            # (see _list_containers), so the same object has the same ports.
+            previous_ports = self._ports_cache
+            ports_cache: Dict[str, Tuple[Any, str]] = {}
+
+            # Snapshot the transition states once rather than locking per container
+            with self._transition_lock:
+                transition_states = dict(self._transition_states)
 
             # Process the containers with their stats
             for stack_name, stack_info in stacks.items():
                 for container in stack_info["containers"]:
                     try:
-                        stats = all_stats.get(
-                            container.short_id,
-                            {
-                                "cpu": "0%",
-                                "memory": "0B / 0B",
-                                "memory_percent": "0",
-                                "pids": "0",
-                            },
-                        )
+                        short_id = container.short_id
+                        stats = all_stats.get(short_id, EMPTY_STATS)
 
                         # Check if container is in transition
-                        with self._transition_lock:
-                            status = self._transition_states.get(
-                                container.short_id, container.status
-                            )
+                        status = transition_states.get(short_id)
+                        if status is None:
+                            status = container.status
 
+                        # Read the inspect data once for the start time and image
+                        attrs = getattr(container, "attrs", None) or {}
+                        state = attrs.get("State", {})
                         start_time = None
-                        try:
-                            if hasattr(container, "attrs") and container.attrs:
-                                state = container.attrs.get("State", {})
-                                if state.get("Running", False):
-                                    start_time = state.get("StartedAt")
-                        except Exception as e:
-                            logger.debug(
-                                f"Could not get start time for container {container.name}: {e}"
-                            )
+                        if isinstance(state, dict) and state.get("Running", False):
+                            start_time = state.get("StartedAt")
 
-                        # Get image information
-                        raw_image_id = (
-                            container.attrs.get("Image", "")
-                            if hasattr(container, "attrs") and container.attrs
-                            else ""
-                        )
                         # Remove sha256: prefix if present and get first 12 characters
+                        raw_image_id = attrs.get("Image", "")
                         image_id = (
                             raw_image_id.replace("sha256:", "")[:12]
                             if raw_image_id
                             else ""
                         )
-                        image_name = (
-                            container.attrs.get("Config", {}).get("Image", "")
-                            if hasattr(container, "attrs") and container.attrs
-                            else ""
-                        )
+                        image_name = attrs.get("Config", {}).get("Image", "")
 
-                        container_info = {
-                            "id": container.short_id,
-                            "name": container.name,
-                            "status": status,
-                            "uptime": format_uptime(start_time),
-                            "cpu": stats["cpu"],
-                            "memory": stats["memory"],
-                            "pids": stats["pids"],
-                            "stack": stack_name,
-                            "ports": self._format_ports(container),
-                            "image_id": image_id,
-                            "image_name": image_name,
-                        }
+                        cached_ports = previous_ports.get(container.id)
+                        if cached_ports is not None and cached_ports[0] is container:
+                            ports = cached_ports[1]
+                        else:
+                            ports = self._format_ports(container)
+                        ports_cache[container.id] = (container, ports)
+
+                        container_info = ContainerInfo(
+                            id=short_id,
+                            name=container.name,
+                            status=status,
+                            uptime=format_uptime(start_time),
+                            cpu=stats["cpu"],
+                            memory=stats["memory"],
+                            pids=stats["pids"],
+                            stack=stack_name,
+                            ports=ports,
+                            image_id=image_id,
+                            image_name=image_name,
+                        )
                         containers.append(container_info)
                     except Exception as container_error:
                         logger.error(
-                            f"Error processing container {container.name}: {str(container_error)}",
-                            exc_info=True,
+                            "Error processing container %s: %s",
+                            container.name,
+                            container_error,
+                            exc_info=logger.isEnabledFor(logging.DEBUG),
                         )
                         continue
+            self._ports_cache = ports_cache
 
         except Exception as e:
             error_msg = f"Error getting container stats: {str(e)}"
@@ -397,21 +616,72 @@ class DockerManager:
             str: Formatted string of port mappings (e.g. "8080->80, 443->443")
         """
         try:
-            ports = set()  # Use a set to eliminate duplicates
-            for port in container.ports.items():
-                if port[1]:
+            # An ordered dict drops the duplicate IPv4/IPv6 bindings of a port while
+            # keeping Docker's (already stable) port order, so no sort is needed
+            ports = {}
+            for port, bindings in container.ports.items():
+                if bindings:
                     # Extract the container port without the protocol suffix
-                    container_port = port[0].split("/")[0]
-                    for binding in port[1]:
-                        ports.add(f"{binding['HostPort']}->{container_port}")
-            return ", ".join(sorted(ports)) if ports else ""
+                    container_port = port.split("/")[0]
+                    for binding in bindings:
+                        ports[f"{binding['HostPort']}->{container_port}"] = None
+            return ", ".join(ports)
         except Exception as e:
             logger.error(
-                f"Error formatting ports for container {container.short_id}: {str(e)}",
-                exc_info=True,
+                "Error formatting ports for container %s: %s",
+                container.short_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
             return ""
 
+    def _run_in_background(
+        self,
+        cmd: List[str],
+        description: str,
+        on_exit: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Run a command without blocking, reaping it once it exits.
+
+        A daemon thread drains the command's output and waits for it, so verbose
+        output can't fill the pipes and stall the command, and the finished
+        process doesn't linger as a zombie. Failures are logged and recorded in
+        last_error.
+
+        Python's own descriptors aren't inheritable, so close_fds is turned off.
+        Together with the absolute docker path that lets subprocess start the
+        command with posix_spawn() (vfork and exec) instead of fork and exec.
+
+        Args:
+            cmd: Command line to run
+            description: What the command does, used in log and error messages
+            on_exit: Called once the command has exited, whether or not it succeeded
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False,
+        )
+
+        def monitor():
+            try:
+                stdout, stderr = process.communicate()
+                if process.returncode != 0:
+                    error_msg = f"{description} failed: {stderr}"
+                    logger.error(error_msg)
+                    self.last_error = error_msg
+                else:
+                    logger.info("%s completed successfully: %s", description, stdout)
+            finally:
+                if on_exit is not None:
+                    on_exit()
+
+        thread = threading.Thread(target=monitor)
+        thread.daemon = True
+        thread.start()
+
     def execute_container_command(
         self, container_id: str, command: str
     ) -> Tuple[bool, str]:
@@ -452,35 +722,20 @@ class DockerManager:
                     self.last_error = error_msg
                     return False, ""
 
-                cmd = ["docker", "compose", "-p", stack_name]
-
-                # Add config file(s) if available
-                if config_files and config_files != "N/A":
-                    # Config files are comma-separated
-                    for config_file in config_files.split(","):
-                        cmd.extend(["-f", config_file.strip()])
-
+                cmd = _compose_command(stack_name, config_files)
                 cmd.extend(["up", "-d", "--force-recreate", service_name])
-                logger.info(f"Executing recreate command: {' '.join(cmd)}")
+                logger.info("Executing recreate command: %s", " ".join(cmd))
 
                 # Set transition state for recreate
                 with self._transition_lock:
                     self._transition_states[container_short_id] = "recreating..."
 
-                # Use Popen to run the command in the background
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-
-                # Start a thread to monitor completion and clear transition state
-                def monitor_recreate():
-                    process.wait()  # Wait for process to complete
+                # Clear the transition state once the recreate finishes
+                def clear_transition():
                     with self._transition_lock:
                         self._transition_states.pop(container_short_id, None)
 
-                thread = threading.Thread(target=monitor_recreate)
-                thread.daemon = True
-                thread.start()
+                self._run_in_background(cmd, "Container recreate", clear_transition)
 
                 # Clear any previous error if the operation succeeded
                 self.last_error = None
@@ -488,7 +743,9 @@ class DockerManager:
                 return True, container_short_id
             else:
                 logger.info(
-                    f"Executing container command: {command} on container {container_id}"
+                    "Executing container command: %s on container %s",
+                    command,
+                    container_id,
                 )
 
                 # Set transition state
@@ -521,7 +778,8 @@ class DockerManager:
                             self.last_error = error_msg
                     except Exception as e:
                         logger.error(
-                            f"Error in container command thread: {str(e)}",
+                            "Error in container command thread: %s",
+                            e,
                             exc_info=True,
                         )
                     finally:
@@ -543,9 +801,19 @@ class DockerManager:
             self.last_error = error_msg
             return False, ""
 
-    def get_networks(self) -> Dict[str, Dict]:
+    def get_networks(self, containers: Optional[List] = None) -> Dict[str, Dict]:
         """Retrieve all Docker networks with their connected containers and stacks.
 
+        Network membership is read from the inspect data of the listed
+        containers, so the networks themselves are only listed, not reloaded
+        one by one to find their containers.
+
+        Args:
+            containers: Already-listed container objects to read network
+                membership and stack labels from. Containers of the last listing
+                that aren't given are read as well. When omitted, all containers
+                are listed once up front.
+
         Returns:
             Dict[str, Dict]: A dictionary mapping network names to their details including:
                 - id: Network short ID
@@ -553,19 +821,44 @@ class DockerManager:
                 - driver: Network driver (bridge, overlay, host, etc.)
                 - scope: Network scope (local, swarm)
                 - subnet: Network subnet/IP range
-                - connected_containers: List of connected container info
+                - connected_containers: List of NetworkContainerInfo records
                 - connected_stacks: Set of stack names using this network
                 - total_containers: Total number of connected containers
         """
         networks = {}
+        # Per-network and per-container debug lines are skipped unless enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            docker_networks = self.client.networks.list()
+            if containers is None:
+                containers = self._list_containers()
+            else:
+                # The given containers can leave some out, such as DockTUI's own
+                # container, which isn't part of any stack. The rest of the last
+                # listing still counts towards the networks they're attached to.
+                given = {container.id for container in containers}
+                containers = list(containers)
+                containers.extend(
+                    entry[2]
+                    for container_id, entry in self._inspected_containers.items()
+                    if container_id not in given
+                )
 
-            for network in docker_networks:
-                try:
-                    # Reload the network to get detailed information including containers
-                    network.reload()
+            # Network ID -> (container, endpoint settings) of each container
+            # attached to it. Only running (or paused) containers are attached.
+            attached = defaultdict(list)
+            for container in containers:
+                attrs = getattr(container, "attrs", None) or {}
+                state = attrs.get("State")
+                if not isinstance(state, dict) or not state.get("Running"):
+                    continue
+                endpoints = (attrs.get("NetworkSettings") or {}).get("Networks") or {}
+                for endpoint in endpoints.values():
+                    network_id = (endpoint or {}).get("NetworkID")
+                    if network_id:
+                        attached[network_id].append((container, endpoint))
 
+            for network in self.client.networks.list():
+                try:
                     # Get network configuration details
                     config = network.attrs.get("IPAM", {}).get("Config", [])
                     subnet = config[0].get("Subnet", "N/A") if config else "N/A"
@@ -574,43 +867,41 @@ class DockerManager:
                     connected_containers = []
                     connected_stacks = set()
 
-                    containers = network.attrs.get("Containers", {})
-                    logger.debug(
-                        f"Network {network.name} has {len(containers)} connected containers"
-                    )
+                    endpoints = attached.get(network.id, ())
+                    if debug:
+                        logger.debug(
+                            "Network %s has %s connected containers",
+                            network.name,
+                            len(endpoints),
+                        )
 
-                    for container_id, container_info in containers.items():
+                    for container, endpoint in endpoints:
                         try:
-                            # Get the actual container object to access labels
-                            container_obj = self.client.containers.get(container_id)
-                            container_name = container_info.get(
-                                "Name", container_obj.name
-                            )
-
                             # Determine stack from container labels
-                            stack_name = container_obj.labels.get(
+                            stack_name = container.labels.get(
                                 "com.docker.compose.project", "ungrouped"
                             )
                             connected_stacks.add(stack_name)
 
-                            container_data = {
-                                "id": container_id[:12],
-                                "name": container_name,
-                                "stack": stack_name,
-                                "ip": (
-                                    container_info.get("IPv4Address", "").split("/")[0]
-                                    if container_info.get("IPv4Address")
-                                    else "N/A"
-                                ),
-                            }
-                            connected_containers.append(container_data)
-                            logger.debug(
-                                f"Added container to network {network.name}: {container_data}"
+                            container_data = NetworkContainerInfo(
+                                id=container.id[:12],
+                                name=container.name,
+                                stack=stack_name,
+                                ip=endpoint.get("IPAddress") or "N/A",
                             )
+                            connected_containers.append(container_data)
+                            if debug:
+                                logger.debug(
+                                    "Added container to network %s: %s",
+                                    network.name,
+                                    container_data,
+                                )
                         except Exception as container_error:
                             logger.error(
-                                f"Error processing connected container {container_id}: {str(container_error)}",
-                                exc_info=True,
+                                "Error processing connected container %s: %s",
+                                container.id,
+                                container_error,
+                                exc_info=debug,
                             )
                             continue
 
@@ -627,8 +918,10 @@ class DockerManager:
 
                 except Exception as network_error:
                     logger.error(
-                        f"Error processing network {network.name}: {str(network_error)}",
-                        exc_info=True,
+                        "Error processing network %s: %s",
+                        network.name,
+                        network_error,
+                        exc_info=debug,
                     )
                     continue
 
@@ -658,6 +951,7 @@ class DockerManager:
                 - container_count: Number of containers using this volume
         """
         volumes = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
             docker_volumes = self.client.volumes.list()
 
@@ -693,14 +987,19 @@ class DockerManager:
                         ),  # Convert set to sorted list
                     }
 
-                    logger.debug(
-                        f"Found volume {volume.name} with stack association: {stack_name}"
-                    )
+                    if debug:
+                        logger.debug(
+                            "Found volume %s with stack association: %s",
+                            volume.name,
+                            stack_name,
+                        )
 
                 except Exception as volume_error:
                     logger.error(
-                        f"Error processing volume {volume.name}: {str(volume_error)}",
-                        exc_info=True,
+                        "Error processing volume %s: %s",
+                        volume.name,
+                        volume_error,
+                        exc_info=debug,
                     )
                     continue
 
@@ -714,9 +1013,13 @@ class DockerManager:
         self.last_error = None
         return volumes
 
-    def get_images(self) -> Dict[str, Dict]:
+    def get_images(self, containers: Optional[List] = None) -> Dict[str, Dict]:
         """Retrieve all Docker images with usage information.
 
+        Args:
+            containers: Already-listed container objects (all states) to derive
+                image usage from. When omitted, containers are listed from Docker.
+
         Returns:
             Dict[str, Dict]: A dictionary mapping image IDs to their details including:
                 - id: Image ID (short form)
@@ -729,12 +1032,14 @@ class DockerManager:
         """
         images = {}
         try:
-            start_time = time.time()
+            # Skip the timing probes entirely unless debug logging is on
+            timed = logger.isEnabledFor(logging.DEBUG)
+            if timed:
+                start_time = time.perf_counter_ns()
 
-            # Fetch images and containers concurrently
+            # Fetch images and, unless they were provided, containers concurrently
             docker_images = []
-            all_containers = []
-            threads = []
+            all_containers = containers if containers is not None else []
 
             def fetch_images():
                 nonlocal docker_images
@@ -742,20 +1047,23 @@ class DockerManager:
 
             def fetch_containers():
                 nonlocal all_containers
-                all_containers = self.client.containers.list(all=True)
+                # Reuse the cached inspections rather than inspecting every
+                # container again
+                all_containers = self._list_containers()
                 # Filter out the DockTUI container
                 all_containers = [c for c in all_containers if c.name != "docktui-app"]
 
             # Create threads for concurrent fetching
-            image_thread = threading.Thread(target=fetch_images)
-            container_thread = threading.Thread(target=fetch_containers)
+            threads = [threading.Thread(target=fetch_images)]
+            if containers is None:
+                threads.append(threading.Thread(target=fetch_containers))
 
-            image_thread.start()
-            container_thread.start()
+            for thread in threads:
+                thread.start()
 
-            # Wait for both threads to complete
-            image_thread.join(timeout=5.0)
-            container_thread.join(timeout=5.0)
+            # Wait for all threads to complete
+            for thread in threads:
+                thread.join(timeout=5.0)
 
             # Collect container info per image efficiently
             image_container_info = defaultdict(
@@ -824,12 +1132,18 @@ class DockerManager:
                 except Exception as image_error:
                     # Log error but continue processing other images
                     logger.error(
-                        f"Error processing image {getattr(image, 'id', 'unknown')}: {str(image_error)}"
+                        "Error processing image %s: %s",
+                        getattr(image, "id", "unknown"),
+                        image_error,
                     )
                     continue
 
-            elapsed = time.time() - start_time
-            logger.debug(f"Retrieved {len(images)} images in {elapsed:.3f}s")
+            if timed:
+                logger.debug(
+                    "Retrieved %s images in %.1fms",
+                    len(images),
+                    (time.perf_counter_ns() - start_time) / 1e6,
+                )
 
         except Exception as e:
             error_msg = f"Error getting images: {str(e)}"
@@ -854,7 +1168,7 @@ class DockerManager:
         try:
             image = self.client.images.get(image_id)
             image.remove(force=force)
-            logger.info(f"Successfully removed image: {image_id}")
+            logger.info("Successfully removed image: %s", image_id)
             return True, f"Image {image_id[:12]} removed successfully"
         except docker.errors.ImageNotFound:
             msg = f"Image {image_id[:12]} not found"
@@ -892,7 +1206,7 @@ class DockerManager:
 
             return unused_images
         except Exception as e:
-            logger.error(f"Error getting unused images: {str(e)}", exc_info=True)
+            logger.error("Error getting unused images: %s", e, exc_info=True)
             self.last_error = f"Error getting unused images: {str(e)}"
             return []
 
@@ -948,7 +1262,7 @@ class DockerManager:
             # For start/stop/restart, use SDK to operate on all containers in the stack
             if command in ["start", "stop", "restart"]:
                 logger.info(
-                    f"Executing {command} on all containers in stack: {stack_name}"
+                    "Executing %s on all containers in stack: %s", command, stack_name
                 )
 
                 # Get all containers for this stack
@@ -976,7 +1290,9 @@ class DockerManager:
                                 elif command == "restart":
                                     container.restart()
                                 logger.debug(
-                                    f"Successfully {command}ed container {container.name}"
+                                    "Successfully %sed container %s",
+                                    command,
+                                    container.name,
                                 )
                             except Exception as e:
                                 error_msg = f"Error {command}ing container {container.name}: {str(e)}"
@@ -999,12 +1315,12 @@ class DockerManager:
                         if errors:
                             self.last_error = "; ".join(errors)
                             logger.error(
-                                f"Errors during stack {command}: {self.last_error}"
+                                "Errors during stack %s: %s", command, self.last_error
                             )
 
                     except Exception as e:
                         logger.error(
-                            f"Error in stack command thread: {str(e)}", exc_info=True
+                            "Error in stack command thread: %s", e, exc_info=True
                         )
 
                 # Run the command in a separate thread to avoid blocking
@@ -1025,35 +1341,11 @@ class DockerManager:
                     self.last_error = error_msg
                     return False
 
-                cmd = ["docker", "compose", "-p", stack_name]
-
-                # Add config file(s) if provided and not 'N/A'
-                if config_file and config_file != "N/A":
-                    # Config files are comma-separated
-                    for cf in config_file.split(","):
-                        cmd.extend(["-f", cf.strip()])
-
+                cmd = _compose_command(stack_name, config_file)
                 cmd.extend(["up", "-d"])
-                logger.info(f"Executing stack recreate command: {' '.join(cmd)}")
-
-                # Use Popen to run the command in the background
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-
-                # Start a thread to monitor the process output
-                def monitor_recreate():
-                    stdout, stderr = process.communicate()
-                    if process.returncode != 0:
-                        error_msg = f"Stack recreate failed: {stderr}"
-                        logger.error(error_msg)
-                        self.last_error = error_msg
-                    else:
-                        logger.info(f"Stack recreate completed successfully: {stdout}")
+                logger.info("Executing stack recreate command: %s", " ".join(cmd))
 
-                thread = threading.Thread(target=monitor_recreate)
-                thread.daemon = True
-                thread.start()
+                self._run_in_background(cmd, "Stack recreate")
 
                 # Clear any previous error if the operation succeeded
                 self.last_error = None
@@ -1068,29 +1360,19 @@ class DockerManager:
                     base_command, flags = command.split(":", 1)
                     remove_volumes = "remove_volumes" in flags
                     logger.info(
-                        f"Down command with flags: remove_volumes={remove_volumes}"
+                        "Down command with flags: remove_volumes=%s", remove_volumes
                     )
 
-                cmd = ["docker", "compose", "-p", stack_name]
-
-                # Add config file(s) if provided and not 'N/A'
-                if config_file and config_file != "N/A":
-                    # Config files are comma-separated
-                    for cf in config_file.split(","):
-                        cmd.extend(["-f", cf.strip()])
-
+                cmd = _compose_command(stack_name, config_file)
                 cmd.append("down")
 
                 # Add volumes flag if requested
                 if remove_volumes:
                     cmd.append("--volumes")
 
-                logger.info(f"Executing stack down command: {' '.join(cmd)}")
+                logger.info("Executing stack down command: %s", " ".join(cmd))
 
-                # Use Popen to run the command in the background
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
+                self._run_in_background(cmd, "Stack down")
 
                 # Clear any previous error if the operation succeeded
                 self.last_error = None
@@ -1121,7 +1403,7 @@ class DockerManager:
         try:
             volume = self.client.volumes.get(volume_name)
             volume.remove(force=force)
-            logger.info(f"Successfully removed volume: {volume_name}")
+            logger.info("Successfully removed volume: %s", volume_name)
             return True, f"Volume '{volume_name}' removed successfully"
         except docker.errors.NotFound:
             msg = f"Volume '{volume_name}' not found"
@@ -1158,7 +1440,7 @@ class DockerManager:
 
             return unused_volumes
         except Exception as e:
-            logger.error(f"Error getting unused volumes: {str(e)}", exc_info=True)
+            logger.error("Error getting unused volumes: %s", e, exc_info=True)
             self.last_error = f"Error getting unused volumes: {str(e)}"
             return []
 
@@ -1185,10 +1467,10 @@ class DockerManager:
             # Log each removed volume
             if deleted_volumes:
                 for volume_name in deleted_volumes:
-                    logger.info(f"Removed unused volume: {volume_name}")
+                    logger.info("Removed unused volume: %s", volume_name)
             else:
                 # If Docker doesn't return specific volumes, log the count
-                logger.info(f"Removed {unused_count} unused volumes")
+                logger.info("Removed %s unused volumes", unused_count)
             space_reclaimed = result.get("SpaceReclaimed", 0)
 
             # Format space reclaimed
@@ -0,0 +1,199 @@
+"""Long-lived Docker stats streams for running containers."""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from docker.types import CancellableStream
+
+from ..utils.formatting import format_memory
+from .json_lines import decode_json_lines
+
+logger = logging.getLogger("DockTUI.docker_mgmt.stats")
+
+
+def parse_stats(stats: Dict) -> Dict[str, str]:
+    """Convert a Docker stats frame into the values shown for a container.
+
+    The first frame of a stream has no previous CPU sample, so its CPU usage is
+    the average since the container started, as with the docker stats CLI.
+
+    Args:
+        stats: A stats frame as decoded from the Docker API
+
+    Returns:
+        Dict[str, str]: The container's stats including:
+            - cpu: CPU usage percentage
+            - memory: Memory usage and limit
+            - memory_percent: Memory usage percentage
+            - pids: Number of processes
+    """
+    # Calculate CPU percentage
+    cpu_stats = stats["cpu_stats"]
+    precpu_stats = stats.get("precpu_stats") or {}
+    cpu_usage = cpu_stats["cpu_usage"]
+    cpu_delta = cpu_usage["total_usage"] - precpu_stats.get("cpu_usage", {}).get(
+        "total_usage", 0
+    )
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get(
+        "system_cpu_usage", 0
+    )
+    cpu_count = len(cpu_usage.get("percpu_usage", [None]))
+
+    if system_delta > 0:
+        cpu_percent = (cpu_delta / system_delta) * cpu_count * 100.0
+    else:
+        cpu_percent = 0.0
+
+    # Calculate memory usage
+    mem_stats = stats["memory_stats"]
+    mem_usage = mem_stats.get("usage", 0)
+    mem_limit = mem_stats.get("limit", 0)
+
+    # Account for cache in memory usage (same as docker stats CLI)
+    cache = mem_stats.get("stats", {}).get("cache", 0)
+    mem_usage = mem_usage - cache if mem_usage > cache else mem_usage
+
+    mem_percent = (mem_usage / mem_limit * 100.0) if mem_limit > 0 else 0.0
+
+    # Get PIDs count
+    pids_current = stats.get("pids_stats", {}).get("current", 0)
+
+    return {
+        "cpu": f"{cpu_percent:.2f}%",
+        "memory": f"{format_memory(mem_usage)} / {format_memory(mem_limit)}",
+        "memory_percent": f"{mem_percent:.2f}",
+        "pids": str(pids_current),
+    }
+
+
+def _open_stats_stream(container) -> CancellableStream:
+    """Open a container's raw stats stream, so it can be closed from any thread.
+
+    docker-py's container.stats() hides the HTTP response behind a generator,
+    which can't be closed while another thread is blocked reading it. The
+    stream is requested through the client's session instead and wrapped the
+    way docker-py wraps its event streams.
+
+    Args:
+        container: Docker container object to stream stats for
+
+    Returns:
+        CancellableStream: The raw chunks of the stats stream
+    """
+    api = container.client.api
+    response = api.get(
+        f"{api.base_url}/v{api.api_version}/containers/{container.id}/stats",
+        params={"stream": True},
+        stream=True,
+    )
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    return CancellableStream(iter(response.iter_content(chunk_size=None)), response)
+
+
+class ContainerStatsStream:
+    """Follows a running container's stats stream in a background thread.
+
+    Docker sends a stats frame about once a second for as long as the container
+    runs. Keeping the stream open means a refresh reads the latest frame instead
+    of waiting on the daemon for a fresh one-shot sample.
+
+    With follow disabled only a single one-shot sample is taken and the stream
+    then ends, so each refresh polls the daemon again. That holds no connection
+    open per container, which suits hosts running very many containers.
+    """
+
+    def __init__(self, container, follow: bool = True):
+        """Start collecting stats for a container.
+
+        Args:
+            container: Docker container object to collect stats for
+            follow: Whether to keep following the stream, rather than taking a
+                single sample
+        """
+        self.container = container
+        self.follow = follow
+        # Stats parsed from the latest frame, None until one was parsed
+        self.latest: Optional[Dict[str, str]] = None
+        # Set once the first frame arrived or the stream ended
+        self.ready = threading.Event()
+        self._ended = threading.Event()
+        # The open stats stream while following, closed by stop()
+        self._stream: Optional[CancellableStream] = None
+        self._thread = threading.Thread(
+            target=self._follow,
+            name=f"stats-{container.short_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def active(self) -> bool:
+        """Whether the stream is still following the container."""
+        return not self._ended.is_set()
+
+    def stop(self) -> None:
+        """Stop following the container and close its stats stream.
+
+        Closing the stream releases its connection right away, even when no
+        further frame would arrive, such as for a paused container.
+        """
+        self._ended.set()
+        self._close_stream()
+
+    def _close_stream(self) -> None:
+        """Close the stats stream, if one is open."""
+        stream = self._stream
+        if stream is None:
+            return
+        try:
+            stream.close()
+        except Exception as e:
+            logger.debug(
+                "Error closing stats stream for container %s: %s",
+                self.container.short_id,
+                e,
+            )
+
+    def _follow(self) -> None:
+        """Read frames until the container stops or the stream is stopped."""
+        try:
+            if self.follow:
+                self._stream = _open_stats_stream(self.container)
+                # Stopped while the stream was being opened
+                if self._ended.is_set():
+                    self._close_stream()
+                    return
+                frames = decode_json_lines(self._stream)
+            else:
+                frames = (self.container.stats(stream=False),)
+            for frame in frames:
+                if self._ended.is_set():
+                    break
+                try:
+                    self.latest = parse_stats(frame)
+                except Exception as e:
+                    logger.debug(
+                        "Skipping malformed stats frame for container %s: %s",
+                        self.container.short_id,
+                        e,
+                    )
+                self.ready.set()
+        except Exception as e:
+            # Reading a stream closed by stop() fails, which isn't an error
+            if self._ended.is_set():
+                return
+            logger.error(
+                "Error collecting stats for container %s: %s",
+                self.container.short_id,
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+        finally:
+            self._ended.set()
+            self._close_stream()
+            self.ready.set()
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Dict, List, Tuple
+
+
+class _RecordMapping:
+    """Mapping-style access for UI code that still treats records as dicts."""
+
+    __slots__ = ()
+
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._field_names
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it isn't a record field."""
+        if key in self._field_names:
+            return getattr(self, key)
+        return default
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a mutable dict copy of this record's data."""
+        return {name: getattr(self, name) for name in self._field_names}
+
+
+@dataclass(slots=True, frozen=True)
+class ContainerInfo(_RecordMapping):
+    """Snapshot of a single container as returned by DockerManager.get_containers().
+
+    Records are slotted and immutable so that refreshing hosts with many
+    containers keeps per-row memory low and attribute access cheap.
+    """
+
+    id: str
+    name: str
+    status: str
+    uptime: str
+    cpu: str
+    memory: str
+    pids: str
+    stack: str
+    ports: str
+    image_id: str = ""
+    image_name: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class NetworkContainerInfo(_RecordMapping):
+    """A container connected to a network, as returned by DockerManager.get_networks()."""
+
+    id: str
+    name: str
+    stack: str
+    ip: str
+
+
+@dataclass(slots=True)
+class StackInfo(_RecordMapping):
+    """A compose stack as returned by DockerManager.get_compose_stacks().
+
+    Unlike the other records, a stack is filled in while its containers are
+    counted, so it isn't frozen.
+    """
+
+    name: str
+    config_file: str
+    can_recreate: bool
+    has_compose_file: bool
+    containers: List[Any] = field(default_factory=list)
+    running: int = 0
+    exited: int = 0
+    total: int = 0
+
+
+for _record in (ContainerInfo, NetworkContainerInfo, StackInfo):
+    _record._field_names = tuple(f.name for f in fields(_record))
+del _record
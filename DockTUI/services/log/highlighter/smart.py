@@ -283,7 +283,9 @@ class SmartLogFormatter:
                         if char_styles[i] is None:
                             char_styles[i] = style_name
             except Exception as e:
-                logger.debug(f"Failed to apply pyparsing pattern {pattern_name}: {e}")
+                logger.debug(
+                    "Failed to apply pyparsing pattern %s: %s", pattern_name, e
+                )
         else:
             # regex pattern
             for match in pattern.finditer(text):
@@ -371,7 +373,9 @@ class SmartLogFormatter:
                             if char_styles[i] is None:
                                 char_styles[i] = style_name
             except Exception as e:
-                logger.debug(f"Failed to apply pyparsing pattern {pattern_name}: {e}")
+                logger.debug(
+                    "Failed to apply pyparsing pattern %s: %s", pattern_name, e
+                )
         else:
             # regex pattern
             for match in pattern.finditer(text):
@@ -536,7 +540,7 @@ class SmartLogFormatter:
 
         except Exception as e:
             # If parsing fails, return the whole JSON in a default style
-            logger.debug(f"Failed to parse inline JSON for highlighting: {e}")
+            logger.debug("Failed to parse inline JSON for highlighting: %s", e)
             segments.append(Segment(json_str, Style(color="blue")))
 
         return segments
@@ -2,8 +2,9 @@
 
 import logging
 import threading
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from ...docker_mgmt.types import ContainerInfo
 from ..base.container_list_base import DockerOperationCompleted
 
 if TYPE_CHECKING:
@@ -11,6 +12,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("DockTUI.actions.docker")
 
+# Verb forms of Docker commands used in error messages
+_ACTION_VERBS = {
+    "start": "starting",
+    "stop": "stopping",
+    "restart": "restarting",
+    "recreate": "recreating",
+    "remove": "removing",
+    "down": "taking down",
+}
+
 
 class DockerActions:
     """Mixin class that provides Docker command execution functionality."""
@@ -20,6 +31,8 @@ class DockerActions:
         # Track recreate operations to update log pane after refresh
         self._recreating_container_name = None
         self._recreating_item_type = None
+        # Pending delayed refresh after a command; only the latest one fires
+        self._post_command_refresh_timer = None
         # Prevent concurrent volume operations
         self._volume_operation_in_progress = False
         self._volume_operation_lock = threading.Lock()
@@ -101,22 +114,6 @@ class DockerActions:
 
         try:
             if item_type == "container":
-                item_name = (
-                    self.container_list.selected_container_data.get("name", item_id)
-                    if self.container_list.selected_container_data
-                    else item_id
-                )
-                action_verb = (
-                    "Recreating"
-                    if command == "recreate"
-                    else (
-                        "Removing"
-                        if command == "remove"
-                        else f"{command.capitalize()}ing"
-                    )
-                )
-                message = f"{action_verb} container: {item_name}"
-
                 # Update UI immediately for container operations
                 status_map = {
                     "start": "starting...",
@@ -182,6 +179,7 @@ class DockerActions:
                     self.container_list.set_stack_containers_status(
                         stack_name, base_command
                     )
+                    action_verb = _ACTION_VERBS.get(base_command, base_command)
 
                     # Force a UI refresh to show the updated container statuses
                     self.refresh()
@@ -196,7 +194,7 @@ class DockerActions:
                         if not success:
                             self.call_from_thread(
                                 self.error_display.update,
-                                f"Error {command}ing stack: {self.docker.last_error}",
+                                f"Error {action_verb} stack: {self.docker.last_error}",
                             )
 
                     thread = threading.Thread(target=execute_and_clear)
@@ -214,22 +212,33 @@ class DockerActions:
             if success:
                 # Status is now shown in the UI elements themselves (containers/stacks)
                 # Schedule a refresh after a short delay to update the UI
-                self.set_timer(2, self.action_refresh)
+                self._schedule_post_command_refresh()
             else:
                 self.error_display.update(
-                    f"Error {command}ing {item_type}: {self.docker.last_error}"
+                    f"Error {_ACTION_VERBS.get(command, command)} {item_type}: "
+                    f"{self.docker.last_error}"
                 )
         except Exception as e:
-            logger.error(f"Error executing {command} command: {str(e)}", exc_info=True)
+            logger.error("Error executing %s command: %s", command, e, exc_info=True)
             self.error_display.update(f"Error executing {command}: {str(e)}")
 
+    def _schedule_post_command_refresh(self: "DockTUIApp", delay: float = 2) -> None:
+        """Schedule a refresh after a command, replacing any pending one.
+
+        Args:
+            delay: Seconds to wait before refreshing
+        """
+        if self._post_command_refresh_timer is not None:
+            self._post_command_refresh_timer.stop()
+        self._post_command_refresh_timer = self.set_timer(delay, self.action_refresh)
+
     def handle_post_recreate(
-        self: "DockTUIApp", containers: list
-    ) -> Tuple[Optional[str], Optional[dict]]:
+        self: "DockTUIApp", containers_by_name: Dict[str, ContainerInfo]
+    ) -> Tuple[Optional[str], Optional[ContainerInfo]]:
         """Handle container selection after a recreate operation.
 
         Args:
-            containers: List of container information
+            containers_by_name: Mapping of container names to container information
 
         Returns:
             Tuple of (new_container_id, new_container_data) if found, (None, None) otherwise
@@ -242,11 +251,9 @@ class DockerActions:
 
         if self._recreating_item_type == "container":
             # Look for a container with the same name
-            for container in containers:
-                if container.get("name") == self._recreating_container_name:
-                    new_container_id = container.get("id")
-                    new_container_data = container
-                    break
+            new_container_data = containers_by_name.get(self._recreating_container_name)
+            if new_container_data:
+                new_container_id = new_container_data.id
 
             if new_container_id and new_container_data:
                 # Use select_container to properly update the UI and trigger all necessary events
@@ -272,11 +279,15 @@ class DockerActions:
 
         return new_container_id, new_container_data
 
-    def execute_image_command(self: "DockTUIApp", command: str) -> None:
+    def execute_image_command(
+        self: "DockTUIApp", command: str, unused_images: Optional[List[Dict]] = None
+    ) -> None:
         """Execute a Docker command on the selected image.
 
         Args:
             command: The command to execute (remove_image, remove_unused_images)
+            unused_images: Unused images already looked up for
+                remove_unused_images. Looked up again when omitted.
         """
         if command == "remove_image":
             if not self.container_list or not self.container_list.selected_item:
@@ -339,7 +350,8 @@ class DockerActions:
             self.error_display.update(f"Removing image...")
 
         elif command == "remove_unused_images":
-            unused_images = self.docker.get_unused_images()
+            if unused_images is None:
+                unused_images = self.docker.get_unused_images()
             unused_count = len(unused_images)
 
             if unused_count == 0:
@@ -388,11 +400,15 @@ class DockerActions:
 
             self.error_display.update(f"Removing {unused_count} unused images...")
 
-    def execute_volume_command(self: "DockTUIApp", command: str) -> None:
+    def execute_volume_command(
+        self: "DockTUIApp", command: str, unused_volumes: Optional[List[Dict]] = None
+    ) -> None:
         """Execute a Docker command on volumes.
 
         Args:
             command: The command to execute (remove_volume, remove_unused_volumes)
+            unused_volumes: Unused volumes already looked up for
+                remove_unused_volumes. Looked up again when omitted.
         """
         # Check if a volume operation is already in progress
         with self._volume_operation_lock:
@@ -454,7 +470,8 @@ class DockerActions:
                 self.error_display.update(f"Removing volume '{item_id}'...")
 
             elif command == "remove_unused_volumes":
-                unused_volumes = self.docker.get_unused_volumes()
+                if unused_volumes is None:
+                    unused_volumes = self.docker.get_unused_volumes()
                 unused_count = len(unused_volumes)
 
                 if unused_count == 0:
@@ -495,7 +512,7 @@ class DockerActions:
                 # Show immediate feedback
                 self.error_display.update(f"Removing {unused_count} unused volumes...")
         except Exception as e:
-            logger.error(f"Error in execute_volume_command: {e}")
+            logger.error("Error in execute_volume_command: %s", e)
             self.error_display.update(f"Error: {str(e)}")
             with self._volume_operation_lock:
                 self._volume_operation_in_progress = False
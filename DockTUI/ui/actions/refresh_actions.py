@@ -1,15 +1,64 @@
 """Refresh and UI update actions for DockTUI."""
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from textual import work
+from textual.worker import Worker, WorkerState
+
+from ..containers import group_by_stack
 
 if TYPE_CHECKING:
     from DockTUI.app import DockTUIApp
 
 logger = logging.getLogger("DockTUI.actions.refresh")
 
+# Seconds a refresh must have taken before the next shows a "Refreshing..."
+# indicator. A refresh takes several Docker API round trips, so this is set well
+# above their usual total to only flag refreshes that are visibly slow.
+REFRESH_INDICATOR_THRESHOLD = 0.3
+
+# Timed refreshes wait at least this many times the last refresh's duration
+REFRESH_BACKOFF_FACTOR = 2.0
+
+
+def _future_result(future: Future, default, name: str):
+    """Get the result of a fetch future, falling back to a default on error.
+
+    Args:
+        future: The future running the Docker fetch
+        default: Value to return if the fetch raised an exception
+        name: Name of the fetched resource, used for logging
+
+    Returns:
+        The fetch result, or the default if the fetch failed
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Error fetching %s: %s", name, e, exc_info=True)
+        return default
+
+
+def _title_stats(networks: Dict, stacks: Dict) -> str:
+    """Build the summary shown in the app title for a refresh's results.
+
+    Args:
+        networks: Dictionary of network information
+        stacks: Dictionary of stack information
+
+    Returns:
+        str: Network, stack, running and exited container counts
+    """
+    total_running = sum(s["running"] for s in stacks.values())
+    total_exited = sum(s["exited"] for s in stacks.values())
+    return (
+        f"{len(networks)} Networks, {len(stacks)} Stacks, "
+        f"{total_running} Running, {total_exited} Exited"
+    )
+
 
 class RefreshActions:
     """Mixin class that provides refresh and UI update functionality."""
@@ -17,46 +66,90 @@ class RefreshActions:
     def __init__(self):
         """Initialize the refresh actions mixin."""
         self._refresh_count = 0
+        # Last stats suffix written to the title, used to skip redundant repaints
+        self._last_title_stats = None
+        self._refresh_started_at = None
+        self._last_refresh_duration = None
+        # (id, name, status) of the selected container last sent to the log pane
+        self._log_pane_container_key = None
+        # Refresh worker last started, used to avoid stacking up refreshes
+        self._current_worker: Worker | None = None
+
+    def _refresh_on_timer(self: "DockTUIApp") -> None:
+        """Refresh on the auto-refresh timer, backing off while Docker is slow.
+
+        A tick is skipped until REFRESH_BACKOFF_FACTOR times the last refresh's
+        duration has passed since it started, so a slow daemon is polled less
+        often. On a responsive daemon every tick refreshes.
+        """
+        if (
+            self._refresh_started_at is not None
+            and self._last_refresh_duration is not None
+            and time.monotonic() - self._refresh_started_at
+            < self._last_refresh_duration * REFRESH_BACKOFF_FACTOR
+        ):
+            return
+        self.action_refresh()
 
-    async def refresh_containers(self: "DockTUIApp") -> None:
-        """Refresh the container list asynchronously.
+    def refresh_containers(self: "DockTUIApp") -> None:
+        """Refresh the container list without blocking the UI.
 
         Fetches updated container and stack information in a background thread,
-        then updates the UI with the new data.
+        then updates the UI with the new data. Nothing here needs to be awaited,
+        so this runs directly on the caller's turn of the event loop.
         """
         if not all([self.container_list, self.error_display]):
             logger.error("Error: Widgets not properly initialized")
             return
 
+        # Skip this tick if the previous refresh is still waiting on Docker
+        if self._current_worker is not None and self._current_worker.state in (
+            WorkerState.PENDING,
+            WorkerState.RUNNING,
+        ):
+            return
+
         try:
-            # Add refreshing indicator to the existing title
-            # Make sure the sub_title has padding to make it the same length as the title so it is centered
-            title_length = len(self.title)
-            subtitle_padding_spaces = ""
-            if title_length > 13:
-                subtitle_padding_spaces = " " * int((title_length - 13) * 0.5)
-            self.sub_title = "\n" + subtitle_padding_spaces + "Refreshing..."
+            self._refresh_started_at = time.monotonic()
+
+            # Only show the refreshing indicator when the previous refresh was slow
+            # enough to be visible, otherwise it just causes a Header repaint
+            if (
+                self._last_refresh_duration is None
+                or self._last_refresh_duration >= REFRESH_INDICATOR_THRESHOLD
+            ):
+                # Add refreshing indicator to the existing title
+                # Make sure the sub_title has padding to make it the same length as the title so it is centered
+                title_length = len(self.title)
+                subtitle_padding_spaces = ""
+                if title_length > 13:
+                    subtitle_padding_spaces = " " * int((title_length - 13) * 0.5)
+                self.sub_title = "\n" + subtitle_padding_spaces + "Refreshing..."
 
             # Start the worker but don't block waiting for it
             # Textual's worker pattern will call the function and then process the results
             # when they're ready without blocking the UI
-            self._refresh_containers_worker(self._handle_refresh_results)
+            self._current_worker = self._refresh_containers_worker(
+                self._sync_update_ui_with_results
+            )
 
         except Exception as e:
-            logger.error(f"Error during refresh: {str(e)}", exc_info=True)
+            logger.error("Error during refresh: %s", e, exc_info=True)
             self.error_display.update(f"Error refreshing: {str(e)}")
 
-    @work(thread=True)
+    @work(thread=True, group="refresh")
     def _refresh_containers_worker(
         self: "DockTUIApp", callback
-    ) -> Tuple[Dict, Dict, Dict, List]:
-        """Worker function to fetch network, stack, volume and container data in a background thread.
+    ) -> Tuple[Dict, Dict, Dict, Dict, List]:
+        """Worker function to fetch network, stack, image, volume and container data.
+
+        Runs in a background thread.
 
         Args:
             callback: Function to call with the results when complete
 
         Returns:
-            Tuple[Dict, Dict, Dict, Dict, List]: A tuple containing:
+            Tuple[Dict, Dict, Dict, Dict, List]: A tuple containing, in order:
                 - Dict: Mapping of network names to network information
                 - Dict: Mapping of stack names to stack information
                 - Dict: Mapping of image IDs to image information
@@ -64,31 +157,83 @@ class RefreshActions:
                 - List: List of container information dictionaries
         """
         try:
-            # Get networks, stacks, images, volumes and containers in the thread
-            networks = self.docker.get_networks()
-            stacks = self.docker.get_compose_stacks()
-            images = self.docker.get_images()
-            volumes = self.docker.get_volumes()
-            containers = self.docker.get_containers()
+            # Errors from a previous refresh shouldn't outlive it
+            self.docker.last_error = None
+
+            # List (and inspect) every container once, then fetch everything
+            # else concurrently to overlap Docker API latency
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                stacks = _future_result(
+                    executor.submit(self.docker.get_compose_stacks), {}, "stacks"
+                )
+                # Networks and images read labels and image IDs from the
+                # containers listed with the stacks instead of fetching them
+                # again. Without stacks they fall back to asking Docker.
+                listed_containers = [
+                    container
+                    for stack_info in stacks.values()
+                    for container in stack_info["containers"]
+                ] or None
+
+                networks_future = executor.submit(
+                    self.docker.get_networks, listed_containers
+                )
+                images_future = executor.submit(
+                    self.docker.get_images, listed_containers
+                )
+                # Volumes need the volume usage collected with the stacks, and
+                # containers reuse the stacks rather than listing containers again
+                volumes_future = executor.submit(self.docker.get_volumes)
+                containers_future = executor.submit(self.docker.get_containers, stacks)
+
+                networks = _future_result(networks_future, {}, "networks")
+                images = _future_result(images_future, {}, "images")
+                volumes = _future_result(volumes_future, {}, "volumes")
+                containers = _future_result(containers_future, [], "containers")
+
+            # A cancelled refresh (e.g. on quit) must not touch the UI
+            if self._current_worker is not None and self._current_worker.is_cancelled:
+                return networks, stacks, images, volumes, containers
+
+            # Summarize and bucket the results here to keep work off the main thread
+            stats_suffix = _title_stats(networks, stacks)
+            containers_by_stack = group_by_stack(containers)
 
             # Call the callback with the results
             # This will be executed in the main thread after the worker completes
             self.call_from_thread(
-                callback, networks, stacks, images, volumes, containers
+                callback,
+                networks,
+                stacks,
+                images,
+                volumes,
+                containers,
+                stats_suffix=stats_suffix,
+                containers_by_stack=containers_by_stack,
             )
 
             return networks, stacks, images, volumes, containers
         except Exception as e:
-            logger.error(f"Error in refresh worker: {str(e)}", exc_info=True)
+            logger.error("Error in refresh worker: %s", e, exc_info=True)
             self.call_from_thread(
                 self.error_display.update, f"Error refreshing: {str(e)}"
             )
             return {}, {}, {}, {}, []
 
-    def _handle_refresh_results(
-        self: "DockTUIApp", networks, stacks, images, volumes, containers
+    def _sync_update_ui_with_results(
+        self: "DockTUIApp",
+        networks,
+        stacks,
+        images,
+        volumes,
+        containers,
+        stats_suffix: str | None = None,
+        containers_by_stack: Dict | None = None,
     ):
-        """Handle the results from the refresh worker when they're ready.
+        """Synchronously update the UI with the results from the refresh worker.
+
+        Called on the main thread via call_from_thread, so the UI can be updated
+        directly without scheduling another task.
 
         Args:
             networks: Dictionary of network information
@@ -96,171 +241,115 @@ class RefreshActions:
             images: Dictionary of image information
             volumes: Dictionary of volume information
             containers: List of container information
+            stats_suffix: Title summary precomputed by the worker; built from
+                networks and stacks when omitted
+            containers_by_stack: Containers bucketed by stack by the worker;
+                built from containers when omitted
         """
+
         try:
-            # Update UI with the results
-            if hasattr(self.docker, "last_error") and self.docker.last_error:
+            if self.docker.last_error:
                 self.error_display.update(f"Error: {self.docker.last_error}")
             else:
                 self.error_display.update("")
 
-            # Update UI directly without creating a new task
-            # Since we're already in the main thread via call_from_thread,
-            # we can safely update the UI synchronously
-            self._sync_update_ui_with_results(
-                networks, stacks, images, volumes, containers
+            # Only touches the widgets when the Docker data actually changed
+            changed = self.container_list.apply_state(
+                networks,
+                stacks,
+                images,
+                volumes,
+                containers,
+                containers_by_stack=containers_by_stack,
             )
 
+            # Handle container recreation - update log pane if needed. This runs
+            # every refresh so a pending recreate is always settled.
+            if hasattr(self, "handle_post_recreate"):
+                self.handle_post_recreate({c.name: c for c in containers})
+
+            # An unchanged snapshot can't change what the selection shows
+            if changed:
+                self._sync_selection_with_results(stacks, containers)
+
+            if self._refresh_started_at is not None:
+                self._last_refresh_duration = (
+                    time.monotonic() - self._refresh_started_at
+                )
+
+            # Update the app title with stats only when they changed
+            if stats_suffix is None:
+                stats_suffix = _title_stats(networks, stacks)
+            if stats_suffix != self._last_title_stats:
+                self.title = self._get_versioned_title(stats_suffix)
+                self._last_title_stats = stats_suffix
+            # Remove any "Refreshing..." indicator
+            if self.sub_title:
+                self.sub_title = ""
+            # Increment refresh count
+            self._refresh_count += 1
+
         except Exception as e:
-            logger.error(f"Error handling refresh results: {str(e)}", exc_info=True)
-            self.error_display.update(f"Error refreshing: {str(e)}")
+            logger.error("Error during UI update: %s", e, exc_info=True)
+            self.error_display.update(f"Error updating UI: {str(e)}")
 
-    def _sync_update_ui_with_results(
-        self: "DockTUIApp", networks, stacks, images, volumes, containers
-    ):
-        """Synchronously update the UI with the results from the refresh worker.
+    def _sync_selection_with_results(self: "DockTUIApp", stacks, containers):
+        """Bring the log pane and bindings up to date with refreshed data.
 
         Args:
-            networks: Dictionary of network information
             stacks: Dictionary of stack information
-            images: Dictionary of image information
-            volumes: Dictionary of volume information
             containers: List of container information
         """
-
-        try:
-            # Begin a batch update to prevent UI flickering
-            self.container_list.begin_update()
-
-            try:
-                # Process all stacks first
-                for stack_name, stack_info in stacks.items():
-                    self.container_list.add_stack(
-                        stack_name,
-                        stack_info["config_file"],
-                        stack_info["running"],
-                        stack_info["exited"],
-                        stack_info["total"],
-                        stack_info.get("can_recreate", True),
-                        stack_info.get("has_compose_file", True),
-                    )
-
-                # Process all images next
-                if images:
-                    for image_id, image_info in images.items():
-                        self.container_list.add_image(image_info)
-                else:
-                    # No images found, show message if section is expanded
-                    if (
-                        not self.container_list.images_section_collapsed
-                        and self.container_list.images_container
+        # Index containers once so lookups below are O(1)
+        containers_by_id = {c.id: c for c in containers}
+
+        # Check if selected container's status changed - update log pane if needed
+        if self.log_pane and self.container_list.selected_item:
+            item_type, item_id = self.container_list.selected_item
+            old_status = getattr(self, "_current_selection_status", "none")
+
+            if item_type == "container":
+                # Find the container in the new data
+                container = containers_by_id.get(item_id)
+                if container is not None:
+                    # The log pane only reacts to the container's name and
+                    # status, so skip the update when neither has changed
+                    container_key = (container.id, container.name, container.status)
+                    if container_key != self._log_pane_container_key:
+                        self.log_pane.update_selection("container", item_id, container)
+                        self._log_pane_container_key = container_key
+
+                    # Check if status changed and refresh bindings if needed
+                    new_status = container.status
+                    if old_status != new_status and hasattr(
+                        self, "_current_selection_status"
                     ):
-                        self.container_list.image_manager.show_no_images_message()
-
-                if self.container_list.image_manager._preserve_selected_image_id:
-                    preserved_id = (
-                        self.container_list.image_manager._preserve_selected_image_id
+                        self._current_selection_status = new_status
+                        if hasattr(self, "refresh_bindings"):
+                            self.refresh_bindings()
+            elif item_type == "stack":
+                # For stacks, check if any container status changed
+                # This is important so log pane can refresh when containers in the stack change status
+                if item_id in stacks:
+                    stack_info = stacks[item_id]
+                    # Force a log pane update with the latest stack data
+                    # The log pane will re-stream logs from all containers in the stack
+                    self.log_pane.update_selection(
+                        "stack", item_id, stack_info, force_restart=False
                     )
-                    if preserved_id in self.container_list.image_manager.image_rows:
-                        self.container_list.image_manager.select_image(preserved_id)
-                    self.container_list.image_manager._preserve_selected_image_id = None
-
-                # Process all volumes after images
-                for volume_name, volume_info in volumes.items():
-                    self.container_list.add_volume(volume_info)
-
-                # Process all networks after volumes
-                for network_name, network_info in networks.items():
-                    self.container_list.add_network(network_info)
-
-                    # Add containers to the network
-                    for container_info in network_info["connected_containers"]:
-                        self.container_list.add_container_to_network(
-                            network_name, container_info
-                        )
-
-                # Process all containers in a single batch
-                # Sort containers by stack to minimize UI updates
-                sorted_containers = sorted(containers, key=lambda c: c["stack"])
-                for container in sorted_containers:
-                    self.container_list.add_container_to_stack(
-                        container["stack"], container
-                    )
-
-            finally:
-                # Always end the update, even if cancelled
-                self.container_list.end_update()
-
-            # Handle container recreation - update log pane if needed
-            if hasattr(self, "handle_post_recreate"):
-                self.handle_post_recreate(containers)
-
-            # Check if selected container's status changed - update log pane if needed
-            if self.log_pane and self.container_list.selected_item:
-                item_type, item_id = self.container_list.selected_item
-                old_status = getattr(self, "_current_selection_status", "none")
-
-                if item_type == "container":
-                    # Find the container in the new data
-                    for container in containers:
-                        if container.get("id") == item_id:
-                            # Always update the log pane with current status
-                            # The log pane will check if status actually changed
-                            self.log_pane.update_selection(
-                                "container", item_id, container
-                            )
-
-                            # Check if status changed and refresh bindings if needed
-                            new_status = container.get("status", "none")
-                            if old_status != new_status and hasattr(
-                                self, "_current_selection_status"
-                            ):
-                                self._current_selection_status = new_status
-                                if hasattr(self, "refresh_bindings"):
-                                    self.refresh_bindings()
-                            break
-                elif item_type == "stack":
-                    # For stacks, check if any container status changed
-                    # This is important so log pane can refresh when containers in the stack change status
-                    if item_id in stacks:
-                        stack_info = stacks[item_id]
-                        # Force a log pane update with the latest stack data
-                        # The log pane will re-stream logs from all containers in the stack
-                        self.log_pane.update_selection(
-                            "stack", item_id, stack_info, force_restart=False
-                        )
-                elif item_type == "image":
-                    # Check if selected image's usage status changed
-                    if self.container_list.image_manager.selected_image_data:
-                        image_data = (
-                            self.container_list.image_manager.selected_image_data
+            elif item_type == "image":
+                # Check if selected image's usage status changed
+                if self.container_list.image_manager.selected_image_data:
+                    image_data = self.container_list.image_manager.selected_image_data
+                    # For images, we track if they have containers
+                    was_in_use = old_status == "Active"
+                    is_in_use = bool(image_data.get("container_names", []))
+
+                    if was_in_use != is_in_use and hasattr(
+                        self, "_current_selection_status"
+                    ):
+                        self._current_selection_status = (
+                            "Active" if is_in_use else "Unused"
                         )
-                        # For images, we track if they have containers
-                        was_in_use = old_status == "Active"
-                        is_in_use = bool(image_data.get("container_names", []))
-
-                        if was_in_use != is_in_use and hasattr(
-                            self, "_current_selection_status"
-                        ):
-                            self._current_selection_status = (
-                                "Active" if is_in_use else "Unused"
-                            )
-                            if hasattr(self, "refresh_bindings"):
-                                self.refresh_bindings()
-
-            # Update title with summary
-            total_running = sum(s["running"] for s in stacks.values())
-            total_exited = sum(s["exited"] for s in stacks.values())
-            total_networks = len(networks)
-            total_stacks = len(stacks)
-
-            # Update the app title with stats (removes any "Refreshing..." suffix)
-            stats_suffix = f"{total_networks} Networks, {total_stacks} Stacks, {total_running} Running, {total_exited} Exited"
-            self.title = self._get_versioned_title(stats_suffix)
-            self.sub_title = ""
-            # Increment refresh count
-            self._refresh_count += 1
-
-        except Exception as e:
-            logger.error(f"Error during UI update: {str(e)}", exc_info=True)
-            self.error_display.update(f"Error updating UI: {str(e)}")
+                        if hasattr(self, "refresh_bindings"):
+                            self.refresh_bindings()
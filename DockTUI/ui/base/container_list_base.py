@@ -414,7 +414,7 @@ class ContainerListBase(VerticalScroll):
         Returns:
             DataTable: A configured table for displaying container information
         """
-        logger.debug(f"Creating ContainerDataTable for stack {stack_name}")
+        logger.debug("Creating ContainerDataTable for stack %s", stack_name)
         table = ContainerDataTable()
         table.add_columns(
             "ID", "Name", "Status", "Uptime", "CPU %", "Memory", "PIDs", "Ports"
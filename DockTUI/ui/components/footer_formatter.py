@@ -1,6 +1,8 @@
 """Footer formatting functionality for the container list widget."""
 
 import logging
+import time
+from typing import Dict, List, Optional, Tuple
 
 from rich.style import Style
 from rich.text import Text
@@ -8,6 +10,70 @@ from textual.widgets import Static
 
 logger = logging.getLogger("DockTUI.footer_formatter")
 
+# Least seconds between footer updates; updates in between are coalesced
+FOOTER_UPDATE_INTERVAL = 0.1
+
+# Styles shared by every footer update, built once instead of on each update.
+# Labels are plain white; values are bold in a color of their own.
+_BOLD = Style(bold=True)
+_LABEL = Style(color="white")
+_WHITE_BOLD = _LABEL + _BOLD
+_DIM_BOLD = _WHITE_BOLD + Style(dim=True)
+_GREEN_BOLD = Style(color="green") + _BOLD
+_YELLOW_BOLD = Style(color="yellow") + _BOLD
+_RED_BOLD = Style(color="red") + _BOLD
+_CYAN_BOLD = Style(color="cyan") + _BOLD
+_MAGENTA_BOLD = Style(color="magenta") + _BOLD
+_BLUE_BOLD = Style(color="blue") + _BOLD
+
+# Footer shown without a selection. Shared, so never mutate it
+_NO_SELECTION_TEXT = Text("No selection", _WHITE_BOLD)
+
+# Container status -> style; every other status (paused, dead, "starting...", ...)
+# is shown in red
+_STATUS_STYLES = {"running": _GREEN_BOLD, "exited": _YELLOW_BOLD}
+
+# Static labels of each item type's footer, shown before each of its values in
+# turn. A separator and the label after it share a style, so they're one part.
+_VOLUME_LABELS = ("  Volume: ", " | Driver: ", " | Stack: ", " | In Use: ")
+_IMAGE_LABELS = ("  Image: ", " | ", "\nContainers: ")
+_NETWORK_LABELS = ("  Network: ", " | Driver: ", " | Scope: ", " | Containers: ")
+_STACK_LABELS = ("  Stack: ", " | Running: ", " | Exited: ", " | Total: ")
+
+# Text of the container counts footers usually show
+_SMALL_COUNTS = tuple(str(count) for count in range(256))
+
+
+def _count_text(count) -> str:
+    """Get the text of a count, reusing the text of small counts.
+
+    Args:
+        count: The count, as an int or already as text
+
+    Returns:
+        str: The count's text
+    """
+    if type(count) is int and 0 <= count < len(_SMALL_COUNTS):
+        return _SMALL_COUNTS[count]
+    return str(count)
+
+
+def _fill_labels(labels: Tuple[str, ...], values: List[Tuple[str, Style]]) -> Text:
+    """Build a footer from an item type's labels and the values that follow them.
+
+    Args:
+        labels: The item type's static labels
+        values: Text and style of the value after each label
+
+    Returns:
+        Text: The footer text
+    """
+    parts = []
+    for label, value in zip(labels, values):
+        parts.append((label, _LABEL))
+        parts.append(value)
+    return Text.assemble(*parts)
+
 
 class FooterFormatter:
     """Handles formatting and updating the footer status bar."""
@@ -19,15 +85,80 @@ class FooterFormatter:
             container_list: The parent ContainerList widget
         """
         self.container_list = container_list
+        # The status bar widget, looked up on first use and while it's detached
+        self._status_bar: Optional[Static] = None
+        # Status bar and key of the values it last showed, None if unknown
+        self._last_status_bar: Optional[Static] = None
+        self._last_key: Optional[Tuple] = None
+        # Monotonic time of the last footer update, and the timer of a
+        # coalesced update waiting to run
+        self._last_update = 0.0
+        self._pending_update = None
+        # Item type -> (handler updating the footer for a selected item,
+        # container list attribute holding the item's data)
+        self._handlers = {
+            "volume": (self._update_volume, "selected_volume_data"),
+            "image": (self._update_image, "selected_image_data"),
+            "network": (self._update_network, "selected_network_data"),
+            "stack": (self._update_stack, "selected_stack_data"),
+            "container": (self._update_container, "selected_container_data"),
+        }
+
+    def _is_unchanged(self, status_bar: Static, key: Tuple) -> bool:
+        """Check whether the status bar already shows the values in a key.
+
+        The key is recorded as shown, so a footer that would render the same
+        text again skips building it and the status bar's repaint.
+
+        Args:
+            status_bar: The status bar widget to update
+            key: The item type and every value its footer displays
+
+        Returns:
+            bool: True if the status bar already shows these values
+        """
+        if key == self._last_key and status_bar is self._last_status_bar:
+            return True
+        self._last_status_bar = status_bar
+        self._last_key = key
+        return False
 
     def update_footer_with_selection(self) -> None:
-        """Update the footer with the current selection information."""
+        """Update the footer with the current selection information.
+
+        Updates are at least FOOTER_UPDATE_INTERVAL apart. Requests arriving
+        sooner after the last update, such as from stats refreshes while the
+        selection moves, are coalesced into a single update at the end of the
+        interval, which shows the selection as it is then.
+        """
         if self.container_list.screen is None:
             logger.warning("Cannot update footer: screen is None")
             return
 
+        elapsed = time.monotonic() - self._last_update
+        if elapsed < FOOTER_UPDATE_INTERVAL:
+            if self._pending_update is None:
+                self._pending_update = self.container_list.set_timer(
+                    FOOTER_UPDATE_INTERVAL - elapsed, self._run_pending_update
+                )
+            return
+        self._render_footer()
+
+    def _run_pending_update(self) -> None:
+        """Run the update coalesced by update_footer_with_selection()."""
+        self._pending_update = None
+        if self.container_list.screen is None:
+            return
+        self._render_footer()
+
+    def _render_footer(self) -> None:
+        """Show the current selection in the status bar."""
+        self._last_update = time.monotonic()
         try:
-            status_bar = self.container_list.screen.query_one("#status_bar")
+            status_bar = self._status_bar
+            if status_bar is None or not status_bar.is_attached:
+                status_bar = self.container_list.screen.query_one("#status_bar")
+                self._status_bar = status_bar
 
             if self.container_list.selected_item is None:
                 self._update_no_selection(status_bar)
@@ -36,54 +167,42 @@ class FooterFormatter:
             item_type, item_id = self.container_list.selected_item
 
             # Route to appropriate handler based on item type
-            if item_type == "volume":
-                self._update_volume(status_bar, item_id)
-            elif item_type == "image":
-                self._update_image(status_bar, item_id)
-            elif item_type == "network":
-                self._update_network(status_bar, item_id)
-            elif item_type == "stack":
-                self._update_stack(status_bar, item_id)
-            elif item_type == "container":
-                self._update_container(status_bar, item_id)
-            else:
+            route = self._handlers.get(item_type)
+            if route is None:
                 self._update_invalid_selection(status_bar, item_type, item_id)
+                return
+            handler, data_attr = route
+            item_data = getattr(self.container_list, data_attr)
+            if item_data:
+                handler(status_bar, item_data)
 
         except Exception as e:
-            logger.error(f"Error updating status bar: {str(e)}", exc_info=True)
+            logger.error("Error updating status bar: %s", e, exc_info=True)
 
     def _update_no_selection(self, status_bar: Static) -> None:
         """Update footer when there's no selection."""
-        no_selection_text = Text("No selection", Style(color="white", bold=True))
-        status_bar.update(no_selection_text)
+        self._last_key = None
+        status_bar.update(_NO_SELECTION_TEXT)
         # Don't post SelectionChanged here - it's already handled by managers
 
-    def _update_volume(self, status_bar: Static, item_id: str) -> None:
+    def _update_volume(self, status_bar: Static, volume_data: Dict) -> None:
         """Update footer for volume selection."""
-        if not self.container_list.selected_volume_data:
+        key = (
+            "volume",
+            volume_data["name"],
+            volume_data["driver"],
+            volume_data["stack"],
+            volume_data.get("in_use", False),
+            tuple(volume_data.get("container_names") or ()),
+            volume_data.get("container_count", 0),
+        )
+        if self._is_unchanged(status_bar, key):
             return
 
-        volume_data = self.container_list.selected_volume_data
-        selection_text = Text()
-        selection_text.append("  Volume: ", Style(color="white"))
-        selection_text.append(
-            f"{volume_data['name']}", Style(color="magenta", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Driver: ", Style(color="white"))
-        selection_text.append(
-            f"{volume_data['driver']}", Style(color="blue", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Stack: ", Style(color="white"))
         if volume_data["stack"]:
-            selection_text.append(
-                f"{volume_data['stack']}", Style(color="green", bold=True)
-            )
+            stack = (volume_data["stack"], _GREEN_BOLD)
         else:
-            selection_text.append("None", Style(color="white", dim=True, bold=True))
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("In Use: ", Style(color="white"))
+            stack = ("None", _DIM_BOLD)
         if volume_data.get("in_use", False):
             container_names = volume_data.get("container_names", [])
             if container_names:
@@ -91,40 +210,46 @@ class FooterFormatter:
                 # Truncate if too long
                 if len(names_text) > 50:
                     names_text = names_text[:47] + "..."
-                selection_text.append(
-                    f"Yes ({names_text})",
-                    Style(color="green", bold=True),
-                )
+                in_use = (f"Yes ({names_text})", _GREEN_BOLD)
             else:
-                selection_text.append(
+                in_use = (
                     f"Yes ({volume_data.get('container_count', 0)} containers)",
-                    Style(color="green", bold=True),
+                    _GREEN_BOLD,
                 )
         else:
-            selection_text.append("No", Style(color="red", bold=True))
+            in_use = ("No", _RED_BOLD)
+        selection_text = _fill_labels(
+            _VOLUME_LABELS,
+            [
+                (volume_data["name"], _MAGENTA_BOLD),
+                (volume_data["driver"], _BLUE_BOLD),
+                stack,
+                in_use,
+            ],
+        )
         status_bar.update(selection_text)
         # SelectionChanged is posted by the volume manager
 
-    def _update_image(self, status_bar: Static, item_id: str) -> None:
+    def _update_image(self, status_bar: Static, image_data: Dict) -> None:
         """Update footer for image selection."""
-        if not self.container_list.selected_image_data:
+        tags = image_data["tags"]
+        containers = image_data.get("containers", "None")
+        key = (
+            "image",
+            image_data["id"],
+            tuple(tags or ()),
+            tuple(image_data.get("container_names") or ()),
+            containers if isinstance(containers, (int, str)) else str(containers),
+        )
+        if self._is_unchanged(status_bar, key):
             return
 
-        image_data = self.container_list.selected_image_data
-        selection_text = Text()
-        selection_text.append("  Image: ", Style(color="white"))
-        # Show first 12 chars of ID
-        selection_text.append(
-            f"{image_data['id'][:12]}", Style(color="yellow", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        if image_data["tags"]:
-            tags_text = ", ".join(image_data["tags"])
-            selection_text.append(f"{tags_text}", Style(color="cyan", bold=True))
+        if tags:
+            # Most images have a single tag, which needs no joining
+            tags_text = tags[0] if len(tags) == 1 else ", ".join(tags)
+            tags_part = (tags_text, _CYAN_BOLD)
         else:
-            selection_text.append("<none>", Style(color="blue", bold=True))
-        selection_text.append("\n")
-        selection_text.append("Containers: ", Style(color="white"))
+            tags_part = ("<none>", _BLUE_BOLD)
 
         # Display container names if available, otherwise fall back to count/string
         if "container_names" in image_data and image_data["container_names"]:
@@ -133,135 +258,128 @@ class FooterFormatter:
             # Truncate if too long
             if len(containers_text) > 50:
                 containers_text = containers_text[:47] + "..."
-            selection_text.append(containers_text, Style(color="green", bold=True))
+            containers = (containers_text, _GREEN_BOLD)
         elif isinstance(image_data.get("containers"), int):
             # If we have a count, show it
             count = image_data["containers"]
             if count > 0:
-                selection_text.append(f"{count}", Style(color="green", bold=True))
+                containers = (_count_text(count), _GREEN_BOLD)
             else:
-                selection_text.append("None", Style(color="white", dim=True, bold=True))
+                containers = ("None", _DIM_BOLD)
         else:
             # Fall back to whatever string we have
-            selection_text.append(
-                f"{image_data.get('containers', 'None')}",
-                Style(color="green", bold=True),
-            )
+            containers = (str(image_data.get("containers", "None")), _GREEN_BOLD)
+
+        selection_text = _fill_labels(
+            _IMAGE_LABELS,
+            [
+                # Show first 12 chars of ID
+                (image_data["id"][:12], _YELLOW_BOLD),
+                tags_part,
+                containers,
+            ],
+        )
         status_bar.update(selection_text)
         # SelectionChanged is posted by the image manager
 
-    def _update_network(self, status_bar: Static, item_id: str) -> None:
+    def _update_network(self, status_bar: Static, network_data: Dict) -> None:
         """Update footer for network selection."""
-        if not self.container_list.selected_network_data:
+        key = (
+            "network",
+            network_data["name"],
+            network_data["driver"],
+            network_data["scope"],
+            network_data["total_containers"],
+        )
+        if self._is_unchanged(status_bar, key):
             return
 
-        network_data = self.container_list.selected_network_data
-        selection_text = Text()
-        selection_text.append("  Network: ", Style(color="white"))
-        selection_text.append(f"{network_data['name']}", Style(color="cyan", bold=True))
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Driver: ", Style(color="white"))
-        selection_text.append(
-            f"{network_data['driver']}", Style(color="blue", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Scope: ", Style(color="white"))
-        selection_text.append(
-            f"{network_data['scope']}", Style(color="magenta", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Containers: ", Style(color="white"))
-        selection_text.append(
-            f"{network_data['total_containers']}",
-            Style(color="green", bold=True),
+        selection_text = _fill_labels(
+            _NETWORK_LABELS,
+            [
+                (network_data["name"], _CYAN_BOLD),
+                (network_data["driver"], _BLUE_BOLD),
+                (network_data["scope"], _MAGENTA_BOLD),
+                (_count_text(network_data["total_containers"]), _GREEN_BOLD),
+            ],
         )
         status_bar.update(selection_text)
         # SelectionChanged is posted by the network manager
 
-    def _update_stack(self, status_bar: Static, item_id: str) -> None:
+    def _update_stack(self, status_bar: Static, stack_data: Dict) -> None:
         """Update footer for stack selection."""
-        if not self.container_list.selected_stack_data:
+        key = (
+            "stack",
+            stack_data["name"],
+            stack_data["running"],
+            stack_data["exited"],
+            stack_data["total"],
+        )
+        if self._is_unchanged(status_bar, key):
             return
 
-        stack_data = self.container_list.selected_stack_data
-        selection_text = Text()
-        selection_text.append("  Stack: ", Style(color="white"))
-        selection_text.append(f"{stack_data['name']}", Style(color="white", bold=True))
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Running: ", Style(color="white"))
-        selection_text.append(
-            f"{stack_data['running']}", Style(color="green", bold=True)
-        )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Exited: ", Style(color="white"))
-        selection_text.append(
-            f"{stack_data['exited']}", Style(color="yellow", bold=True)
+        selection_text = _fill_labels(
+            _STACK_LABELS,
+            [
+                (stack_data["name"], _WHITE_BOLD),
+                (_count_text(stack_data["running"]), _GREEN_BOLD),
+                (_count_text(stack_data["exited"]), _YELLOW_BOLD),
+                (_count_text(stack_data["total"]), _CYAN_BOLD),
+            ],
         )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Total: ", Style(color="white"))
-        selection_text.append(f"{stack_data['total']}", Style(color="cyan", bold=True))
         status_bar.update(selection_text)
         # SelectionChanged is posted by the stack manager
 
-    def _update_container(self, status_bar: Static, item_id: str) -> None:
+    def _update_container(self, status_bar: Static, container_data: Dict) -> None:
         """Update footer for container selection."""
-        if not self.container_list.selected_container_data:
-            return
-
-        container_data = self.container_list.selected_container_data
-        selection_text = Text()
-
-        # First line
-        selection_text.append(
-            f"{container_data['name']}", Style(color="white", bold=True)
+        key = (
+            "container",
+            container_data["name"],
+            container_data["status"],
+            container_data.get("cpu"),
+            container_data.get("memory"),
+            "image_id" in container_data or "image_name" in container_data,
+            container_data.get("image_id"),
+            container_data.get("image_name"),
         )
-        selection_text.append(" | ", Style(color="white"))
-        selection_text.append("Status: ", Style(color="white"))
+        if self._is_unchanged(status_bar, key):
+            return
 
         # Style status based on value
         status = container_data["status"]
-        if "running" in status.lower():
-            status_style = Style(color="green", bold=True)
-        elif "exited" in status.lower():
-            status_style = Style(color="yellow", bold=True)
-        else:
-            status_style = Style(color="red", bold=True)
+        status_style = _STATUS_STYLES.get(status.split(" ", 1)[0].lower(), _RED_BOLD)
 
-        selection_text.append(status, status_style)
+        # First line
+        parts = [
+            (container_data["name"], _WHITE_BOLD),
+            (" | Status: ", _LABEL),
+            (status, status_style),
+        ]
 
         # Add CPU and memory if available
         if "cpu" in container_data and container_data["cpu"]:
-            selection_text.append(" | ", Style(color="white"))
-            selection_text.append("CPU: ", Style(color="white"))
-            selection_text.append(
-                f"{container_data['cpu']}", Style(color="cyan", bold=True)
-            )
+            parts.append((" | CPU: ", _LABEL))
+            parts.append((container_data["cpu"], _CYAN_BOLD))
 
         if "memory" in container_data and container_data["memory"]:
-            selection_text.append(" | ", Style(color="white"))
-            selection_text.append("Memory: ", Style(color="white"))
-            selection_text.append(
-                f"{container_data['memory']}", Style(color="magenta", bold=True)
-            )
+            parts.append((" | Memory: ", _LABEL))
+            parts.append((container_data["memory"], _MAGENTA_BOLD))
 
         # Add second line with image information
         if "image_id" in container_data or "image_name" in container_data:
-            selection_text.append("\n  Image: ", Style(color="white"))
+            parts.append(("\n  Image: ", _LABEL))
 
             # Add image ID if available
             if "image_id" in container_data and container_data["image_id"]:
-                selection_text.append(
-                    f"{container_data['image_id']}", Style(color="yellow", bold=True)
-                )
+                parts.append((container_data["image_id"], _YELLOW_BOLD))
 
             # Add image name if available
             if "image_name" in container_data and container_data["image_name"]:
                 if "image_id" in container_data and container_data["image_id"]:
-                    selection_text.append(" - ", Style(color="white"))
-                selection_text.append(
-                    f"{container_data['image_name']}", Style(color="cyan", bold=True)
-                )
+                    parts.append((" - ", _LABEL))
+                parts.append((container_data["image_name"], _CYAN_BOLD))
 
+        selection_text = Text.assemble(*parts)
         status_bar.update(selection_text)
         # SelectionChanged is posted by the stack manager
 
@@ -269,10 +387,11 @@ class FooterFormatter:
         self, status_bar: Static, item_type: str, item_id: str
     ) -> None:
         """Update footer for invalid selection."""
-        logger.warning(f"Invalid selection: {item_type} - {item_id}")
+        self._last_key = None
+        logger.warning("Invalid selection: %s - %s", item_type, item_id)
         invalid_selection_text = Text(
             f"Invalid selection: {item_type} - {item_id}",
-            Style(color="red", bold=True),
+            _RED_BOLD,
         )
         status_bar.update(invalid_selection_text)
         # Don't post SelectionChanged for invalid selections
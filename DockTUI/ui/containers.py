@@ -2,6 +2,7 @@
 
 import logging
 import time
+from typing import Dict
 
 from rich.text import Text
 from textual.widgets import DataTable, Static
@@ -17,6 +18,21 @@ from .widgets.headers import NetworkHeader, StackHeader
 logger = logging.getLogger("DockTUI.containers")
 
 
+def group_by_stack(containers: list) -> dict:
+    """Bucket containers by stack, keeping the order they arrived in.
+
+    Args:
+        containers: List of container information, in any order
+
+    Returns:
+        dict: Mapping of stack names to that stack's containers
+    """
+    buckets = {}
+    for container in containers:
+        buckets.setdefault(container.stack, []).append(container)
+    return buckets
+
+
 class ContainerList(ContainerListBase):
     """A scrollable widget that displays Docker containers grouped by their stacks.
 
@@ -38,6 +54,14 @@ class ContainerList(ContainerListBase):
         self.loading_message = None
         self._initial_load_complete = False
 
+        # Docker snapshot currently rendered, used to skip no-op refreshes
+        self._state = None
+
+        # Transitional statuses (e.g. "stopping...") shown until Docker catches up,
+        # and when each was set
+        self._status_overrides: Dict[str, str] = {}
+        self._status_override_times: Dict[str, float] = {}
+
         # Initialize helper components
         self.footer_formatter = FooterFormatter(self)
         self.navigation_handler = NavigationHandler(self)
@@ -57,9 +81,9 @@ class ContainerList(ContainerListBase):
             or self.images_container not in self.children
         )
 
-        # Clear all tables to ensure fresh data
+        # Clear network tables to ensure fresh data; stack tables are only
+        # cleared for stacks whose containers changed
         self.network_manager.clear_tables()
-        self.stack_manager.clear_tables()
 
         # Reset tracking for new data
         self.image_manager.reset_tracking()
@@ -110,6 +134,108 @@ class ContainerList(ContainerListBase):
                 self.refresh()
             self._is_updating = False
 
+    def apply_state(
+        self,
+        networks: dict,
+        stacks: dict,
+        images: dict,
+        volumes: dict,
+        containers: list,
+        containers_by_stack: dict | None = None,
+    ) -> bool:
+        """Render a Docker snapshot, skipping the update if nothing changed.
+
+        The previous snapshot is kept so a refresh that returns identical data
+        doesn't clear and rebuild every section.
+
+        Args:
+            networks: Dictionary of network information
+            stacks: Dictionary of stack information
+            images: Dictionary of image information
+            volumes: Dictionary of volume information
+            containers: List of container information, grouped by stack as
+                returned by DockerManager.get_containers()
+            containers_by_stack: The containers already bucketed by
+                group_by_stack(), e.g. by the refresh worker. Built from
+                containers when omitted.
+
+        Returns:
+            bool: True if the UI was updated, False if the snapshot was unchanged
+        """
+        state = (networks, stacks, images, volumes, containers)
+        if state == self._state and self._is_state_current():
+            return False
+        # Rows rendered with status overrides must be redrawn once they clear
+        overrides_active = bool(self._status_overrides)
+
+        # Begin a batch update to prevent UI flickering
+        self.begin_update()
+        try:
+            # Process all stacks first
+            for stack_name, stack_info in stacks.items():
+                self.add_stack(
+                    stack_name,
+                    stack_info["config_file"],
+                    stack_info["running"],
+                    stack_info["exited"],
+                    stack_info["total"],
+                    stack_info.get("can_recreate", True),
+                    stack_info.get("has_compose_file", True),
+                )
+
+            # Process all images next
+            if images:
+                for image_info in images.values():
+                    self.add_image(image_info)
+            elif not self.images_section_collapsed and self.images_container:
+                # No images found, show message if section is expanded
+                self.image_manager.show_no_images_message()
+
+            preserved_id = self.image_manager._preserve_selected_image_id
+            if preserved_id:
+                if preserved_id in self.image_manager.image_rows:
+                    self.image_manager.select_image(preserved_id)
+                self.image_manager._preserve_selected_image_id = None
+
+            # Process all volumes after images
+            for volume_info in volumes.values():
+                self.add_volume(volume_info)
+
+            # Process all networks after volumes
+            for network_name, network_info in networks.items():
+                self.add_network(network_info)
+
+                # Add containers to the network in a single batch
+                if network_info["connected_containers"]:
+                    self.add_containers_to_network(
+                        network_name, network_info["connected_containers"]
+                    )
+
+            # Update each stack's containers in one batch
+            if containers_by_stack is None:
+                containers_by_stack = group_by_stack(containers)
+            for stack_name, stack_containers in containers_by_stack.items():
+                self.add_containers_to_stack(stack_name, stack_containers)
+        finally:
+            # Always end the update, even if cancelled
+            self.end_update()
+
+        self._state = None if overrides_active else state
+        return True
+
+    def _is_state_current(self) -> bool:
+        """Check whether the rendered rows still match the last applied snapshot.
+
+        Returns:
+            bool: False while status overrides or a pending image selection
+                need another render pass
+        """
+        return (
+            self._initial_load_complete
+            and not self._status_overrides
+            and self.image_manager._preserve_selected_image_id is None
+        )
+
     def _cleanup_removed_items(self) -> None:
         """Remove images, volumes, networks, and stacks that no longer exist."""
         # Delegate to managers
@@ -300,6 +426,7 @@ class ContainerList(ContainerListBase):
         self.container_rows.clear()
         self.network_rows.clear()
         self.remove_children()
+        self._state = None
 
     def add_image(self, image_data: dict) -> None:
         """Add or update an image section in the container list.
@@ -340,6 +467,15 @@ class ContainerList(ContainerListBase):
         """
         self.network_manager.add_container_to_network(network_name, container_data)
 
+    def add_containers_to_network(self, network_name: str, containers: list) -> None:
+        """Add a batch of containers to a network's table.
+
+        Args:
+            network_name: Name of the network the containers are connected to
+            containers: List of container information dictionaries
+        """
+        self.network_manager.add_containers_to_network(network_name, containers)
+
     def add_stack(
         self,
         name: str,
@@ -378,6 +514,17 @@ class ContainerList(ContainerListBase):
         # Update selected_container_data reference for backward compatibility
         self.selected_container_data = self.stack_manager.selected_container_data
 
+    def add_containers_to_stack(self, stack_name: str, containers: list) -> None:
+        """Add or update a batch of containers in their stack's table.
+
+        Args:
+            stack_name: Name of the stack the containers belong to
+            containers: List of container information dictionaries
+        """
+        self.stack_manager.add_containers_to_stack(stack_name, containers)
+        # Update selected_container_data reference for backward compatibility
+        self.selected_container_data = self.stack_manager.selected_container_data
+
     def on_mount(self) -> None:
         """Handle initial widget mount by focusing and expanding the first stack."""
         try:
@@ -422,7 +569,7 @@ class ContainerList(ContainerListBase):
                         # Blur the table to remove cursor highlight
                         table.blur()
         except Exception as e:
-            logger.error(f"Error during ContainerList mount: {str(e)}", exc_info=True)
+            logger.error("Error during ContainerList mount: %s", e, exc_info=True)
             raise
 
     def select_image(self, image_id: str) -> None:
@@ -522,17 +669,8 @@ class ContainerList(ContainerListBase):
         Args:
             container_id: The short ID of the container
         """
-        if (
-            hasattr(self, "_status_overrides")
-            and container_id in self._status_overrides
-        ):
-            del self._status_overrides[container_id]
-
-        if (
-            hasattr(self, "_status_override_times")
-            and container_id in self._status_override_times
-        ):
-            del self._status_override_times[container_id]
+        self._status_overrides.pop(container_id, None)
+        self._status_override_times.pop(container_id, None)
 
     def update_container_status(self, container_id: str, status: str) -> None:
         """Set a status override for a container.
@@ -542,13 +680,8 @@ class ContainerList(ContainerListBase):
             status: The new status to display (e.g., "starting...", "stopping...")
         """
         # Store the override status with timestamp - it will be used during the next refresh
-        if not hasattr(self, "_status_overrides"):
-            self._status_overrides = {}
-        if not hasattr(self, "_status_override_times"):
-            self._status_override_times = {}
-
         self._status_overrides[container_id] = status
-        self._status_override_times[container_id] = time.time()
+        self._status_override_times[container_id] = time.monotonic()
 
     def set_stack_containers_status(self, stack_name: str, command: str) -> None:
         """Set status overrides for all containers in a stack based on the operation.
@@ -582,7 +715,7 @@ class ContainerList(ContainerListBase):
                         current_status = str(row[2]).lower()  # Status column
                         containers_to_update.append((container_id, current_status))
                 except Exception as e:
-                    logger.error(f"Error getting row data: {e}")
+                    logger.error("Error getting row data: %s", e)
 
         # Set status overrides for each container based on the operation and current status
         updated_count = 0
@@ -615,7 +748,9 @@ class ContainerList(ContainerListBase):
                     containers_to_force_update.append((container_id, transition_status))
             except Exception as e:
                 logger.error(
-                    f"Error setting status for container {container_id}: {e}",
+                    "Error setting status for container %s: %s",
+                    container_id,
+                    e,
                     exc_info=True,
                 )
 
@@ -635,7 +770,9 @@ class ContainerList(ContainerListBase):
                         )
                 except Exception as e:
                     logger.error(
-                        f"Error forcing UI update for container {container_id}: {e}",
+                        "Error forcing UI update for container %s: %s",
+                        container_id,
+                        e,
                         exc_info=True,
                     )
 
@@ -658,7 +795,7 @@ class ContainerList(ContainerListBase):
                     if len(row) >= 1:
                         container_ids.append(str(row[0]))  # ID column
                 except Exception as e:
-                    logger.error(f"Error getting container ID from row: {e}")
+                    logger.error("Error getting container ID from row: %s", e)
 
         # Clear status for each container
         for container_id in container_ids:
@@ -764,9 +901,7 @@ class ContainerList(ContainerListBase):
                         container_id = str(table.get_cell_at((row, 0)))
                         self.select_container(container_id)
                 except Exception as e:
-                    logger.error(
-                        f"Error handling row selection: {str(e)}", exc_info=True
-                    )
+                    logger.error("Error handling row selection: %s", e, exc_info=True)
                 break
 
     def action_cursor_up(self) -> None:
@@ -36,6 +36,8 @@ class ImageManager:
         )
         # Store full image data for each image ID
         self._image_data_cache: Dict[str, Dict] = {}
+        # Image ID of a selection to restore while rows are re-added
+        self._pending_selection: Optional[str] = None
 
         # For compatibility with existing structure
         self.image_headers = {}  # Empty dict for compatibility
@@ -132,7 +134,7 @@ class ImageManager:
             # Let the table handle its own height based on content
 
             logger.debug(
-                f"Images table initialized with {self.images_table.row_count} rows"
+                "Images table initialized with %s rows", self.images_table.row_count
             )
 
     def add_image(self, image_data: dict) -> None:
@@ -245,14 +247,11 @@ class ImageManager:
             row_index = self.images_table.row_count - 1
             self.image_rows[image_id] = row_index
             logger.debug(
-                f"Added image {image_id} - total rows: {self.images_table.row_count}"
+                "Added image %s - total rows: %s", image_id, self.images_table.row_count
             )
 
             # Check if this was the previously selected image
-            if (
-                hasattr(self, "_pending_selection")
-                and self._pending_selection == image_id
-            ):
+            if self._pending_selection == image_id:
                 # Restore the selection
                 self.images_table.add_class("has-selection")
                 self.images_table.move_cursor(row=row_index)
@@ -322,7 +321,7 @@ class ImageManager:
                 if row.key:
                     self.image_rows[row.key] = idx
         except Exception as e:
-            logger.error(f"Error removing image {image_id} from table: {e}")
+            logger.error("Error removing image %s from table: %s", image_id, e)
 
     def cleanup_removed_images(self) -> None:
         """Remove images that are no longer present."""
@@ -334,7 +333,7 @@ class ImageManager:
                 if image_id not in self._removed_images:
                     images_to_remove.append(image_id)
 
-        logger.debug(f"Cleaning up {len(images_to_remove)} removed images")
+        logger.debug("Cleaning up %s removed images", len(images_to_remove))
         for image_id in images_to_remove:
             self.remove_image(image_id)
 
@@ -353,7 +352,8 @@ class ImageManager:
         # Skip sorting after cleanup to prevent UI flicker
         # The table order is already correct after removing individual rows
         logger.debug(
-            f"Cleanup complete. Table has {self.images_table.row_count if self.images_table else 0} rows"
+            "Cleanup complete. Table has %s rows",
+            self.images_table.row_count if self.images_table else 0,
         )
 
     def select_image(self, image_id: str) -> None:
@@ -448,14 +448,14 @@ class ImageManager:
                     break
 
             if not image_id:
-                logger.warning(f"Could not find image_id for row_index {row_index}")
+                logger.warning("Could not find image_id for row_index %s", row_index)
                 return False
 
             # Use the parent's select_image method which handles everything properly
             self.parent.select_image(image_id)
             return True
         except Exception as e:
-            logger.error(f"Error handling image selection: {e}")
+            logger.error("Error handling image selection: %s", e)
             return False
 
     def toggle_images_section(self) -> None:
@@ -548,7 +548,7 @@ class ImageManager:
                 if image_id and len(cells) >= 7:
                     rows_data.append((image_id, tuple(cells)))
             except Exception as e:
-                logger.debug(f"Error getting row data at index {row_idx}: {e}")
+                logger.debug("Error getting row data at index %s: %s", row_idx, e)
 
         def _created_ts(created: str) -> float:
             """Convert 'YYYY-MM-DD' or ISO-8601 string to POSIX seconds.
@@ -96,7 +96,7 @@ class NetworkManager:
         """
         if network_name not in self.network_tables:
             logger.warning(
-                f"Network {network_name} not found when trying to add container"
+                "Network %s not found when trying to add container", network_name
             )
             return
 
@@ -120,7 +120,49 @@ class NetworkManager:
             )
         except Exception as e:
             logger.error(
-                f"Error adding container {container_id} to network {network_name}: {str(e)}",
+                "Error adding container %s to network %s: %s",
+                container_id,
+                network_name,
+                e,
+                exc_info=True,
+            )
+
+    def add_containers_to_network(self, network_name: str, containers: list) -> None:
+        """Add a batch of containers to a network's table in a single insert.
+
+        Args:
+            network_name: Name of the network the containers are connected to
+            containers: List of NetworkContainerInfo records
+        """
+        if network_name not in self.network_tables:
+            logger.warning(
+                "Network %s not found when trying to add containers", network_name
+            )
+            return
+
+        table = self.network_tables[network_name]
+
+        try:
+            first_row = table.row_count
+            table.add_rows(
+                (
+                    container_data.id,
+                    container_data.name,
+                    container_data.stack,
+                    container_data.ip,
+                )
+                for container_data in containers
+            )
+            for offset, container_data in enumerate(containers):
+                self.network_rows[f"{network_name}:{container_data.id}"] = (
+                    network_name,
+                    first_row + offset,
+                )
+        except Exception as e:
+            logger.error(
+                "Error adding containers to network %s: %s",
+                network_name,
+                e,
                 exc_info=True,
             )
 
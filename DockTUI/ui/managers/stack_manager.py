@@ -1,6 +1,7 @@
 """Stack-specific functionality for the container list widget."""
 
 import logging
+import time
 from typing import Dict, Optional, Tuple
 
 from textual.containers import Container
@@ -27,10 +28,18 @@ class StackManager:
         self.container_rows: Dict[str, Tuple[str, int]] = {}
         self.expanded_stacks = set()
         self._stacks_in_new_data = set()
+        # Header values last rendered for each stack, used to skip no-op updates
+        self._stack_fingerprints: Dict[str, Tuple] = {}
+        # Containers last rendered into each stack table, and the tables that
+        # received containers during the current update
+        self._table_snapshots: Dict[str, Optional[Tuple]] = {}
+        self._tables_in_new_data = set()
         self.selected_stack_data: Optional[Dict] = None
         # Cache full container data for each container ID
         self._container_data_cache: Dict[str, Dict] = {}
         self.selected_container_data: Optional[Dict] = None
+        # (stack name, container ID) of a selection to restore while rows are re-added
+        self._pending_selection: Optional[Tuple[str, str]] = None
 
     def add_stack(
         self,
@@ -56,6 +65,17 @@ class StackManager:
         # Track that this stack exists in the new data
         self._stacks_in_new_data.add(name)
 
+        fingerprint = (
+            config_file,
+            running,
+            exited,
+            total,
+            can_recreate,
+            has_compose_file,
+        )
+        header_changed = self._stack_fingerprints.get(name) != fingerprint
+        self._stack_fingerprints[name] = fingerprint
+
         if name not in self.stack_tables:
             header = StackHeader(
                 name,
@@ -67,6 +87,7 @@ class StackManager:
                 has_compose_file,
             )
             table = self.parent.create_stack_table(name)
+            self._table_snapshots.pop(name, None)
 
             self.stack_headers[name] = header
             self.stack_tables[name] = table
@@ -90,7 +111,7 @@ class StackManager:
                     "can_recreate": can_recreate,
                     "has_compose_file": has_compose_file,
                 }
-        else:
+        elif header_changed:
             header = self.stack_headers[name]
             was_expanded = header.expanded
             header.running = running
@@ -141,16 +162,11 @@ class StackManager:
         status = container_data["status"]
         actual_status = status.lower()
 
-        if (
-            hasattr(self.parent, "_status_overrides")
-            and container_id in self.parent._status_overrides
-        ):
+        if container_id in self.parent._status_overrides:
             override = self.parent._status_overrides[container_id]
 
             # Get the time when this override was set
-            override_time = None
-            if hasattr(self.parent, "_status_override_times"):
-                override_time = self.parent._status_override_times.get(container_id)
+            override_time = self.parent._status_override_times.get(container_id)
 
             # Only apply the override if it makes sense given the actual status
             # For example, don't show "stopping..." if container is already exited
@@ -172,9 +188,7 @@ class StackManager:
                 if actual_status in ["running"]:
                     should_apply_override = False
                 elif override_time:
-                    import time
-
-                    elapsed = time.time() - override_time
+                    elapsed = time.monotonic() - override_time
                     should_apply_override = elapsed < 10.0  # 10 second timeout
                 else:
                     should_apply_override = True
@@ -189,11 +203,7 @@ class StackManager:
             else:
                 # Clear the override since it's no longer relevant
                 del self.parent._status_overrides[container_id]
-                if (
-                    hasattr(self.parent, "_status_override_times")
-                    and container_id in self.parent._status_override_times
-                ):
-                    del self.parent._status_override_times[container_id]
+                self.parent._status_override_times.pop(container_id, None)
 
         # Get the container status for styling
         # Note: 'status' variable might have override values like "restarting...", so we use that
@@ -232,10 +242,10 @@ class StackManager:
                 self.container_rows[container_id] = (stack_name, row_key)
 
                 # Log container status for debugging
-                logger.debug(f"Container {container_id}: status={status}")
+                logger.debug("Container %s: status=%s", container_id, status)
 
                 # Check if this was the previously selected row
-                if hasattr(self, "_pending_selection") and self._pending_selection:
+                if self._pending_selection:
                     pending_stack, pending_container_id = self._pending_selection
                     if (
                         pending_stack == stack_name
@@ -245,7 +255,7 @@ class StackManager:
                         table.add_class("has-selection")
                         table._selected_row_key = container_id
                         table.move_cursor(row=row_key)
-                        delattr(self, "_pending_selection")
+                        self._pending_selection = None
             else:
                 # For individual updates outside of a batch update cycle,
                 # check if this container already exists in the table
@@ -268,7 +278,9 @@ class StackManager:
                                     self.container_rows[cid] = (cstack, crow - 1)
                         except Exception as e:
                             logger.error(
-                                f"Error removing container {container_id} from old stack: {str(e)}",
+                                "Error removing container %s from old stack: %s",
+                                container_id,
+                                e,
                                 exc_info=True,
                             )
 
@@ -372,7 +384,9 @@ class StackManager:
 
                         except Exception as e:
                             logger.error(
-                                f"Error updating container {container_id}: {str(e)}",
+                                "Error updating container %s: %s",
+                                container_id,
+                                e,
                                 exc_info=True,
                             )
                 else:
@@ -383,9 +397,35 @@ class StackManager:
 
         except Exception as e:
             logger.error(
-                f"Error adding container {container_id}: {str(e)}", exc_info=True
+                "Error adding container %s: %s", container_id, e, exc_info=True
             )
 
+    def add_containers_to_stack(self, stack_name: str, containers: list) -> None:
+        """Add or update a batch of containers in a stack's table.
+
+        Args:
+            stack_name: Name of the stack the containers belong to
+            containers: List of container information dictionaries
+        """
+        if stack_name not in self.stack_tables:
+            self.add_stack(stack_name, "N/A", 0, 0, 0)
+        self._tables_in_new_data.add(stack_name)
+
+        # Rows showing a status override must be re-rendered until it clears
+        overrides = self.parent._status_overrides
+        has_overrides = bool(overrides) and any(
+            container_data["id"] in overrides for container_data in containers
+        )
+        snapshot = tuple(containers)
+        if not has_overrides and self._table_snapshots.get(stack_name) == snapshot:
+            # Same containers as the last render, so the rows are still current
+            return
+
+        self._clear_table(stack_name)
+        for container_data in containers:
+            self.add_container_to_stack(stack_name, container_data)
+        self._table_snapshots[stack_name] = None if has_overrides else snapshot
+
     def remove_stack(self, stack_name: str) -> None:
         """Remove a stack and its associated UI elements.
 
@@ -407,6 +447,8 @@ class StackManager:
                             break
 
         # Remove from tracking dictionaries
+        self._stack_fingerprints.pop(stack_name, None)
+        self._table_snapshots.pop(stack_name, None)
         if stack_name in self.stack_headers:
             del self.stack_headers[stack_name]
         if stack_name in self.stack_tables:
@@ -486,7 +528,7 @@ class StackManager:
         """
         # Ensure container_id is a string (might be ContainerText from UI)
         container_id = str(container_id)
-        logger.debug(f"select_container called with container_id: {container_id}")
+        logger.debug("select_container called with container_id: %s", container_id)
         if container_id in self.container_rows:
             # Clear all selections using the shared method
             self.parent.clear_all_selections()
@@ -573,7 +615,7 @@ class StackManager:
                 )
             )
         else:
-            logger.error(f"Container ID {container_id} not found in container_rows")
+            logger.error("Container ID %s not found in container_rows", container_id)
 
     def _clear_row_selection(self, table: DataTable) -> None:
         """Clear row selection by removing stored selection state."""
@@ -582,32 +624,38 @@ class StackManager:
 
     def _set_row_selection(self, table: DataTable, container_id: str) -> None:
         """Store the selected row key for custom rendering."""
-        logger.debug(f"_set_row_selection called for container_id: {container_id}")
+        logger.debug("_set_row_selection called for container_id: %s", container_id)
         # Store the selected row key on the table
         table._selected_row_key = container_id
 
-    def clear_tables(self) -> None:
-        """Clear all stack tables."""
-        # Save which table has selection and which row before clearing
-        selected_table_and_row = None
-        for stack_name, table in self.stack_tables.items():
-            if table.has_class("has-selection") and hasattr(table, "_selected_row_key"):
-                selected_table_and_row = (stack_name, table._selected_row_key)
-                break
-
-        for table in self.stack_tables.values():
-            table.clear()
-            # Remove has-selection class when clearing
-            table.remove_class("has-selection")
-        self.container_rows.clear()
-
-        # Store the selection info for restoration later
-        if selected_table_and_row:
-            self._pending_selection = selected_table_and_row
+    def _clear_table(self, stack_name: str) -> None:
+        """Clear a stack's table so its containers can be re-added.
+
+        Args:
+            stack_name: Name of the stack whose table should be cleared
+        """
+        table = self.stack_tables[stack_name]
+
+        # Save the selected row so it can be restored when rows are re-added
+        if table.has_class("has-selection") and hasattr(table, "_selected_row_key"):
+            self._pending_selection = (stack_name, table._selected_row_key)
+
+        table.clear()
+        # Remove has-selection class when clearing
+        table.remove_class("has-selection")
+        self._table_snapshots.pop(stack_name, None)
+
+        for container_id in [
+            cid
+            for cid, (cstack, _) in self.container_rows.items()
+            if cstack == stack_name
+        ]:
+            del self.container_rows[container_id]
 
     def reset_tracking(self) -> None:
         """Reset tracking for new data updates."""
         self._stacks_in_new_data = set()
+        self._tables_in_new_data = set()
 
     def save_expanded_state(self) -> None:
         """Save the current expanded state of stacks."""
@@ -625,6 +673,14 @@ class StackManager:
         for stack_name in stacks_to_remove:
             self.remove_stack(stack_name)
 
+        # Empty the tables of remaining stacks that no longer have containers
+        for stack_name in list(self._table_snapshots):
+            if (
+                stack_name not in self._tables_in_new_data
+                and stack_name in self.stack_tables
+            ):
+                self._clear_table(stack_name)
+
     def get_existing_containers(self) -> dict:
         """Get existing stack containers for updates."""
         existing_stack_containers = {}
@@ -171,7 +171,7 @@ class VolumeManager:
             return remaining_volumes[0] if remaining_volumes else None
 
         except Exception as e:
-            logger.error(f"Error finding next selection: {e}")
+            logger.error("Error finding next selection: %s", e)
             return None
 
     def remove_volume(self, volume_name: str) -> None:
@@ -186,7 +186,7 @@ class VolumeManager:
                 self.volume_table.remove_row(row_key)
                 del self.volume_rows[volume_name]
             except Exception as e:
-                logger.error(f"Error removing volume {volume_name} from table: {e}")
+                logger.error("Error removing volume %s from table: %s", volume_name, e)
 
         # Remove from volume data
         if volume_name in self._volume_data:
@@ -240,7 +240,7 @@ class VolumeManager:
                 if row_key in self.volume_table.rows:
                     self.volume_table.move_cursor(row=row_key)
             except Exception as e:
-                logger.error(f"Error moving cursor to volume {volume_name}: {e}")
+                logger.error("Error moving cursor to volume %s: %s", volume_name, e)
 
             # Update the footer and cursor visibility
             self.parent._update_footer_with_selection()
@@ -284,7 +284,7 @@ class VolumeManager:
             return
 
         logger.debug(
-            f"flush_pending_volumes: Processing {len(self._pending_volumes)} volumes"
+            "flush_pending_volumes: Processing %s volumes", len(self._pending_volumes)
         )
 
         # Sort volumes: in-use first, then by name descending
@@ -314,7 +314,9 @@ class VolumeManager:
         sorted_volumes = in_use_volumes + not_in_use_volumes
 
         logger.debug(
-            f"flush_pending_volumes: {len(in_use_volumes)} in-use, {len(not_in_use_volumes)} not in-use"
+            "flush_pending_volumes: %s in-use, %s not in-use",
+            len(in_use_volumes),
+            len(not_in_use_volumes),
         )
 
         # Add volumes to table in sorted order
@@ -370,7 +372,7 @@ class VolumeManager:
             return
 
         logger.debug(
-            f"sort_volume_table: Starting sort with {self.volume_table.row_count} rows"
+            "sort_volume_table: Starting sort with %s rows", self.volume_table.row_count
         )
 
         # Save the currently selected volume if any
@@ -394,11 +396,11 @@ class VolumeManager:
                 {"key": row_key, "cells": row_cells, "name": name, "in_use": in_use}
             )
 
-        logger.debug(f"sort_volume_table: Collected {len(rows_data)} rows")
+        logger.debug("sort_volume_table: Collected %s rows", len(rows_data))
 
         # Log first few rows before sorting
         for i, row in enumerate(rows_data[:5]):
-            logger.debug(f"  Row {i}: name={row['name']}, in_use={row['in_use']}")
+            logger.debug("  Row %s: name=%s, in_use=%s", i, row["name"], row["in_use"])
 
         # Sort: First by in_use (Yes before No), then by name descending
         # We use a custom sort key that returns a tuple:
@@ -424,7 +426,9 @@ class VolumeManager:
                 not_in_use_volumes.append(row)
 
         logger.debug(
-            f"sort_volume_table: {len(in_use_volumes)} in-use, {len(not_in_use_volumes)} not in-use"
+            "sort_volume_table: %s in-use, %s not in-use",
+            len(in_use_volumes),
+            len(not_in_use_volumes),
         )
 
         # Reverse each group to get descending name order
@@ -437,7 +441,7 @@ class VolumeManager:
         # Log first few rows after sorting
         logger.debug("sort_volume_table: After sorting:")
         for i, row in enumerate(sorted_rows[:5]):
-            logger.debug(f"  Row {i}: name={row['name']}, in_use={row['in_use']}")
+            logger.debug("  Row %s: name=%s, in_use=%s", i, row["name"], row["in_use"])
 
         # Clear the table
         self.volume_table.clear()
@@ -451,7 +455,8 @@ class VolumeManager:
             self.volume_rows[volume_name] = row_key
 
         logger.debug(
-            f"sort_volume_table: Sort completed, table now has {self.volume_table.row_count} rows"
+            "sort_volume_table: Sort completed, table now has %s rows",
+            self.volume_table.row_count,
         )
 
         # Restore selection if there was one
@@ -7,6 +7,9 @@ from rich.style import Style
 from rich.text import Text
 from textual.widgets import Static
 
+# Shared initial status bar message, built once instead of on every mount
+_NO_SELECTION_TEXT = Text("No selection", Style(color="white", bold=True))
+
 
 class ErrorDisplay(Static):
     """A widget that displays error messages with error styling.
@@ -53,8 +56,7 @@ class StatusBar(Static):
 
     def __init__(self):
         """Initialize the status bar with an empty message."""
-        no_selection_text = Text("No selection", Style(color="white", bold=True))
-        super().__init__(no_selection_text)
+        super().__init__(_NO_SELECTION_TEXT)
 
     def update(self, message: Union[str, Text]) -> None:
         """Update the status bar with a new message.
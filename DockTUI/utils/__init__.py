@@ -1,5 +1,5 @@
 """Utility modules for DockTUI."""
 
-from .logging import setup_logging
+from .logging import setup_logging, stop_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["setup_logging", "stop_logging"]
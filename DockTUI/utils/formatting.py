@@ -18,3 +18,19 @@ def format_bytes(size_bytes: int) -> str:
         return f"{size_bytes / 1024:.1f} KB"
     else:
         return f"{size_bytes} B"
+
+
+def format_memory(size_bytes: float) -> str:
+    """Format a memory size with binary units, as shown by the docker stats CLI.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Formatted string with one decimal and a binary unit (B, KiB, MiB, ...)
+    """
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f}{unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f}PiB"
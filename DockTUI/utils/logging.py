@@ -1,17 +1,52 @@
 """Logging configuration for DockTUI."""
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
 
+# Background listener that writes queued log records to disk
+_log_listener = None
+# Buffer between the listener and the log file, so records are written in batches
+_log_buffer = None
+
+# Number of records buffered before they are written to the log file
+LOG_BUFFER_CAPACITY = 1024
+
+
+def stop_logging():
+    """Flush pending log records to disk and stop the background listener.
+
+    Safe to call more than once; later calls do nothing.
+    """
+    global _log_listener, _log_buffer
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    if _log_buffer is not None:
+        file_handler = _log_buffer.target
+        _log_buffer.close()
+        _log_buffer = None
+        if file_handler is not None:
+            file_handler.close()
+
 
 def setup_logging():
     """Configure logging to write to file in the user's home directory.
 
     Creates a .DockTUI/logs directory in the user's home directory and sets up
     file-based logging with detailed formatting. Only enables logging if DEBUG mode
-    is active.
+    is active. Records are handed to a queue and written by a background listener
+    thread, so callers (including the UI thread) never block on file I/O. The
+    listener buffers records and writes them in batches, flushing immediately
+    on errors so crash diagnostics still reach the file.
 
     Returns:
         Path: Path to the log file, or None if logging is disabled
@@ -39,8 +74,20 @@ def setup_logging():
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
 
+    global _log_listener, _log_buffer
+    _log_buffer = MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, _log_buffer)
+    _log_listener.start()
+    atexit.register(stop_logging)
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     return log_file
@@ -0,0 +1,154 @@
+"""Tests for reading container stats from the cgroup filesystem."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from DockTUI.docker_mgmt.cgroup_stats import CgroupStatsReader, _keyed_value
+
+CONTAINER_ID = "a" * 64
+
+
+def write_files(directory, files):
+    """Create a cgroup directory holding the given files."""
+    directory.mkdir(parents=True)
+    for name, content in files.items():
+        (directory / name).write_text(content)
+
+
+def test_keyed_value():
+    """Test single values are found in "key value" files by exact key."""
+    data = b"anon 10\ninactive_anon 20\ntotal_inactive_file 30\ninactive_file 40"
+
+    assert _keyed_value(data, b"anon") == 10
+    assert _keyed_value(data, b"inactive_file") == 40
+    assert _keyed_value(data + b"\n", b"inactive_file") == 40
+    assert _keyed_value(data, b"total_inactive_file") == 30
+    assert _keyed_value(data, b"file") is None
+
+
+class TestCgroupStatsReader:
+    """Test cases for CgroupStatsReader."""
+
+    @pytest.fixture
+    def v2_root(self, tmp_path):
+        """Create a cgroup v2 tree with one container."""
+        (tmp_path / "cgroup.controllers").write_text("cpu memory pids\n")
+        write_files(
+            tmp_path / "system.slice" / f"docker-{CONTAINER_ID}.scope",
+            {
+                "cpu.stat": "usage_usec 1000\nuser_usec 600\nsystem_usec 400\n",
+                "memory.current": "3145728\n",
+                "memory.stat": "anon 1048576\ninactive_file 1048576\n",
+                "memory.max": "8388608\n",
+                "pids.current": "4\n",
+            },
+        )
+        return tmp_path
+
+    def test_read_v2(self, v2_root):
+        """Test reading a container's stats from cgroup v2 files."""
+        reader = CgroupStatsReader(v2_root)
+
+        stats = reader.read(CONTAINER_ID)
+
+        assert stats == {
+            "cpu": "0.00%",
+            "memory": "2.0MiB / 8.0MiB",
+            "memory_percent": "25.00",
+            "pids": "4",
+        }
+
+    def test_cpu_percent_since_previous_read(self, v2_root):
+        """Test CPU usage is measured between two reads."""
+        reader = CgroupStatsReader(v2_root)
+        cpu_stat = (
+            v2_root / "system.slice" / f"docker-{CONTAINER_ID}.scope" / "cpu.stat"
+        )
+
+        with patch("DockTUI.docker_mgmt.cgroup_stats.time") as mock_time:
+            mock_time.monotonic_ns.return_value = 0
+            reader.read(CONTAINER_ID)
+
+            # Half a second of CPU time during one second
+            cpu_stat.write_text("usage_usec 501000\n")
+            mock_time.monotonic_ns.return_value = 1_000_000_000
+            assert reader.read(CONTAINER_ID)["cpu"] == "50.00%"
+
+    def test_unlimited_memory_uses_host_memory(self, v2_root):
+        """Test containers without a memory limit are measured against the host."""
+        cgroup = v2_root / "system.slice" / f"docker-{CONTAINER_ID}.scope"
+        (cgroup / "memory.max").write_text("max\n")
+
+        with patch(
+            "DockTUI.docker_mgmt.cgroup_stats._host_memory", return_value=16 * 1024**2
+        ):
+            reader = CgroupStatsReader(v2_root)
+
+        assert reader.read(CONTAINER_ID)["memory"] == "2.0MiB / 16.0MiB"
+
+    def test_read_v1(self, tmp_path):
+        """Test reading a container's stats from cgroup v1 controllers."""
+        write_files(
+            tmp_path / "cpuacct" / "docker" / CONTAINER_ID,
+            {"cpuacct.usage": "123456789\n"},
+        )
+        write_files(
+            tmp_path / "memory" / "docker" / CONTAINER_ID,
+            {
+                "memory.usage_in_bytes": "2097152\n",
+                "memory.stat": "cache 0\ntotal_inactive_file 1048576\n",
+                "memory.limit_in_bytes": "4194304\n",
+            },
+        )
+        write_files(
+            tmp_path / "pids" / "docker" / CONTAINER_ID,
+            {"pids.current": "9\n"},
+        )
+
+        stats = CgroupStatsReader(tmp_path).read(CONTAINER_ID)
+
+        assert stats["memory"] == "1.0MiB / 4.0MiB"
+        assert stats["memory_percent"] == "25.00"
+        assert stats["pids"] == "9"
+
+    def test_unknown_container(self, v2_root):
+        """Test containers without a visible cgroup aren't read."""
+        assert CgroupStatsReader(v2_root).read("b" * 64) is None
+
+    def test_unreadable_cgroup(self, v2_root):
+        """Test a cgroup missing files isn't read."""
+        cgroup = v2_root / "system.slice" / f"docker-{CONTAINER_ID}.scope"
+        (cgroup / "pids.current").unlink()
+
+        assert CgroupStatsReader(v2_root).read(CONTAINER_ID) is None
+
+    def test_forget_others(self, v2_root):
+        """Test CPU samples of containers no longer read are dropped."""
+        reader = CgroupStatsReader(v2_root)
+        reader.read(CONTAINER_ID)
+
+        reader.forget_others([CONTAINER_ID])
+        assert CONTAINER_ID in reader._prev_cpu
+
+        reader.forget_others([])
+        assert reader._prev_cpu == {}
+
+    def test_files_stay_open_between_reads(self, v2_root):
+        """Test a container's files are opened once and re-read in place."""
+        reader = CgroupStatsReader(v2_root)
+        pids = (
+            v2_root / "system.slice" / f"docker-{CONTAINER_ID}.scope" / "pids.current"
+        )
+
+        with patch(
+            "DockTUI.docker_mgmt.cgroup_stats.os.open", wraps=os.open
+        ) as mock_open:
+            reader.read(CONTAINER_ID)
+            pids.write_text("12\n")
+            assert reader.read(CONTAINER_ID)["pids"] == "12"
+
+        assert mock_open.call_count == 5
+        reader.close()
+        assert reader._files == {}
@@ -0,0 +1,66 @@
+"""Tests for the container event watcher."""
+
+import threading
+from unittest.mock import Mock
+
+from DockTUI.docker_mgmt.container_events import ContainerEventWatcher
+
+
+class TestContainerEventWatcher:
+    """Test cases for ContainerEventWatcher."""
+
+    def test_collects_changed_containers(self):
+        """Test each event's container is collected once until taken."""
+        client = Mock()
+        client.events.return_value = iter(
+            [
+                b'{"Type": "container", "Action": "die", "id": "c1"}\n',
+                b'{"Type": "container", "Action": "rename", "Actor": {"ID": "c2"}}\n',
+                b'{"Type": "container", "Action": "start", "id": "c1"}\n',
+            ]
+        )
+
+        watcher = ContainerEventWatcher(client)
+        watcher._thread.join(timeout=1)
+
+        client.events.assert_called_once_with(
+            decode=False, filters={"type": "container"}
+        )
+        assert watcher.take_changed() == {"c1", "c2"}
+        assert watcher.take_changed() == set()
+        # The stream ended, so the watcher can't be relied on anymore
+        assert not watcher.active
+
+    def test_inactive_when_events_unavailable(self):
+        """Test a failed subscription leaves the watcher inactive."""
+        client = Mock()
+        client.events.side_effect = Exception("permission denied")
+
+        watcher = ContainerEventWatcher(client)
+
+        assert not watcher.active
+        assert watcher.take_changed() == set()
+        watcher.stop()
+
+    def test_stop_closes_stream(self):
+        """Test stopping the watcher closes the event stream."""
+        closed = threading.Event()
+
+        class Stream:
+            def __iter__(self):
+                closed.wait(1)
+                return iter(())
+
+            def close(self):
+                closed.set()
+
+        client = Mock()
+        client.events.return_value = Stream()
+
+        watcher = ContainerEventWatcher(client)
+        assert watcher.active
+        watcher.stop()
+        watcher._thread.join(timeout=1)
+
+        assert closed.is_set()
+        assert not watcher.active
@@ -0,0 +1,17 @@
+"""Tests for decoding Docker's newline-delimited JSON streams."""
+
+from DockTUI.docker_mgmt.json_lines import decode_json_lines
+
+
+def test_decodes_objects_across_chunks():
+    """Test objects are decoded whole however the stream was chunked."""
+    chunks = [b'{"a": 1}\n{"b"', b": 2}", b"\n\n", b'{"c": 3}']
+
+    assert list(decode_json_lines(chunks)) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+def test_decodes_text_chunks():
+    """Test an unchunked error response, returned as text, is still decoded."""
+    assert list(decode_json_lines(['{"message": "no such container"}'])) == [
+        {"message": "no such container"}
+    ]
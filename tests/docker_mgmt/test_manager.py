@@ -1,13 +1,31 @@
+import json
+import logging
 import os
+import subprocess
+import sys
 import tempfile
 import threading
+import time
 from typing import Dict, List
 from unittest.mock import MagicMock, Mock, call, patch
 
 import docker
 import pytest
 
-from DockTUI.docker_mgmt.manager import DockerManager
+from DockTUI.docker_mgmt.manager import (
+    COMPOSE_FILE_CHECK_TTL,
+    STACKS_CACHE_TTL,
+    DockerManager,
+    _docker_executable,
+    _split_config_files,
+)
+from DockTUI.docker_mgmt.types import ContainerInfo, NetworkContainerInfo
+
+
+def stream_stats(container, chunks):
+    """Make a mock container's stats stream yield the given chunks."""
+    response = container.client.api.get.return_value
+    response.iter_content.return_value = chunks
 
 
 class TestDockerManager:
@@ -21,7 +39,10 @@ class TestDockerManager:
         """Create a DockerManager instance with mock client."""
         with patch("DockTUI.docker_mgmt.manager.docker.from_env") as mock_from_env:
             mock_from_env.return_value = mock_docker_client
-            return DockerManager()
+            manager = DockerManager()
+        # Keep stats tests independent of the host's cgroups
+        manager._cgroup_stats = Mock(read=Mock(return_value=None))
+        return manager
 
     def test_init_success(self):
         """Test successful DockerManager initialization."""
@@ -40,6 +61,31 @@ class TestDockerManager:
             with pytest.raises(docker.errors.DockerException):
                 DockerManager()
 
+    def test_close(self, manager, mock_docker_client):
+        """Test close releases the Docker client."""
+        manager.close()
+
+        mock_docker_client.close.assert_called_once()
+
+    def test_close_stops_stats_streams(self, manager, mock_docker_client):
+        """Test close stops the stats streams along with the client."""
+        stats_stream = Mock()
+        manager._stats_streams = {"run1": stats_stream}
+
+        manager.close()
+
+        stats_stream.stop.assert_called_once()
+        mock_docker_client.close.assert_called_once()
+
+    def test_close_error(self, manager, mock_docker_client):
+        """Test close logs rather than raises when the client fails to close."""
+        mock_docker_client.close.side_effect = Exception("Already closed")
+
+        with patch("DockTUI.docker_mgmt.manager.logger") as mock_logger:
+            manager.close()
+
+            mock_logger.error.assert_called_once()
+
     def test_check_compose_file_accessible_single_file(self, manager):
         """Test checking accessibility of a single compose file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -71,6 +117,26 @@ class TestDockerManager:
         """Test checking accessibility with empty path."""
         assert manager._check_compose_file_accessible("") is False
 
+    def test_is_compose_file_accessible_reuses_recent_check(self, manager):
+        """Test the compose file check is cached until it expires."""
+        with patch.object(
+            manager, "_check_compose_file_accessible", return_value=True
+        ) as mock_check, patch("DockTUI.docker_mgmt.manager.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            assert manager._is_compose_file_accessible("/compose.yml") is True
+            assert manager._is_compose_file_accessible("/compose.yml") is True
+            mock_check.assert_called_once_with("/compose.yml")
+
+            # Other files are checked separately
+            manager._is_compose_file_accessible("/other.yml")
+            assert mock_check.call_count == 2
+
+            # The result is checked again once it is stale
+            mock_check.return_value = False
+            mock_time.monotonic.return_value = 100.0 + COMPOSE_FILE_CHECK_TTL
+            assert manager._is_compose_file_accessible("/compose.yml") is False
+            assert mock_check.call_count == 3
+
     def test_get_compose_stacks(self, manager, mock_docker_client):
         """Test getting Docker Compose stacks."""
         mock_container1 = Mock()
@@ -120,8 +186,183 @@ class TestDockerManager:
         stacks = manager.get_compose_stacks()
         assert stacks == {}
 
+    def test_get_compose_stacks_logs_container_errors_without_traceback(
+        self, manager, mock_docker_client, caplog
+    ):
+        """Test per-container errors only carry a traceback with debug logging."""
+        broken = Mock(id="c1", attrs={})
+        broken.name = "broken"
+        type(broken).labels = property(lambda self: {}["missing"])
+        mock_docker_client.containers.list.return_value = [broken]
+
+        with caplog.at_level(logging.INFO, logger="DockTUI.docker_mgmt"):
+            manager.get_compose_stacks()
+        (record,) = [r for r in caplog.records if r.levelno == logging.ERROR]
+        assert not record.exc_info
+
+        manager._stacks_cache = (0.0, None, {})
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="DockTUI.docker_mgmt"):
+            manager.get_compose_stacks()
+        (record,) = [r for r in caplog.records if r.levelno == logging.ERROR]
+        assert record.exc_info
+
+    def test_list_containers_only_inspects_changed_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test containers are only inspected again when their listing changes."""
+
+        def sparse(container_id, status):
+            container = Mock()
+            container.id = container_id
+            container.attrs = {
+                "Id": container_id,
+                "State": "running",
+                "Status": status,
+                "Names": [f"/{container_id}"],
+            }
+            return container
+
+        first = [sparse("c1", "Up 2 hours"), sparse("c2", "Up 3 hours")]
+        mock_docker_client.containers.list.return_value = first
+        assert manager._list_containers() == first
+        mock_docker_client.containers.list.assert_called_once_with(
+            all=True, sparse=True
+        )
+        first[0].reload.assert_called_once()
+        first[1].reload.assert_called_once()
+
+        # c1 is unchanged and reuses its inspected object, c2 was restarted
+        second = [sparse("c1", "Up 2 hours"), sparse("c2", "Up 1 second")]
+        mock_docker_client.containers.list.return_value = second
+        assert manager._list_containers() == [first[0], second[1]]
+        second[0].reload.assert_not_called()
+        second[1].reload.assert_called_once()
+
+    def test_list_containers_inspects_containers_with_events(
+        self, manager, mock_docker_client
+    ):
+        """Test followed events, not status text, decide which are inspected again."""
+
+        def sparse(container_id, status):
+            container = Mock(id=container_id)
+            container.attrs = {"State": "running", "Status": status, "Names": []}
+            return container
+
+        first = [sparse("c1", "Up 2 seconds"), sparse("c2", "Up 3 seconds")]
+        mock_docker_client.containers.list.return_value = first
+        manager._list_containers()
+        manager._container_events = Mock(
+            active=True, take_changed=Mock(return_value={"c2"})
+        )
+
+        # Uptime text moved on for both, but only c2 had an event
+        second = [sparse("c1", "Up 3 seconds"), sparse("c2", "Up 1 second")]
+        mock_docker_client.containers.list.return_value = second
+        assert manager._list_containers() == [first[0], second[1]]
+        second[0].reload.assert_not_called()
+        second[1].reload.assert_called_once()
+
+    def test_list_containers_skips_removed_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test containers removed between listing and inspecting are skipped."""
+        removed = Mock(id="gone", attrs={})
+        removed.reload.side_effect = docker.errors.NotFound("gone")
+        kept = Mock(id="kept", attrs={})
+        mock_docker_client.containers.list.return_value = [removed, kept]
+
+        assert manager._list_containers() == [kept]
+        assert list(manager._inspected_containers) == ["kept"]
+
+    def test_get_compose_stacks_reuses_recent_result(
+        self, manager, mock_docker_client
+    ):
+        """Test stacks are reused briefly while the container listing is unchanged."""
+        container = Mock(id="c1", status="running", labels={})
+        container.name = "web"
+        container.attrs = {"State": "running", "Status": "Up 2 hours", "Names": []}
+        mock_docker_client.containers.list.return_value = [container]
+
+        with patch("DockTUI.docker_mgmt.manager.time") as mock_time, patch.object(
+            manager, "_is_compose_file_accessible", return_value=False
+        ) as mock_check:
+            mock_time.monotonic.return_value = 100.0
+            first = manager.get_compose_stacks()
+            assert manager.get_compose_stacks() == first
+            mock_check.assert_called_once()
+
+            # A changed container rebuilds the stacks
+            container.attrs = {"State": "exited", "Status": "Exited (0)", "Names": []}
+            container.status = "exited"
+            assert manager.get_compose_stacks()["ungrouped"]["exited"] == 1
+            assert mock_check.call_count == 2
+
+            # So does an expired cache
+            mock_time.monotonic.return_value = 100.0 + STACKS_CACHE_TTL
+            manager.get_compose_stacks()
+            assert mock_check.call_count == 3
+
+    def test_get_compose_stacks_cached_stacks_not_shared(
+        self, manager, mock_docker_client
+    ):
+        """Test changing returned stacks doesn't change those the cache returns."""
+        container = Mock(id="c1", status="running", labels={})
+        container.name = "web"
+        container.attrs = {"State": "running", "Status": "Up 2 hours", "Names": []}
+        mock_docker_client.containers.list.return_value = [container]
+
+        with patch("DockTUI.docker_mgmt.manager.time") as mock_time, patch.object(
+            manager, "_is_compose_file_accessible", return_value=False
+        ):
+            mock_time.monotonic.return_value = 100.0
+            first = manager.get_compose_stacks()
+            first["ungrouped"].running = 0
+            first["ungrouped"].containers.clear()
+            second = manager.get_compose_stacks()
+            second["ungrouped"].total = 0
+            third = manager.get_compose_stacks()
+
+        assert third["ungrouped"] is not second["ungrouped"]
+        assert third["ungrouped"]["running"] == 1
+        assert third["ungrouped"]["total"] == 1
+        assert third["ungrouped"]["containers"] == [container]
+
+    def test_get_compose_stacks_rebuilt_after_container_reinspected(
+        self, manager, mock_docker_client
+    ):
+        """Test an event within the cache's lifetime rebuilds the stacks."""
+
+        def listed():
+            container = Mock(id="c1", status="running", labels={})
+            container.name = "web"
+            container.attrs = {"State": "running", "Status": "Up 2 hours", "Names": []}
+            return container
+
+        before = listed()
+        mock_docker_client.containers.list.return_value = [before]
+
+        with patch("DockTUI.docker_mgmt.manager.time") as mock_time, patch.object(
+            manager, "_is_compose_file_accessible", return_value=False
+        ):
+            mock_time.monotonic.return_value = 100.0
+            manager.get_compose_stacks()
+
+            # Restarted: still running with the same names, reported by an event
+            manager._container_events = Mock(
+                active=True, take_changed=Mock(return_value={"c1"})
+            )
+            after = listed()
+            mock_docker_client.containers.list.return_value = [after]
+            stacks = manager.get_compose_stacks()
+
+        after.reload.assert_called_once()
+        assert stacks["ungrouped"]["containers"] == [after]
+        assert stacks["ungrouped"]["containers"][0] is after
+
     def test_get_all_container_stats(self, manager, mock_docker_client):
         """Test getting container stats for all running containers."""
+        manager._follow_stats = True
         mock_container1 = Mock()
         mock_container1.id = "container1"
         mock_container1.short_id = "cont1"
@@ -164,26 +405,10 @@ class TestDockerManager:
             }
         }
 
-        mock_container1.stats.return_value = mock_stats1
-        mock_container2.stats.return_value = mock_stats2
+        stream_stats(mock_container1, iter([json.dumps(mock_stats1).encode()]))
+        stream_stats(mock_container2, iter([json.dumps(mock_stats2).encode()]))
 
-        with patch("DockTUI.docker_mgmt.manager.threading.Thread") as mock_thread:
-            threads = []
-
-            def capture_thread(target=None, args=None, **kwargs):
-                thread = Mock()
-                thread.target = target
-                thread.args = args
-                threads.append(thread)
-
-                if target:
-                    target(*args)
-
-                return thread
-
-            mock_thread.side_effect = capture_thread
-
-            stats = manager.get_all_container_stats()
+        stats = manager.get_all_container_stats()
 
         assert "cont1" in stats
         assert "cont2" in stats
@@ -194,36 +419,198 @@ class TestDockerManager:
         assert "cpu" in stats["cont2"]
         assert "memory" in stats["cont2"]
 
+    def test_get_all_container_stats_uses_given_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test stats are collected for given running containers without relisting."""
+        running = Mock(short_id="run1", status="running")
+        running.stats.return_value = {
+            "cpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+            "precpu_stats": {"cpu_usage": {"total_usage": 0}, "system_cpu_usage": 0},
+            "memory_stats": {},
+        }
+        exited = Mock(short_id="exit1", status="exited")
+
+        stats = manager.get_all_container_stats([running, exited])
+
+        mock_docker_client.containers.list.assert_not_called()
+        exited.stats.assert_not_called()
+        assert list(stats) == ["run1"]
+
+    def test_get_all_container_stats_shares_one_deadline(
+        self, manager, mock_docker_client
+    ):
+        """Test waiting for first frames is bounded by one timeout for all streams."""
+        manager._follow_stats = True
+        release = threading.Event()
+
+        def blocked_stream():
+            release.wait(5)
+            yield from ()
+
+        slow = [Mock(short_id=f"slow{i}", status="running") for i in range(3)]
+        for container in slow:
+            stream_stats(container, blocked_stream())
+
+        try:
+            with patch(
+                "DockTUI.docker_mgmt.manager.STATS_COLLECTION_TIMEOUT", 0.2
+            ):
+                start = time.monotonic()
+                stats = manager.get_all_container_stats(slow)
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 0.5
+        assert stats == {}
+
+    def test_get_all_container_stats_prefers_cgroup_stats(
+        self, manager, mock_docker_client
+    ):
+        """Test containers with readable cgroups don't get a stats stream."""
+        manager._follow_stats = True
+        cgroup_stats = {
+            "cpu": "1.00%",
+            "memory": "1.0MiB / 2.0MiB",
+            "memory_percent": "50.00",
+            "pids": "2",
+        }
+        manager._cgroup_stats.read.side_effect = lambda container_id: (
+            cgroup_stats if container_id == "full1" else None
+        )
+        fast = Mock(id="full1", short_id="fast1", status="running")
+        slow = Mock(id="full2", short_id="slow1", status="running")
+        stream_stats(slow, iter([]))
+
+        stats = manager.get_all_container_stats([fast, slow])
+
+        assert stats["fast1"] == cgroup_stats
+        assert stats["slow1"]["cpu"] == "0%"
+        fast.client.api.get.assert_not_called()
+        slow.client.api.get.assert_called_once()
+        manager._cgroup_stats.forget_others.assert_called_once()
+        assert list(manager._stats_streams) == ["slow1"]
+
     def test_get_all_container_stats_error_handling(self, manager, mock_docker_client):
         """Test get_all_container_stats with container error."""
         mock_container = Mock()
         mock_container.id = "container1"
         mock_container.short_id = "cont1"
         mock_container.status = "running"
-        mock_container.stats.side_effect = docker.errors.APIError("Stats error")
+        mock_container.client.api.get.side_effect = docker.errors.APIError(
+            "Stats error"
+        )
 
         mock_docker_client.containers.list.return_value = [mock_container]
 
-        with patch("DockTUI.docker_mgmt.manager.threading.Thread") as mock_thread:
-            def capture_thread(target=None, args=None, **kwargs):
-                thread = Mock()
-                thread.target = target
-                thread.args = args
-
-                if target:
-                    target(*args)
-
-                return thread
-
-            mock_thread.side_effect = capture_thread
-
-            stats = manager.get_all_container_stats()
+        stats = manager.get_all_container_stats()
 
         # When stats collection fails, we still get a basic entry with zeroed values
         assert "cont1" in stats
         assert stats["cont1"]["cpu"] == "0%"
         assert stats["cont1"]["memory"] == "0B / 0B"
 
+    def test_get_all_container_stats_keeps_streams_open(
+        self, manager, mock_docker_client
+    ):
+        """Test stats streams are reused across calls and stopped when not needed."""
+        manager._follow_stats = True
+        frames = threading.Event()
+
+        def stream():
+            frame = {"cpu_stats": {"cpu_usage": {"total_usage": 0}}, "memory_stats": {}}
+            yield json.dumps(frame).encode() + b"\n"
+            frames.wait(5)
+
+        running = Mock(short_id="run1", status="running")
+        stream_stats(running, stream())
+        try:
+            manager.get_all_container_stats([running])
+            stats = manager.get_all_container_stats([running])
+            running.client.api.get.assert_called_once()
+            assert stats["run1"]["cpu"] == "0.00%"
+
+            # Once the container stops its stream is stopped
+            stream_obj = manager._stats_streams["run1"]
+            running.status = "exited"
+            assert manager.get_all_container_stats([running]) == {}
+            assert not stream_obj.active
+            assert manager._stats_streams == {}
+        finally:
+            frames.set()
+
+    def test_get_all_container_stats_reuses_listing(self, manager, mock_docker_client):
+        """Test stats without given containers reuse the cached container listing."""
+        manager._follow_stats = True
+        running = Mock(id="run1", short_id="run1", status="running")
+        running.name = "web"
+        running.attrs = {"State": "running", "Status": "Up", "Names": ["/web"]}
+        frame = {"cpu_stats": {"cpu_usage": {"total_usage": 0}}, "memory_stats": {}}
+        stream_stats(running, iter([json.dumps(frame).encode()]))
+        exited = Mock(id="ex1", short_id="ex1", status="exited")
+        exited.name = "old"
+        exited.attrs = {"State": "exited", "Status": "Exited", "Names": ["/old"]}
+        mock_docker_client.containers.list.return_value = [running, exited]
+        manager._list_containers()
+        running.reload.reset_mock()
+
+        stats = manager.get_all_container_stats()
+
+        mock_docker_client.containers.list.assert_called_with(all=True, sparse=True)
+        running.reload.assert_not_called()
+        assert list(stats) == ["run1"]
+
+    def test_get_all_container_stats_polls_without_streaming(
+        self, manager, mock_docker_client
+    ):
+        """Test each call takes a fresh sample when stats streaming is off."""
+        running = Mock(short_id="run1", status="running")
+        running.stats.return_value = {
+            "cpu_stats": {"cpu_usage": {"total_usage": 0}},
+            "memory_stats": {},
+        }
+
+        manager.get_all_container_stats([running])
+        stats = manager.get_all_container_stats([running])
+
+        assert running.stats.call_count == 2
+        running.stats.assert_called_with(stream=False)
+        assert stats["run1"]["cpu"] == "0.00%"
+
+    def test_get_all_container_stats_caps_followed_streams(
+        self, manager, mock_docker_client
+    ):
+        """Test containers beyond the followed streams cap are sampled instead."""
+        manager._follow_stats = True
+        frames = threading.Event()
+        frame = {"cpu_stats": {"cpu_usage": {"total_usage": 0}}, "memory_stats": {}}
+
+        def stream():
+            yield json.dumps(frame).encode() + b"\n"
+            frames.wait(5)
+
+        running = []
+        for i in range(3):
+            container = Mock(short_id=f"run{i}", status="running")
+            stream_stats(container, stream())
+            container.stats.return_value = frame
+            running.append(container)
+
+        try:
+            with patch("DockTUI.docker_mgmt.manager.MAX_FOLLOWED_STATS_STREAMS", 2):
+                manager.get_all_container_stats(running)
+                stats = manager.get_all_container_stats(running)
+
+            for container in running[:2]:
+                container.client.api.get.assert_called_once()
+                container.stats.assert_not_called()
+            running[2].client.api.get.assert_not_called()
+            assert running[2].stats.call_count == 2
+            assert stats["run2"]["cpu"] == "0.00%"
+        finally:
+            frames.set()
+
     def test_get_containers(self, manager, mock_docker_client):
         """Test getting all containers with stats."""
         mock_container = Mock()
@@ -258,12 +645,96 @@ class TestDockerManager:
                     containers = manager.get_containers()
 
         assert len(containers) == 1
+        assert isinstance(containers[0], ContainerInfo)
         assert containers[0]["id"] == "cont1"  # Uses short_id
         assert containers[0]["name"] == "test_container"
         assert containers[0]["status"] == "running"
         assert containers[0]["cpu"] == "10%"
         assert containers[0]["memory"] == "100MB"
 
+    def test_get_containers_collects_stats_for_stack_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test get_containers passes the stacks' containers to the stats collection."""
+        container_a = Mock(short_id="a", status="running", attrs={}, labels={})
+        container_b = Mock(short_id="b", status="exited", attrs={}, labels={})
+        stacks = {
+            "stack1": {"containers": [container_a]},
+            "stack2": {"containers": [container_b]},
+        }
+
+        with patch.object(manager, "get_all_container_stats") as mock_stats:
+            mock_stats.return_value = {}
+            with patch.object(manager, "_format_ports", return_value=""):
+                manager.get_containers(stacks)
+
+        mock_stats.assert_called_once_with([container_a, container_b])
+
+    def test_get_containers_grouped_by_stack(self, manager, mock_docker_client):
+        """Test get_containers returns each stack's containers together, in order."""
+        stacks = {
+            "stack2": {
+                "containers": [
+                    Mock(short_id=short_id, status="running", attrs={}, labels={})
+                    for short_id in ("a", "b")
+                ]
+            },
+            "stack1": {
+                "containers": [Mock(short_id="c", status="running", attrs={})]
+            },
+        }
+
+        with patch.object(manager, "get_all_container_stats", return_value={}):
+            with patch.object(manager, "_format_ports", return_value=""):
+                containers = manager.get_containers(stacks)
+
+        assert [(c.stack, c.id) for c in containers] == [
+            ("stack2", "a"),
+            ("stack2", "b"),
+            ("stack1", "c"),
+        ]
+
+    def test_get_containers_reuses_ports_of_unchanged_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test ports are only formatted again for re-inspected containers."""
+        unchanged = Mock(id="c1", short_id="c1", status="running", attrs={})
+        inspected = Mock(id="c2", short_id="c2", status="running", attrs={})
+        reinspected = Mock(id="c2", short_id="c2", status="running", attrs={})
+
+        with patch.object(manager, "get_all_container_stats", return_value={}):
+            with patch.object(manager, "_format_ports", return_value="80->80") as fmt:
+                manager.get_containers({"s": {"containers": [unchanged, inspected]}})
+                containers = manager.get_containers(
+                    {"s": {"containers": [unchanged, reinspected]}}
+                )
+
+        assert [call.args[0] for call in fmt.call_args_list] == [
+            unchanged,
+            inspected,
+            reinspected,
+        ]
+        assert [c.ports for c in containers] == ["80->80", "80->80"]
+
+    def test_format_ports(self, manager):
+        """Test port bindings are deduplicated and kept in Docker's order."""
+        container = Mock()
+        container.ports = {
+            "443/tcp": [
+                {"HostIp": "0.0.0.0", "HostPort": "8443"},
+                {"HostIp": "::", "HostPort": "8443"},
+            ],
+            "80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}],
+            "9000/tcp": None,
+        }
+
+        assert manager._format_ports(container) == "8443->443, 8080->80"
+
+    def test_format_ports_no_bindings(self, manager):
+        """Test a container without published ports formats as an empty string."""
+        container = Mock(ports={"80/tcp": None})
+        assert manager._format_ports(container) == ""
+
     def test_get_containers_with_transition_state(self, manager, mock_docker_client):
         """Test getting containers with transition states."""
         mock_container = Mock()
@@ -298,6 +769,28 @@ class TestDockerManager:
 
         assert containers[0]["status"] == "stopping"
 
+    def test_get_containers_reuses_provided_stacks(self, manager, mock_docker_client):
+        """Test get_containers doesn't refetch stacks when they are provided."""
+        mock_container = Mock()
+        mock_container.short_id = "cont1"
+        mock_container.name = "test_container"
+        mock_container.status = "running"
+        mock_container.attrs = {}
+
+        stacks = {"ungrouped": {"containers": [mock_container], "name": "ungrouped"}}
+
+        with patch.object(manager, "get_all_container_stats") as mock_stats:
+            mock_stats.return_value = {}
+            with patch.object(manager, "get_compose_stacks") as mock_stacks:
+                with patch.object(manager, "_format_ports") as mock_ports:
+                    mock_ports.return_value = ""
+
+                    containers = manager.get_containers(stacks)
+
+        mock_stacks.assert_not_called()
+        assert len(containers) == 1
+        assert containers[0]["stack"] == "ungrouped"
+
     def test_format_ports(self, manager):
         """Test formatting container ports."""
         mock_container = Mock()
@@ -409,6 +902,58 @@ class TestDockerManager:
         assert success is True
         assert container_id == mock_container.short_id
 
+    def test_split_config_files(self):
+        """Test compose config_files labels are split into stripped paths."""
+        assert _split_config_files("/a/compose.yml, /a/override.yml") == (
+            "/a/compose.yml",
+            "/a/override.yml",
+        )
+        assert _split_config_files("N/A") == ()
+        assert _split_config_files("") == ()
+
+    def test_run_in_background_drains_output_and_reaps(self, manager):
+        """Test background commands with lots of output finish and are reaped."""
+        done = threading.Event()
+        with patch("DockTUI.docker_mgmt.manager.subprocess.Popen") as mock_popen:
+            process = mock_popen.return_value
+            process.communicate.return_value = ("x" * 1_000_000, "")
+            process.returncode = 0
+
+            manager._run_in_background(["docker", "compose", "up"], "Test", done.set)
+
+            assert done.wait(1)
+        process.communicate.assert_called_once_with()
+        assert manager.last_error is None
+
+    def test_run_in_background_runs_command(self, manager):
+        """Test a real command is started without close_fds and is reaped."""
+        done = threading.Event()
+        with patch(
+            "DockTUI.docker_mgmt.manager.subprocess.Popen", wraps=subprocess.Popen
+        ) as mock_popen:
+            manager._run_in_background(
+                [sys.executable, "-c", "import sys; sys.exit(3)"], "Test", done.set
+            )
+
+            assert done.wait(10)
+        assert mock_popen.call_args.kwargs["close_fds"] is False
+        assert manager.last_error == "Test failed: "
+
+    def test_run_in_background_records_failure(self, manager):
+        """Test a failing background command is recorded in last_error."""
+        done = threading.Event()
+        with patch("DockTUI.docker_mgmt.manager.subprocess.Popen") as mock_popen:
+            process = mock_popen.return_value
+            process.communicate.return_value = ("", "no such service")
+            process.returncode = 1
+
+            manager._run_in_background(
+                ["docker", "compose", "down"], "Stack down", done.set
+            )
+
+            assert done.wait(1)
+        assert manager.last_error == "Stack down failed: no such service"
+
     def test_execute_container_command_invalid(self, manager):
         """Test executing invalid command."""
         success, container_id = manager.execute_container_command("container1", "invalid")
@@ -432,12 +977,23 @@ class TestDockerManager:
             "Driver": "bridge",
             "Scope": "local",
             "IPAM": {"Config": [{"Subnet": "172.17.0.0/16", "Gateway": "172.17.0.1"}]},
-            "Containers": {
-                "container1": {"Name": "test_container", "IPv4Address": "172.17.0.2/16"}
-            }
+        }
+        mock_container = Mock(id="container1", labels={})
+        mock_container.name = "test_container"
+        mock_container.attrs = {
+            "State": {"Running": True},
+            "NetworkSettings": {
+                "Networks": {
+                    "test_network": {
+                        "NetworkID": "network1",
+                        "IPAddress": "172.17.0.2",
+                    }
+                }
+            },
         }
 
         mock_docker_client.networks.list.return_value = [mock_network]
+        mock_docker_client.containers.list.return_value = [mock_container]
 
         networks = manager.get_networks()
 
@@ -446,6 +1002,113 @@ class TestDockerManager:
         assert networks["test_network"]["driver"] == "bridge"
         assert networks["test_network"]["total_containers"] == 1
         assert len(networks["test_network"]["connected_containers"]) == 1
+        (connected,) = networks["test_network"]["connected_containers"]
+        assert isinstance(connected, NetworkContainerInfo)
+        assert connected.name == "test_container"
+        assert connected.ip == "172.17.0.2"
+
+    def test_get_networks_reads_membership_from_containers(
+        self, manager, mock_docker_client
+    ):
+        """Test get_networks neither reloads networks nor fetches containers."""
+        running = Mock(id="container1", labels={"com.docker.compose.project": "web"})
+        running.name = "web"
+        running.attrs = {
+            "State": {"Running": True},
+            "NetworkSettings": {
+                "Networks": {
+                    "front": {"NetworkID": "net1", "IPAddress": "172.18.0.2"},
+                    "back": {"NetworkID": "net2", "IPAddress": ""},
+                }
+            },
+        }
+        stopped = Mock(id="container2", labels={})
+        stopped.attrs = {
+            "State": {"Running": False},
+            "NetworkSettings": {
+                "Networks": {"front": {"NetworkID": "net1", "IPAddress": ""}}
+            },
+        }
+        networks = []
+        for network_id, name in (("net1", "front"), ("net2", "back"), ("net3", "idle")):
+            network = Mock(id=network_id, short_id=network_id)
+            network.name = name
+            network.attrs = {}
+            networks.append(network)
+        mock_docker_client.networks.list.return_value = networks
+
+        result = manager.get_networks([running, stopped])
+
+        mock_docker_client.containers.get.assert_not_called()
+        for network in networks:
+            network.reload.assert_not_called()
+        assert result["front"]["connected_stacks"] == {"web"}
+        assert result["front"]["total_containers"] == 1
+        (back,) = result["back"]["connected_containers"]
+        assert back.ip == "N/A"
+        assert result["idle"]["total_containers"] == 0
+
+    def test_get_networks_lists_containers_once(self, manager, mock_docker_client):
+        """Test get_networks lists containers once instead of fetching each one."""
+        container = Mock(id="container1", labels={"com.docker.compose.project": "web"})
+        container.name = "web"
+        container.attrs = {
+            "State": {"Running": True},
+            "Status": "Up",
+            "Names": ["/web"],
+            "NetworkSettings": {"Networks": {}},
+        }
+        networks = []
+        for index in range(3):
+            network = Mock(id=f"network{index}", short_id=f"net{index}")
+            network.name = f"network{index}"
+            network.attrs = {}
+            container.attrs["NetworkSettings"]["Networks"][network.name] = {
+                "NetworkID": network.id,
+                "IPAddress": "",
+            }
+            networks.append(network)
+        mock_docker_client.networks.list.return_value = networks
+        mock_docker_client.containers.list.return_value = [container]
+
+        result = manager.get_networks()
+
+        mock_docker_client.containers.list.assert_called_once()
+        mock_docker_client.containers.get.assert_not_called()
+        for network in networks:
+            assert result[network.name]["connected_stacks"] == {"web"}
+
+    def test_get_networks_includes_docktui_container(
+        self, manager, mock_docker_client
+    ):
+        """Test DockTUI's own container, left out of the stacks, is a member."""
+        containers = []
+        for container_id, name in (("c1", "web"), ("c2", "docktui-app")):
+            container = Mock(id=container_id, status="running", labels={})
+            container.name = name
+            container.attrs = {
+                "State": {"Running": True},
+                "Status": "Up",
+                "Names": [f"/{name}"],
+                "NetworkSettings": {
+                    "Networks": {"shared": {"NetworkID": "net1", "IPAddress": ""}}
+                },
+            }
+            containers.append(container)
+        network = Mock(id="net1", short_id="net1")
+        network.name = "shared"
+        network.attrs = {}
+        mock_docker_client.containers.list.return_value = containers
+        mock_docker_client.networks.list.return_value = [network]
+
+        with patch.object(manager, "_is_compose_file_accessible", return_value=False):
+            stacks = manager.get_compose_stacks()
+        listed = [c for stack in stacks.values() for c in stack["containers"]]
+        networks = manager.get_networks(listed)
+
+        names = {c.name for c in networks["shared"]["connected_containers"]}
+        assert names == {"web", "docktui-app"}
+        assert networks["shared"]["total_containers"] == 2
 
     def test_get_networks_error(self, manager, mock_docker_client):
         """Test get_networks with error."""
@@ -520,6 +1183,19 @@ class TestDockerManager:
         assert images["image1"]["containers"] == 1
         assert images["image1"]["container_names"] == ["test_container"]
 
+    def test_get_images_reuses_provided_containers(self, manager, mock_docker_client):
+        """Test get_images derives usage from provided containers without listing."""
+        mock_image = Mock(id="sha256:image1", tags=["test:latest"])
+        mock_image.attrs = {"Size": 1024, "Created": "2023-01-01T00:00:00Z"}
+        mock_container = Mock(status="running", attrs={"Image": "sha256:image1"})
+        mock_container.name = "test_container"
+        mock_docker_client.images.list.return_value = [mock_image]
+
+        images = manager.get_images([mock_container])
+
+        mock_docker_client.containers.list.assert_not_called()
+        assert images["image1"]["container_names"] == ["test_container"]
+
     def test_remove_image(self, manager, mock_docker_client):
         """Test removing a Docker image."""
         mock_image = Mock()
@@ -667,7 +1343,7 @@ class TestDockerManager:
         # Check that Popen was called with the correct command
         mock_popen.assert_called_once()
         cmd = mock_popen.call_args[0][0]
-        assert "docker" in cmd
+        assert cmd[0] == _docker_executable()
         assert "compose" in cmd
         assert "-p" in cmd
         assert "stack1" in cmd
@@ -690,7 +1366,7 @@ class TestDockerManager:
         # Check that Popen was called with the correct command
         mock_popen.assert_called_once()
         cmd = mock_popen.call_args[0][0]
-        assert "docker" in cmd
+        assert cmd[0] == _docker_executable()
         assert "compose" in cmd
         assert "-p" in cmd
         assert "stack1" in cmd
@@ -753,7 +1429,7 @@ class TestDockerManager:
         # Check that Popen was called with the correct command
         mock_popen.assert_called_once()
         cmd = mock_popen.call_args[0][0]
-        assert "docker" in cmd
+        assert cmd[0] == _docker_executable()
         assert "compose" in cmd
         assert "-p" in cmd
         assert "stack1" in cmd
@@ -934,7 +1610,7 @@ class TestDockerManager:
 
         mock_docker_client.volumes.list.return_value = [mock_volume1, mock_volume2]
         # Need to mock containers.list with all=True parameter
-        mock_docker_client.containers.list.side_effect = lambda all=False: [mock_container] if all else []
+        mock_docker_client.containers.list.side_effect = lambda all=False, **kwargs: [mock_container] if all else []
 
         # Call get_containers first to populate _volume_usage
         manager.get_containers()
@@ -0,0 +1,143 @@
+"""Tests for the container stats stream."""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from DockTUI.docker_mgmt.stats_stream import ContainerStatsStream, parse_stats
+
+# A raw stats frame, as read from the stream
+FRAME = b'{"cpu_stats": {"cpu_usage": {"total_usage": 0}}, "memory_stats": {}}\n'
+
+
+def streaming_container(chunks):
+    """Create a mock container whose stats stream yields the given chunks."""
+    container = Mock(id="abc123", short_id="abc")
+    response = container.client.api.get.return_value
+    response.iter_content.return_value = chunks
+    return container
+
+
+class TestParseStats:
+    """Test cases for parse_stats."""
+
+    def test_parse_frame(self):
+        """Test CPU, memory and PIDs are derived from a stats frame."""
+        stats = parse_stats(
+            {
+                "cpu_stats": {
+                    "cpu_usage": {"total_usage": 2000, "percpu_usage": [1, 1]},
+                    "system_cpu_usage": 20000,
+                },
+                "precpu_stats": {
+                    "cpu_usage": {"total_usage": 1000},
+                    "system_cpu_usage": 10000,
+                },
+                "memory_stats": {
+                    "usage": 3 * 1024**2,
+                    "limit": 8 * 1024**2,
+                    "stats": {"cache": 1024**2},
+                },
+                "pids_stats": {"current": 7},
+            }
+        )
+
+        assert stats == {
+            "cpu": "20.00%",
+            "memory": "2.0MiB / 8.0MiB",
+            "memory_percent": "25.00",
+            "pids": "7",
+        }
+
+    def test_parse_first_frame(self):
+        """Test the first frame of a stream, which has no previous CPU sample."""
+        stats = parse_stats(
+            {
+                "cpu_stats": {
+                    "cpu_usage": {"total_usage": 500, "percpu_usage": [1]},
+                    "system_cpu_usage": 1000,
+                },
+                "precpu_stats": {},
+                "memory_stats": {},
+            }
+        )
+
+        assert stats["cpu"] == "50.00%"
+        assert stats["memory"] == "0.0B / 0.0B"
+        assert stats["pids"] == "0"
+
+
+class TestContainerStatsStream:
+    """Test cases for ContainerStatsStream."""
+
+    def test_keeps_latest_frame(self):
+        """Test the stream keeps the latest parsed frame and ends with the container."""
+        raw = b"".join(
+            json.dumps(frame).encode() + b"\n"
+            for frame in (
+                {"cpu_stats": {"cpu_usage": {"total_usage": 0}}, "memory_stats": {}},
+                {
+                    "cpu_stats": {"cpu_usage": {"total_usage": 0}},
+                    "memory_stats": {},
+                    "pids_stats": {"current": 3},
+                },
+            )
+        )
+        # Frames don't have to line up with the chunks they're read in
+        container = streaming_container(iter([raw[:10], raw[10:]]))
+
+        stream = ContainerStatsStream(container)
+        stream._thread.join(timeout=1)
+
+        container.client.api.get.assert_called_once()
+        assert not stream.active
+        assert stream.ready.is_set()
+        assert stream.latest["pids"] == "3"
+
+    def test_stop_closes_stream(self):
+        """Test stopping closes the stream without waiting for another frame."""
+        closed = threading.Event()
+        read_after_stop = []
+
+        class FakeStream:
+            def __init__(self, chunks, response):
+                self._chunks = chunks
+
+            def __iter__(self):
+                yield next(self._chunks)
+                # Blocks like a paused container's stream until closed
+                closed.wait(1)
+                if not closed.is_set():
+                    read_after_stop.append(True)
+
+            def close(self):
+                closed.set()
+
+        container = streaming_container(iter([FRAME]))
+
+        with patch("DockTUI.docker_mgmt.stats_stream.CancellableStream", FakeStream):
+            stream = ContainerStatsStream(container)
+            assert stream.ready.wait(1)
+            stream.stop()
+            stream._thread.join(timeout=1)
+
+        assert closed.is_set()
+        assert not stream._thread.is_alive()
+        assert not stream.active
+        assert read_after_stop == []
+
+    def test_single_sample_without_follow(self):
+        """Test a stream that doesn't follow takes one sample and ends."""
+        container = Mock(short_id="abc")
+        container.stats.return_value = {
+            "cpu_stats": {"cpu_usage": {"total_usage": 0}},
+            "memory_stats": {},
+            "pids_stats": {"current": 2},
+        }
+
+        stream = ContainerStatsStream(container, follow=False)
+        stream._thread.join(timeout=1)
+
+        container.stats.assert_called_once_with(stream=False)
+        assert not stream.active
+        assert stream.latest["pids"] == "2"
@@ -0,0 +1,100 @@
+"""Tests for the Docker data record types."""
+
+import dataclasses
+
+import pytest
+
+from DockTUI.docker_mgmt.types import ContainerInfo, NetworkContainerInfo, StackInfo
+
+
+@pytest.fixture
+def container():
+    """Create a sample ContainerInfo."""
+    return ContainerInfo(
+        id="abc123",
+        name="web",
+        status="running",
+        uptime="1h",
+        cpu="1.5%",
+        memory="10MB / 1GB",
+        pids="3",
+        stack="mystack",
+        ports="80->80/tcp",
+    )
+
+
+class TestContainerInfo:
+    """Test cases for ContainerInfo."""
+
+    def test_is_slotted_and_frozen(self, container):
+        """Test records have no __dict__ and can't be modified."""
+        assert not hasattr(container, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            container.status = "exited"
+
+    def test_mapping_access(self, container):
+        """Test dict-style access used by existing UI callers."""
+        assert container["name"] == "web"
+        assert container.get("stack") == "mystack"
+        assert container.get("image_id") == ""
+        assert container.get("missing", "default") == "default"
+        assert "cpu" in container
+        assert "missing" not in container
+        with pytest.raises(KeyError):
+            container["missing"]
+
+    def test_copy_returns_mutable_dict(self, container):
+        """Test copy() returns an independent dict of all fields."""
+        data = container.copy()
+        data["status"] = "stopping..."
+
+        assert isinstance(data, dict)
+        assert data["id"] == "abc123"
+        assert data["image_name"] == ""
+        assert container.status == "running"
+
+
+class TestNetworkContainerInfo:
+    """Test cases for NetworkContainerInfo."""
+
+    def test_is_slotted_and_frozen(self):
+        """Test records have no __dict__ and can't be modified."""
+        info = NetworkContainerInfo(id="abc123", name="web", stack="s", ip="10.0.0.2")
+
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.ip = "10.0.0.3"
+
+    def test_mapping_access(self):
+        """Test dict-style access uses this record's own fields."""
+        info = NetworkContainerInfo(id="abc123", name="web", stack="s", ip="10.0.0.2")
+
+        assert info["ip"] == "10.0.0.2"
+        assert "ip" in info
+        assert "cpu" not in info
+        assert info.get("cpu", "n/a") == "n/a"
+        assert info.copy() == {
+            "id": "abc123",
+            "name": "web",
+            "stack": "s",
+            "ip": "10.0.0.2",
+        }
+
+
+class TestStackInfo:
+    """Test cases for StackInfo."""
+
+    def test_is_slotted_and_counted_in_place(self):
+        """Test stacks have no __dict__ and start empty for counting."""
+        stack = StackInfo(
+            name="web",
+            config_file="N/A",
+            can_recreate=False,
+            has_compose_file=False,
+        )
+        stack.total += 1
+
+        assert not hasattr(stack, "__dict__")
+        assert stack.containers == []
+        assert stack["total"] == 1
+        assert stack.get("can_recreate", True) is False
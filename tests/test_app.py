@@ -1,6 +1,8 @@
 """Tests for the main DockTUIApp class."""
 
+import inspect
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
@@ -31,6 +33,23 @@ if TYPE_CHECKING:
 class TestDockTUIApp:
     """Test cases for DockTUIApp class."""
 
+    @patch("DockTUI.app.config")
+    @patch("DockTUI.app.RefreshActions.__init__", return_value=None)
+    @patch("DockTUI.app.DockerActions.__init__", return_value=None)
+    @patch("DockTUI.app.App.__init__", return_value=None)
+    @patch("DockTUI.app.DockerManager")
+    def test_init_stream_stats_setting(
+        self, mock_docker_manager, mock_app_init, mock_docker_actions_init,
+        mock_refresh_actions_init, mock_config
+    ):
+        """Test the app.stream_stats setting decides whether stats are followed."""
+        mock_config.get.return_value = True
+
+        DockTUIApp()
+
+        mock_config.get.assert_called_once_with("app.stream_stats", False)
+        mock_docker_manager.assert_called_once_with(follow_stats=True)
+
     @patch("DockTUI.app.RefreshActions.__init__", return_value=None)
     @patch("DockTUI.app.DockerActions.__init__", return_value=None)
     @patch("DockTUI.app.App.__init__", return_value=None)
@@ -54,7 +73,6 @@ class TestDockTUIApp:
         assert app.log_pane is None
         assert app.error_display is None
         assert app.refresh_timer is None
-        assert app._current_worker is None
         assert app.footer is None
         assert app.status_bar is None
         assert app._current_selection_type == "none"
@@ -209,26 +227,32 @@ class TestDockTUIApp:
 
         # Verify refresh timer was started
         mock_config.get.assert_called_with("app.refresh_interval", 5.0)
-        app.set_interval.assert_called_with(2.5, app.action_refresh)
+        app.set_interval.assert_called_with(2.5, app._refresh_on_timer)
 
-        # Verify initial refresh was scheduled
-        app.call_after_refresh.assert_called_with(app.action_refresh)
+        # Verify initial refresh was triggered
+        app.action_refresh.assert_called_once()
 
     def test_action_quit(self):
         """Test quit action."""
         app = DockTUIApp.__new__(DockTUIApp)
         app.refresh_timer = Mock(spec=Timer)
+        app._current_worker = Mock()
+        app.docker = Mock()
         app.exit = Mock()
 
         app.action_quit()
 
         app.refresh_timer.stop.assert_called_once()
+        app._current_worker.cancel.assert_called_once()
+        app.docker.close.assert_called_once()
         app.exit.assert_called_once()
 
     def test_action_quit_no_timer(self):
         """Test quit action when no timer is set."""
         app = DockTUIApp.__new__(DockTUIApp)
         app.refresh_timer = None
+        app._current_worker = None
+        app.docker = Mock()
         app.exit = Mock()
 
         app.action_quit()
@@ -238,18 +262,17 @@ class TestDockTUIApp:
     def test_action_refresh(self):
         """Test refresh action."""
         app = DockTUIApp.__new__(DockTUIApp)
-        app.call_after_refresh = Mock()
         app.refresh_containers = Mock()
 
         app.action_refresh()
 
-        app.call_after_refresh.assert_called_with(app.refresh_containers)
+        app.refresh_containers.assert_called_once_with()
 
     @patch("DockTUI.app.logger")
     def test_action_refresh_error(self, mock_logger):
         """Test refresh action error handling."""
         app = DockTUIApp.__new__(DockTUIApp)
-        app.call_after_refresh = Mock(side_effect=Exception("Refresh failed"))
+        app.refresh_containers = Mock(side_effect=Exception("Refresh failed"))
 
         # Should not raise, just log
         app.action_refresh()
@@ -471,62 +494,106 @@ class TestDockTUIApp:
         )
 
     def test_action_remove_unused_images(self):
-        """Test remove unused images action."""
+        """Test remove unused images action looks them up in the background."""
+        app = DockTUIApp.__new__(DockTUIApp)
+        app._find_unused_images = Mock()
+
+        app.action_remove_unused_images()
+
+        app._find_unused_images.assert_called_once_with()
+
+    def test_find_unused_images(self):
+        """Test unused images are looked up and handed back to the UI thread."""
         app = DockTUIApp.__new__(DockTUIApp)
         app.docker = Mock()
-        app.docker.get_unused_images.return_value = [
-            {"id": "image1"},
-            {"id": "image2"},
-        ]
+        app.docker.get_unused_images.return_value = [{"id": "image1"}]
+        app.call_from_thread = Mock()
+
+        DockTUIApp._find_unused_images.__wrapped__(app)
+
+        app.call_from_thread.assert_called_once_with(
+            app._confirm_remove_unused_images, [{"id": "image1"}]
+        )
+
+    def test_confirm_remove_unused_images(self):
+        """Test the confirmation passes the images found on to the removal."""
+        app = DockTUIApp.__new__(DockTUIApp)
         app.push_screen = Mock()
+        app.execute_image_command = Mock()
+        unused_images = [{"id": "image1"}, {"id": "image2"}]
 
-        app.action_remove_unused_images()
+        app._confirm_remove_unused_images(unused_images)
 
         # Verify modal was created with correct count
         app.push_screen.assert_called_once()
-        modal = app.push_screen.call_args[0][0]
+        modal, callback = app.push_screen.call_args[0]
         assert isinstance(modal, RemoveUnusedImagesModal)
         assert modal.unused_count == 2
+        callback(True)
+        app.execute_image_command.assert_called_once_with(
+            "remove_unused_images", unused_images
+        )
 
-    def test_action_remove_unused_images_none_found(self):
+    def test_confirm_remove_unused_images_none_found(self):
         """Test remove unused images when none are found."""
         app = DockTUIApp.__new__(DockTUIApp)
-        app.docker = Mock()
-        app.docker.get_unused_images.return_value = []
         app.error_display = Mock()
 
-        app.action_remove_unused_images()
+        app._confirm_remove_unused_images([])
 
         app.error_display.update.assert_called_with("No unused images found")
 
     def test_action_prune_unused_volumes(self):
-        """Test prune unused volumes action."""
+        """Test prune unused volumes action looks them up in the background."""
+        app = DockTUIApp.__new__(DockTUIApp)
+        app._find_unused_volumes = Mock()
+
+        app.action_prune_unused_volumes()
+
+        app._find_unused_volumes.assert_called_once_with()
+
+    def test_find_unused_volumes(self):
+        """Test unused volumes are looked up and handed back to the UI thread."""
         app = DockTUIApp.__new__(DockTUIApp)
         app.docker = Mock()
-        app.docker.get_unused_volumes.return_value = [
+        app.docker.get_unused_volumes.return_value = [{"name": "volume1"}]
+        app.call_from_thread = Mock()
+
+        DockTUIApp._find_unused_volumes.__wrapped__(app)
+
+        # Should get unused volumes
+        app.docker.get_unused_volumes.assert_called_once()
+        app.call_from_thread.assert_called_once_with(
+            app._confirm_prune_unused_volumes, [{"name": "volume1"}]
+        )
+
+    def test_confirm_prune_unused_volumes(self):
+        """Test the confirmation passes the volumes found on to the removal."""
+        app = DockTUIApp.__new__(DockTUIApp)
+        app.push_screen = Mock()
+        app.execute_volume_command = Mock()
+        unused_volumes = [
             {"name": "volume1", "in_use": False},
             {"name": "volume2", "in_use": False},
         ]
-        app.push_screen = Mock()
-        app.error_display = Mock()
 
-        app.action_prune_unused_volumes()
+        app._confirm_prune_unused_volumes(unused_volumes)
 
-        # Should get unused volumes
-        app.docker.get_unused_volumes.assert_called_once()
         # Should push volume removal modal
-        modal = app.push_screen.call_args[0][0]
+        modal, callback = app.push_screen.call_args[0]
         assert isinstance(modal, RemoveUnusedVolumesModal)
         assert modal.unused_count == 2
+        callback(True)
+        app.execute_volume_command.assert_called_once_with(
+            "remove_unused_volumes", unused_volumes
+        )
 
-    def test_action_prune_unused_volumes_none_found(self):
+    def test_confirm_prune_unused_volumes_none_found(self):
         """Test prune unused volumes when none are found."""
         app = DockTUIApp.__new__(DockTUIApp)
-        app.docker = Mock()
-        app.docker.get_unused_volumes.return_value = []
         app.error_display = Mock()
 
-        app.action_prune_unused_volumes()
+        app._confirm_prune_unused_volumes([])
 
         app.error_display.update.assert_called_with("No unused volumes found")
 
@@ -678,8 +745,9 @@ class TestDockTUIApp:
 class TestMain:
     """Test cases for the main function."""
 
+    @patch("DockTUI.app.stop_logging")
     @patch("DockTUI.app.DockTUIApp")
-    def test_main_success(self, mock_app_class):
+    def test_main_success(self, mock_app_class, mock_stop_logging):
         """Test successful main execution."""
         mock_app = Mock()
         mock_app_class.return_value = mock_app
@@ -688,10 +756,12 @@ class TestMain:
 
         mock_app_class.assert_called_once()
         mock_app.run.assert_called_once()
+        mock_stop_logging.assert_called_once_with()
 
+    @patch("DockTUI.app.stop_logging")
     @patch("DockTUI.app.DockTUIApp")
     @patch("DockTUI.app.logger")
-    def test_main_error(self, mock_logger, mock_app_class):
+    def test_main_error(self, mock_logger, mock_app_class, mock_stop_logging):
         """Test main with error."""
         mock_app_class.side_effect = Exception("App failed")
 
@@ -699,17 +769,18 @@ class TestMain:
             main()
 
         mock_logger.error.assert_called()
+        mock_stop_logging.assert_called_once_with()
 
 
 class TestIntegration:
     """Integration tests for app components."""
 
     def test_css_constants(self):
-        """Test that CSS is properly defined."""
-        app = DockTUIApp.__new__(DockTUIApp)
-        assert isinstance(app.CSS, str)
-        assert "#left-pane" in app.CSS
-        assert "ContainerList" in app.CSS
+        """Test that the stylesheet ships next to the app module."""
+        css_file = Path(inspect.getfile(DockTUIApp)).parent / DockTUIApp.CSS_PATH
+        css = css_file.read_text()
+        assert "#left-pane" in css
+        assert "ContainerList" in css
 
     def test_bindings(self):
         """Test that bindings are properly defined."""
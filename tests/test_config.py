@@ -1,5 +1,6 @@
 """Tests for the configuration management module."""
 
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -8,7 +9,7 @@ from unittest.mock import patch, Mock, mock_open
 import pytest
 import yaml
 
-from DockTUI.config import Config, DEFAULT_CONFIG
+from DockTUI.config import Config, DEFAULT_CONFIG, _key_paths
 
 
 class TestConfig:
@@ -168,4 +169,117 @@ class TestConfig:
                     assert "tail: 200" in content
                     assert "since: '15m'" in content
             finally:
-                os.chdir(original_cwd)
\ No newline at end of file
+                os.chdir(original_cwd)
+    def test_parsed_config_cached_in_user_cache_dir(self, tmp_path):
+        """Test that the parsed config is cached under the user cache directory."""
+        config_path = tmp_path / "DockTUI.yaml"
+        config_path.write_text("log:\n  tail: 300\n")
+        cache_path = tmp_path / "cache" / "DockTUI" / "config.json"
+        env = {
+            "DOCKTUI_CONFIG": str(config_path),
+            "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        }
+
+        with patch.dict(os.environ, env):
+            assert Config().get("log.tail") == 300
+
+            cached = json.loads(cache_path.read_text())
+            assert cached["config"] == {"log": {"tail": 300}}
+            assert not list(tmp_path.glob("*.json"))
+
+            # A cache of the same contents skips YAML parsing
+            with patch("yaml.load") as mock_load:
+                assert Config().get("log.tail") == 300
+                mock_load.assert_not_called()
+
+    def test_config_cache_for_other_contents_is_ignored(self, tmp_path):
+        """Test that a cache of different contents is ignored, whatever the mtime."""
+        config_path = tmp_path / "DockTUI.yaml"
+        config_path.write_text("log:\n  tail: 300\n")
+        env = {
+            "DOCKTUI_CONFIG": str(config_path),
+            "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        }
+
+        with patch.dict(os.environ, env):
+            assert Config().get("log.tail") == 300
+
+            # Same size and mtime, different contents
+            stat = config_path.stat()
+            config_path.write_text("log:\n  tail: 500\n")
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            assert Config().get("log.tail") == 500
+
+    def test_config_not_surviving_json_is_not_cached(self, tmp_path):
+        """Test that configs JSON would change, such as int keys, aren't cached."""
+        config_path = tmp_path / "DockTUI.yaml"
+        config_path.write_text("ports:\n  8080: web\n")
+        cache_dir = tmp_path / "cache"
+        env = {"DOCKTUI_CONFIG": str(config_path), "XDG_CACHE_HOME": str(cache_dir)}
+
+        with patch.dict(os.environ, env):
+            assert Config().config["ports"] == {8080: "web"}
+            assert not (cache_dir / "DockTUI" / "config.json").exists()
+            assert Config().config["ports"] == {8080: "web"}
+
+    def test_new_default_config_file_not_parsed(self):
+        """Test that a freshly written default config file isn't parsed again."""
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                with patch.dict(os.environ, {"HOME": tmpdir}, clear=True):
+                    with patch.object(Config, "_parse_config_file") as mock_parse:
+                        config = Config()
+                        assert config.get("log.max_lines") == 2000
+                        mock_parse.assert_not_called()
+
+                    # The next start parses the file that was written
+                    assert Config().get("log.max_lines") == 2000
+            finally:
+                os.chdir(original_cwd)
+
+    def test_construction_does_no_io(self):
+        """Test that creating a Config doesn't touch the filesystem until first use."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"HOME": tmpdir}, clear=True):
+                with patch.object(Config, "_get_config_path") as mock_path:
+                    config = Config()
+                    mock_path.assert_not_called()
+                    assert not (Path(tmpdir) / ".config").exists()
+
+    def test_env_override_changes_between_gets(self):
+        """Test that cached key lookups still see changed environment overrides."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {"HOME": tmpdir}, clear=True):
+                config = Config()
+                assert config.get("log.tail") == 200
+
+                os.environ["DOCKTUI_LOG_TAIL"] = "50"
+                assert config.get("log.tail") == 50
+
+                os.environ["DOCKTUI_LOG_TAIL"] = "75"
+                assert config.get("log.tail") == 75
+
+                del os.environ["DOCKTUI_LOG_TAIL"]
+                assert config.get("log.tail") == 200
+
+    def test_loaded_keys_are_indexed(self):
+        """Test the env var and path of every loaded setting are precomputed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "DockTUI.yaml"
+            config_path.write_text("custom:\n  nested:\n    value: 1\n")
+
+            with patch.dict(os.environ, {"DOCKTUI_CONFIG": str(config_path)}):
+                with patch.dict(_key_paths, clear=True):
+                    _ = Config().config
+
+                    assert _key_paths["log.max_lines"] == (
+                        "DOCKTUI_LOG_MAX_LINES",
+                        ("log", "max_lines"),
+                    )
+                    assert _key_paths["custom.nested.value"] == (
+                        "DOCKTUI_CUSTOM_NESTED_VALUE",
+                        ("custom", "nested", "value"),
+                    )
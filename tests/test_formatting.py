@@ -0,0 +1,26 @@
+"""Tests for formatting utilities."""
+
+from DockTUI.utils.formatting import format_bytes, format_memory
+
+
+class TestFormatBytes:
+    """Test cases for format_bytes function."""
+
+    def test_units(self):
+        """Test each decimal-prefixed unit."""
+        assert format_bytes(512) == "512 B"
+        assert format_bytes(2048) == "2.0 KB"
+        assert format_bytes(5 * 1048576) == "5.0 MB"
+        assert format_bytes(3 * 1073741824) == "3.0 GB"
+
+
+class TestFormatMemory:
+    """Test cases for format_memory function."""
+
+    def test_units(self):
+        """Test each binary unit, matching the docker stats CLI."""
+        assert format_memory(0) == "0.0B"
+        assert format_memory(1536) == "1.5KiB"
+        assert format_memory(256 * 1024**2) == "256.0MiB"
+        assert format_memory(2 * 1024**3) == "2.0GiB"
+        assert format_memory(1024**5) == "1.0PiB"
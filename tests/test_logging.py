@@ -0,0 +1,79 @@
+"""Unit tests for logging setup."""
+
+import logging
+from logging.handlers import MemoryHandler, QueueHandler, RotatingFileHandler
+
+import pytest
+
+from DockTUI.utils import logging as logging_utils
+from DockTUI.utils.logging import setup_logging, stop_logging
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Restore the root logger's level and handlers after a test."""
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    handlers = list(root_logger.handlers)
+    yield root_logger
+    for handler in root_logger.handlers:
+        if handler not in handlers:
+            root_logger.removeHandler(handler)
+    root_logger.setLevel(level)
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def test_disabled_without_debug(self, monkeypatch, restore_root_logger):
+        """Test logging stays off unless DOCKTUI_DEBUG is 1."""
+        monkeypatch.delenv("DOCKTUI_DEBUG", raising=False)
+
+        assert setup_logging() is None
+        assert restore_root_logger.level == logging.CRITICAL
+
+    def test_writes_through_queue_listener(
+        self, monkeypatch, tmp_path, restore_root_logger
+    ):
+        """Test records go through a QueueHandler and reach the log file."""
+        monkeypatch.setenv("DOCKTUI_DEBUG", "1")
+        monkeypatch.setenv("DOCKTUI_LOG_DIR", str(tmp_path))
+
+        log_file = setup_logging()
+        try:
+            assert any(
+                isinstance(handler, QueueHandler)
+                for handler in restore_root_logger.handlers
+            )
+
+            logging.getLogger("DockTUI.test").error("queued %s", "message")
+        finally:
+            # Stopping the listener flushes pending records to the file
+            stop_logging()
+
+        assert log_file == tmp_path / "DockTUI.log"
+        assert "queued message" in log_file.read_text()
+
+    def test_buffers_records_until_stopped(
+        self, monkeypatch, tmp_path, restore_root_logger
+    ):
+        """Test records below ERROR are buffered and written when logging stops."""
+        monkeypatch.setenv("DOCKTUI_DEBUG", "1")
+        monkeypatch.setenv("DOCKTUI_LOG_DIR", str(tmp_path))
+
+        log_file = setup_logging()
+        try:
+            (buffer,) = logging_utils._log_listener.handlers
+            assert isinstance(buffer, MemoryHandler)
+            assert isinstance(buffer.target, RotatingFileHandler)
+
+            logging.getLogger("DockTUI.test").info("buffered message")
+        finally:
+            stop_logging()
+
+        assert "buffered message" in log_file.read_text()
+        assert logging_utils._log_listener is None
+        assert logging_utils._log_buffer is None
+
+        # A second stop, e.g. from the atexit hook, is a no-op
+        stop_logging()
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
+from DockTUI.docker_mgmt.types import ContainerInfo
 from DockTUI.ui.actions.docker_actions import DockerActions
 
 if TYPE_CHECKING:
@@ -59,6 +60,21 @@ class TestDockerActions:
         app = MockDockTUIApp()
         assert app._recreating_container_name is None
         assert app._recreating_item_type is None
+        assert app._post_command_refresh_timer is None
+
+    def test_schedule_post_command_refresh_replaces_pending_timer(self):
+        """Test only the most recently scheduled post-command refresh stays active."""
+        app = MockDockTUIApp()
+        first_timer, second_timer = Mock(), Mock()
+        app.set_timer = Mock(side_effect=[first_timer, second_timer])
+
+        app._schedule_post_command_refresh()
+        app._schedule_post_command_refresh()
+
+        first_timer.stop.assert_called_once()
+        second_timer.stop.assert_not_called()
+        assert app._post_command_refresh_timer is second_timer
+        app.set_timer.assert_called_with(2, app.action_refresh)
 
     def test_is_action_applicable_no_selection(self):
         """Test is_action_applicable with no selection."""
@@ -176,6 +192,27 @@ class TestDockerActions:
         mock_thread.assert_called_once()
         mock_thread_instance.start.assert_called_once()
 
+    @patch("DockTUI.ui.actions.docker_actions.threading.Thread")
+    def test_execute_docker_command_stack_failure_message(self, mock_thread):
+        """Test a failed stack command reports the action's verb form."""
+        app = MockDockTUIApp()
+        app.container_list.selected_item = ("stack", "my-stack")
+        app.container_list.selected_stack_data = {
+            "name": "my-stack",
+            "config_file": "/path/to/compose.yml",
+        }
+        app.docker.execute_stack_command.return_value = False
+        app.docker.last_error = "compose failed"
+
+        app.execute_docker_command("down:remove_volumes")
+
+        # Run the background work inline
+        mock_thread.call_args.kwargs["target"]()
+
+        app.error_display.update.assert_called_with(
+            "Error taking down stack: compose failed"
+        )
+
     @patch("DockTUI.ui.actions.docker_actions.threading.Thread")
     def test_execute_docker_command_container_recreate(self, mock_thread):
         """Test execute_docker_command for container recreate."""
@@ -345,6 +382,19 @@ class TestDockerActions:
         # The operation will be called in a thread, so check immediate feedback
         app.error_display.update.assert_called_with("Removing 2 unused volumes...")
 
+    def test_execute_volume_command_remove_unused_given_volumes(self):
+        """Test volumes already looked up aren't looked up again."""
+        app = MockDockTUIApp()
+        app.docker.remove_unused_volumes.return_value = (True, "Removed 1 volume", 1)
+        app.container_list.volume_manager = Mock()
+
+        app.execute_volume_command(
+            "remove_unused_volumes", [{"name": "vol1", "in_use": False}]
+        )
+
+        app.docker.get_unused_volumes.assert_not_called()
+        app.error_display.update.assert_called_with("Removing 1 unused volumes...")
+
     def test_execute_volume_command_remove_unused_none(self):
         """Test remove unused volumes when none exist."""
         app = MockDockTUIApp()
@@ -450,20 +500,31 @@ class TestDockerActions:
         app._recreating_container_name = "my-container"
         app._recreating_item_type = "container"
 
-        containers = [
-            {"id": "new-id-123", "name": "my-container"},
-            {"id": "other-id", "name": "other-container"},
-        ]
+        recreated = ContainerInfo(
+            id="new-id-123",
+            name="my-container",
+            status="running",
+            uptime="1s",
+            cpu="0%",
+            memory="0B / 0B",
+            pids="1",
+            stack="stack1",
+            ports="",
+        )
+        containers = {
+            "my-container": recreated,
+            "other-container": Mock(id="other-id"),
+        }
 
         new_id, new_data = app.handle_post_recreate(containers)
 
         assert new_id == "new-id-123"
-        assert new_data == {"id": "new-id-123", "name": "my-container"}
+        assert new_data is recreated
 
         # Verify UI updates
         app.container_list.select_container.assert_called_once_with("new-id-123")
         app.log_pane.update_selection.assert_called_once_with(
-            "container", "new-id-123", {"id": "new-id-123", "name": "my-container"}, force_restart=True
+            "container", "new-id-123", recreated, force_restart=True
         )
 
         # Verify tracking variables cleared
@@ -476,7 +537,7 @@ class TestDockerActions:
         app._recreating_container_name = "my-stack"
         app._recreating_item_type = "stack"
 
-        containers = []
+        containers = {}
         new_id, new_data = app.handle_post_recreate(containers)
 
         assert new_id is None
@@ -495,7 +556,7 @@ class TestDockerActions:
         app._recreating_container_name = None
         app._recreating_item_type = None
 
-        containers = []
+        containers = {}
         new_id, new_data = app.handle_post_recreate(containers)
 
         assert new_id is None
@@ -512,7 +573,7 @@ class TestDockerActions:
         app._recreating_item_type = "container"
         app.log_pane = None
 
-        containers = []
+        containers = {}
         new_id, new_data = app.handle_post_recreate(containers)
 
         assert new_id is None
@@ -524,9 +585,9 @@ class TestDockerActions:
         app._recreating_container_name = "my-container"
         app._recreating_item_type = "container"
 
-        containers = [
-            {"id": "other-id", "name": "other-container"},
-        ]
+        containers = {
+            "other-container": {"id": "other-id", "name": "other-container"},
+        }
 
         new_id, new_data = app.handle_post_recreate(containers)
 
@@ -1,18 +1,37 @@
 """Tests for the RefreshActions mixin class."""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+from textual.worker import WorkerState
 
-from DockTUI.ui.actions.refresh_actions import RefreshActions
+from DockTUI.docker_mgmt.types import ContainerInfo
+from DockTUI.ui.actions.refresh_actions import (
+    REFRESH_INDICATOR_THRESHOLD,
+    RefreshActions,
+)
 
 if TYPE_CHECKING:
     from DockTUI.app import DockTUIApp
 
 
+def make_container(container_id, name, stack, status="running"):
+    """Build a ContainerInfo record for tests."""
+    return ContainerInfo(
+        id=container_id,
+        name=name,
+        status=status,
+        uptime="1h",
+        cpu="0%",
+        memory="0B / 0B",
+        pids="1",
+        stack=stack,
+        ports="",
+    )
+
+
 class MockDockTUIApp(RefreshActions):
     """Mock DockTUIApp for testing RefreshActions mixin."""
 
@@ -41,6 +60,7 @@ class MockDockTUIApp(RefreshActions):
         """Mock worker method to track calls."""
         self._worker_called = True
         self._worker_callback = callback
+        return Mock(state=WorkerState.RUNNING)
     
     def _get_versioned_title(self, suffix=""):
         """Mock implementation of _get_versioned_title."""
@@ -56,14 +76,14 @@ class TestRefreshActions:
         """Test initialization of RefreshActions."""
         app = MockDockTUIApp()
         assert app._refresh_count == 0
+        assert app._current_worker is None
 
     def test_refresh_containers_widgets_not_initialized(self):
         """Test refresh_containers when widgets are not initialized."""
         app = MockDockTUIApp()
         app.container_list = None
 
-        # Run the async function synchronously
-        asyncio.run(app.refresh_containers())
+        app.refresh_containers()
 
         # Should not call worker or update UI
         assert not app._worker_called
@@ -73,13 +93,54 @@ class TestRefreshActions:
         """Test successful refresh_containers call."""
         app = MockDockTUIApp()
 
-        # Run the async function synchronously
-        asyncio.run(app.refresh_containers())
+        app.refresh_containers()
 
         # Should update title and start worker
         assert "Refreshing..." in app.sub_title
         assert app._worker_called
-        assert app._worker_callback is not None
+        assert app._worker_callback == app._sync_update_ui_with_results
+
+    def test_refresh_containers_skips_while_worker_running(self):
+        """Test refresh_containers doesn't start a worker while one is in flight."""
+        app = MockDockTUIApp()
+        app.refresh_containers()
+        first_worker = app._current_worker
+        app._worker_called = False
+
+        app.refresh_containers()
+
+        assert not app._worker_called
+        assert app._current_worker is first_worker
+
+    def test_refresh_containers_after_worker_finished(self):
+        """Test refresh_containers starts a new worker once the last one finished."""
+        app = MockDockTUIApp()
+        app._current_worker = Mock(state=WorkerState.SUCCESS)
+
+        app.refresh_containers()
+
+        assert app._worker_called
+        assert app._current_worker.state == WorkerState.RUNNING
+
+    def test_refresh_on_timer_backs_off_after_slow_refresh(self):
+        """Test timer ticks are skipped while a slow refresh's backoff runs."""
+        app = MockDockTUIApp()
+        app.action_refresh = Mock()
+
+        # Nothing is known about refresh speed yet
+        app._refresh_on_timer()
+        assert app.action_refresh.call_count == 1
+
+        app._refresh_started_at = 100.0
+        app._last_refresh_duration = 4.0
+        with patch("DockTUI.ui.actions.refresh_actions.time") as mock_time:
+            mock_time.monotonic.return_value = 105.0
+            app._refresh_on_timer()
+            assert app.action_refresh.call_count == 1
+
+            mock_time.monotonic.return_value = 108.0
+            app._refresh_on_timer()
+            assert app.action_refresh.call_count == 2
 
     def test_refresh_containers_title_already_refreshing(self):
         """Test refresh_containers when title already shows refreshing."""
@@ -87,14 +148,37 @@ class TestRefreshActions:
         app.title = "DockTUI"
         app.sub_title = "\nRefreshing..."
 
-        # Run the async function synchronously
-        asyncio.run(app.refresh_containers())
+        app.refresh_containers()
 
         # Should not add another refreshing indicator
         assert app.title == "DockTUI"
         assert app.sub_title == "\nRefreshing..."
         assert app._worker_called
 
+    def test_refresh_containers_skips_indicator_for_fast_refresh(self):
+        """Test refresh_containers skips the indicator when refreshes are fast."""
+        app = MockDockTUIApp()
+        app._last_refresh_duration = 0.001
+
+        app.refresh_containers()
+
+        assert app.sub_title == ""
+        assert app._worker_called
+
+    def test_refresh_containers_indicator_follows_threshold(self):
+        """Test only refreshes after a visibly slow one show the indicator."""
+        app = MockDockTUIApp()
+        # A typical refresh of several Docker API round trips
+        app._last_refresh_duration = 0.15
+
+        app.refresh_containers()
+        assert app.sub_title == ""
+
+        app._current_worker = None
+        app._last_refresh_duration = REFRESH_INDICATOR_THRESHOLD
+        app.refresh_containers()
+        assert app.sub_title.endswith("Refreshing...")
+
     def test_refresh_containers_exception(self):
         """Test refresh_containers with exception."""
         app = MockDockTUIApp()
@@ -106,7 +190,7 @@ class TestRefreshActions:
         app._refresh_containers_worker = raise_error
 
         with patch("DockTUI.ui.actions.refresh_actions.logger") as mock_logger:
-            asyncio.run(app.refresh_containers())
+            app.refresh_containers()
 
             mock_logger.error.assert_called()
             app.error_display.update.assert_called_with("Error refreshing: Test error")
@@ -210,112 +294,160 @@ class TestRefreshActions:
             # Should return empty results
             assert result == ({}, {}, {}, {}, [])
 
-    def test_handle_refresh_results_success(self):
-        """Test _handle_refresh_results successful execution."""
+    def test_refresh_containers_worker_fetches_concurrently(self):
+        """Test the real worker passes the fetched stacks through to the others."""
         app = MockDockTUIApp()
-        app._sync_update_ui_with_results = Mock()
+        listed = Mock()
+        stacks = {
+            "stack1": {
+                "name": "stack1",
+                "containers": [listed],
+                "running": 1,
+                "exited": 0,
+            }
+        }
+        app.docker.get_networks.return_value = {"net1": {"name": "net1"}}
+        app.docker.get_compose_stacks.return_value = stacks
+        app.docker.get_images.return_value = {}
+        app.docker.get_volumes.return_value = {}
+        containers = [make_container("c1", "container1", "stack1")]
+        app.docker.get_containers.return_value = containers
+        callback = Mock()
 
-        networks = {"net1": {"name": "net1"}}
-        stacks = {"stack1": {"name": "stack1"}}
-        images = {"img1": {"id": "img1"}}
-        volumes = {"vol1": {"name": "vol1"}}
-        containers = [{"id": "container1"}]
+        worker = RefreshActions._refresh_containers_worker.__wrapped__
+        result = worker(app, callback)
+
+        app.docker.get_containers.assert_called_once_with(stacks)
+        # Networks and images reuse the containers listed with the stacks
+        app.docker.get_networks.assert_called_once_with([listed])
+        app.docker.get_images.assert_called_once_with([listed])
+        callback.assert_called_once_with(
+            {"net1": {"name": "net1"}},
+            stacks,
+            {},
+            {},
+            containers,
+            stats_suffix="1 Networks, 1 Stacks, 1 Running, 0 Exited",
+            containers_by_stack={"stack1": containers},
+        )
+        assert result[4] == containers
 
-        app._handle_refresh_results(networks, stacks, images, volumes, containers)
+    def test_refresh_containers_worker_without_stacks(self):
+        """Test networks and images list containers themselves when stacks fail."""
+        app = MockDockTUIApp()
+        app.docker.get_networks.return_value = {}
+        app.docker.get_compose_stacks.side_effect = Exception("Stacks error")
+        app.docker.get_images.return_value = {}
+        app.docker.get_volumes.return_value = {}
+        app.docker.get_containers.return_value = []
 
-        # Should clear error display
-        app.error_display.update.assert_called_with("")
+        worker = RefreshActions._refresh_containers_worker.__wrapped__
+        worker(app, Mock())
 
-        # Should call sync update
-        app._sync_update_ui_with_results.assert_called_once_with(
-            networks, stacks, images, volumes, containers
-        )
+        app.docker.get_networks.assert_called_once_with(None)
+        app.docker.get_images.assert_called_once_with(None)
 
-    def test_handle_refresh_results_with_docker_error(self):
-        """Test _handle_refresh_results when docker has last_error."""
+    def test_refresh_containers_worker_cancelled(self):
+        """Test a cancelled refresh doesn't deliver its results to the UI."""
         app = MockDockTUIApp()
-        app.docker.last_error = "Docker connection failed"
-        app._sync_update_ui_with_results = Mock()
+        app.docker.get_networks.return_value = {}
+        app.docker.get_compose_stacks.return_value = {}
+        app.docker.get_images.return_value = {}
+        app.docker.get_volumes.return_value = {}
+        app.docker.get_containers.return_value = []
+        app._current_worker = Mock(is_cancelled=True)
+        callback = Mock()
 
-        app._handle_refresh_results({}, {}, {}, {}, [])
+        worker = RefreshActions._refresh_containers_worker.__wrapped__
+        worker(app, callback)
 
-        # Should show docker error
-        app.error_display.update.assert_called_with("Error: Docker connection failed")
+        app.call_from_thread.assert_not_called()
+        callback.assert_not_called()
+
+    def test_refresh_containers_worker_clears_stale_error(self):
+        """Test the real worker drops an error left over from the last refresh."""
+        app = MockDockTUIApp()
+        app.docker.last_error = "Error from previous refresh"
+        app.docker.get_networks.return_value = {}
+        app.docker.get_compose_stacks.return_value = {}
+        app.docker.get_images.return_value = {}
+        app.docker.get_volumes.return_value = {}
+        app.docker.get_containers.return_value = []
 
-        # Should still call sync update
-        app._sync_update_ui_with_results.assert_called_once()
+        worker = RefreshActions._refresh_containers_worker.__wrapped__
+        worker(app, Mock())
 
-    def test_handle_refresh_results_exception(self):
-        """Test _handle_refresh_results with exception."""
+        assert app.docker.last_error is None
+
+    def test_refresh_containers_worker_one_fetch_fails(self):
+        """Test a single failing fetch doesn't blank the other results."""
         app = MockDockTUIApp()
-        app._sync_update_ui_with_results = Mock(side_effect=Exception("UI error"))
+        app.docker.get_networks.side_effect = Exception("Network error")
+        app.docker.get_compose_stacks.return_value = {
+            "stack1": {"name": "stack1", "containers": [], "running": 2, "exited": 1}
+        }
+        app.docker.get_images.return_value = {}
+        app.docker.get_volumes.return_value = {}
+        containers = [make_container("c1", "container1", "stack1")]
+        app.docker.get_containers.return_value = containers
+        callback = Mock()
 
+        worker = RefreshActions._refresh_containers_worker.__wrapped__
         with patch("DockTUI.ui.actions.refresh_actions.logger") as mock_logger:
-            app._handle_refresh_results({}, {}, {}, {}, [])
+            worker(app, callback)
 
             mock_logger.error.assert_called()
-            app.error_display.update.assert_called_with("Error refreshing: UI error")
+        callback.assert_called_once_with(
+            {},
+            {"stack1": {"name": "stack1", "containers": [], "running": 2, "exited": 1}},
+            {},
+            {},
+            containers,
+            stats_suffix="0 Networks, 1 Stacks, 2 Running, 1 Exited",
+            containers_by_stack={"stack1": containers},
+        )
 
-    def test_sync_update_ui_with_results_full_update(self):
-        """Test _sync_update_ui_with_results with full data."""
+    def test_sync_update_ui_with_results_clears_error_display(self):
+        """Test _sync_update_ui_with_results clears the error display."""
         app = MockDockTUIApp()
-        app.container_list.images_section_collapsed = True
-        app.container_list.image_manager = Mock()
-        app.container_list.image_manager._preserve_selected_image_id = None
-        app.container_list.image_manager.image_rows = {}  # Mock the image_rows attribute
 
-        networks = {
-            "net1": {
-                "name": "net1",
-                "connected_containers": [{"id": "c1", "name": "container1"}],
-            }
-        }
+        app._sync_update_ui_with_results({}, {}, {}, {}, [])
+
+        app.error_display.update.assert_called_once_with("")
+
+    def test_sync_update_ui_with_results_with_docker_error(self):
+        """Test _sync_update_ui_with_results when docker has last_error."""
+        app = MockDockTUIApp()
+        app.docker.last_error = "Docker connection failed"
+
+        app._sync_update_ui_with_results({}, {}, {}, {}, [])
+
+        # Should show docker error and still update the UI
+        app.error_display.update.assert_called_with("Error: Docker connection failed")
+        app.container_list.apply_state.assert_called_once()
+
+    def test_sync_update_ui_with_results_full_update(self):
+        """Test _sync_update_ui_with_results hands the snapshot to the container list."""
+        app = MockDockTUIApp()
+        networks = {"net1": {"name": "net1", "connected_containers": []}}
         stacks = {
             "stack1": {
                 "config_file": "/path/to/compose.yml",
                 "running": 2,
                 "exited": 1,
                 "total": 3,
-                "can_recreate": True,
-                "has_compose_file": True,
             }
         }
         images = {"img1": {"id": "img1", "tags": ["test:latest"]}}
         volumes = {"vol1": {"name": "vol1", "driver": "local"}}
         containers = [
-            {"id": "c1", "name": "container1", "stack": "stack1", "status": "running"}
+            make_container("c1", "container1", "stack1", status="running")
         ]
 
         app._sync_update_ui_with_results(networks, stacks, images, volumes, containers)
 
-        # Verify batch update
-        app.container_list.begin_update.assert_called_once()
-        app.container_list.end_update.assert_called_once()
-
-        # Verify stack was added
-        app.container_list.add_stack.assert_called_once_with(
-            "stack1", "/path/to/compose.yml", 2, 1, 3, True, True
-        )
-
-        # Verify image was added
-        app.container_list.add_image.assert_called_once_with(
-            {"id": "img1", "tags": ["test:latest"]}
-        )
-
-        # Verify volume was added
-        app.container_list.add_volume.assert_called_once_with(
-            {"name": "vol1", "driver": "local"}
-        )
-
-        # Verify network was added
-        app.container_list.add_network.assert_called_once_with(networks["net1"])
-        app.container_list.add_container_to_network.assert_called_once_with(
-            "net1", {"id": "c1", "name": "container1"}
-        )
-
-        # Verify container was added
-        app.container_list.add_container_to_stack.assert_called_once_with(
-            "stack1", containers[0]
+        app.container_list.apply_state.assert_called_once_with(
+            networks, stacks, images, volumes, containers, containers_by_stack=None
         )
 
         # Verify title was updated
@@ -324,41 +456,35 @@ class TestRefreshActions:
         # Verify refresh count incremented
         assert app._refresh_count == 1
 
-    def test_sync_update_ui_with_results_no_images(self):
-        """Test _sync_update_ui_with_results with no images."""
+    def test_sync_update_ui_with_results_skips_unchanged_title(self):
+        """Test _sync_update_ui_with_results doesn't rewrite an unchanged title."""
         app = MockDockTUIApp()
-        app.container_list.images_section_collapsed = False
-        app.container_list.images_container = Mock()
         app.container_list.image_manager = Mock()
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
+        app._get_versioned_title = Mock(return_value="DockTUI - stats")
 
-        networks = {}
-        stacks = {}
-        images = {}  # No images
-        volumes = {}
-        containers = []
-
-        app._sync_update_ui_with_results(networks, stacks, images, volumes, containers)
+        app._sync_update_ui_with_results({}, {}, {}, {}, [])
+        app._sync_update_ui_with_results({}, {}, {}, {}, [])
 
-        # Should show no images message
-        app.container_list.image_manager.show_no_images_message.assert_called_once()
+        app._get_versioned_title.assert_called_once_with(
+            "0 Networks, 0 Stacks, 0 Running, 0 Exited"
+        )
+        assert app.title == "DockTUI - stats"
 
-    def test_sync_update_ui_with_results_preserve_image_selection(self):
-        """Test _sync_update_ui_with_results preserving image selection."""
+    def test_sync_update_ui_with_results_uses_worker_stats(self):
+        """Test _sync_update_ui_with_results uses the summary from the worker."""
         app = MockDockTUIApp()
-        app.container_list.images_section_collapsed = True
         app.container_list.image_manager = Mock()
-        app.container_list.image_manager._preserve_selected_image_id = "img1"
-        app.container_list.image_manager.image_rows = {"img1": Mock()}
+        app.container_list.image_manager._preserve_selected_image_id = None
 
-        images = {"img1": {"id": "img1"}}
+        stats_suffix = "2 Networks, 1 Stacks, 3 Running, 0 Exited"
 
-        app._sync_update_ui_with_results({}, {}, images, {}, [])
+        app._sync_update_ui_with_results(
+            {}, {}, {}, {}, [], stats_suffix=stats_suffix
+        )
 
-        # Should re-select preserved image
-        app.container_list.image_manager.select_image.assert_called_once_with("img1")
-        assert app.container_list.image_manager._preserve_selected_image_id is None
+        assert app.title == "DockTUI - 2 Networks, 1 Stacks, 3 Running, 0 Exited"
 
     def test_sync_update_ui_with_results_handle_post_recreate(self):
         """Test _sync_update_ui_with_results calls handle_post_recreate."""
@@ -367,11 +493,13 @@ class TestRefreshActions:
         app.container_list.image_manager = Mock()
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
-        containers = [{"id": "c1", "stack": "default"}]
+        containers = [make_container("c1", "container1", "default")]
 
         app._sync_update_ui_with_results({}, {}, {}, {}, containers)
 
-        app.handle_post_recreate.assert_called_once_with(containers)
+        app.handle_post_recreate.assert_called_once_with(
+            {"container1": containers[0]}
+        )
 
     def test_sync_update_ui_with_results_update_selected_container(self):
         """Test _sync_update_ui_with_results updates selected container in log pane."""
@@ -381,7 +509,7 @@ class TestRefreshActions:
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
         containers = [
-            {"id": "c1", "name": "container1", "stack": "stack1", "status": "running"}
+            make_container("c1", "container1", "stack1", status="running")
         ]
 
         app._sync_update_ui_with_results({}, {}, {}, {}, containers)
@@ -390,6 +518,44 @@ class TestRefreshActions:
             "container", "c1", containers[0]
         )
 
+    def test_sync_update_ui_with_results_skips_selection_for_unchanged_state(self):
+        """Test an unchanged snapshot leaves the log pane and bindings alone."""
+        app = MockDockTUIApp()
+        app.container_list.selected_item = ("stack", "stack1")
+        app.container_list.apply_state = Mock(return_value=False)
+        app.handle_post_recreate = Mock()
+        app.refresh_bindings = Mock()
+        stacks = {"stack1": {"running": 1, "exited": 0}}
+        containers = [make_container("c1", "container1", "stack1")]
+
+        app._sync_update_ui_with_results({}, stacks, {}, {}, containers)
+
+        app.log_pane.update_selection.assert_not_called()
+        app.refresh_bindings.assert_not_called()
+        # A pending recreate is still settled
+        app.handle_post_recreate.assert_called_once_with(
+            {"container1": containers[0]}
+        )
+        assert app.title == "DockTUI - 0 Networks, 1 Stacks, 1 Running, 0 Exited"
+
+    def test_sync_update_ui_with_results_skips_unchanged_selected_container(self):
+        """Test the log pane is only updated when the selected container changes."""
+        app = MockDockTUIApp()
+        app.container_list.selected_item = ("container", "c1")
+
+        app._sync_update_ui_with_results(
+            {}, {}, {}, {}, [make_container("c1", "container1", "stack1")]
+        )
+        app._sync_update_ui_with_results(
+            {}, {}, {}, {}, [make_container("c1", "container1", "stack1")]
+        )
+        app.log_pane.update_selection.assert_called_once()
+
+        exited = make_container("c1", "container1", "stack1", status="exited")
+        app._sync_update_ui_with_results({}, {}, {}, {}, [exited])
+        app.log_pane.update_selection.assert_called_with("container", "c1", exited)
+        assert app.log_pane.update_selection.call_count == 2
+
     def test_sync_update_ui_with_results_selected_container_not_found(self):
         """Test _sync_update_ui_with_results when selected container not in new data."""
         app = MockDockTUIApp()
@@ -397,7 +563,7 @@ class TestRefreshActions:
         app.container_list.image_manager = Mock()
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
-        containers = [{"id": "c1", "name": "container1", "stack": "stack1"}]
+        containers = [make_container("c1", "container1", "stack1")]
 
         app._sync_update_ui_with_results({}, {}, {}, {}, containers)
 
@@ -411,7 +577,7 @@ class TestRefreshActions:
         app.container_list.image_manager = Mock()
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
-        containers = [{"id": "c1", "name": "container1", "stack": "stack1"}]
+        containers = [make_container("c1", "container1", "stack1")]
 
         app._sync_update_ui_with_results({}, {}, {}, {}, containers)
 
@@ -426,7 +592,7 @@ class TestRefreshActions:
         app.container_list.image_manager = Mock()
         app.container_list.image_manager._preserve_selected_image_id = None
         app.container_list.image_manager.image_rows = {}
-        containers = [{"id": "c1", "stack": "default"}]
+        containers = [make_container("c1", "container1", "default")]
 
         # Should not crash
         app._sync_update_ui_with_results({}, {}, {}, {}, containers)
@@ -434,10 +600,7 @@ class TestRefreshActions:
     def test_sync_update_ui_with_results_exception_in_update(self):
         """Test _sync_update_ui_with_results with exception during update."""
         app = MockDockTUIApp()
-        app.container_list.image_manager = Mock()
-        app.container_list.image_manager._preserve_selected_image_id = None
-        app.container_list.image_manager.image_rows = {}
-        app.container_list.begin_update.side_effect = Exception("Update error")
+        app.container_list.apply_state.side_effect = Exception("Update error")
 
         with patch("DockTUI.ui.actions.refresh_actions.logger") as mock_logger:
             app._sync_update_ui_with_results({}, {}, {}, {}, [])
@@ -445,45 +608,6 @@ class TestRefreshActions:
             mock_logger.error.assert_called()
             app.error_display.update.assert_called_with("Error updating UI: Update error")
 
-    def test_sync_update_ui_with_results_exception_ensures_end_update(self):
-        """Test _sync_update_ui_with_results calls end_update even on exception."""
-        app = MockDockTUIApp()
-        app.container_list.image_manager = Mock()
-        app.container_list.image_manager._preserve_selected_image_id = None
-        app.container_list.image_manager.image_rows = {}
-        app.container_list.add_stack.side_effect = Exception("Add error")
-
-        stacks = {"stack1": {"running": 1, "exited": 0, "total": 1}}
-
-        with patch("DockTUI.ui.actions.refresh_actions.logger"):
-            app._sync_update_ui_with_results({}, stacks, {}, {}, [])
-
-            # Should still call end_update
-            app.container_list.begin_update.assert_called_once()
-            app.container_list.end_update.assert_called_once()
-
-    def test_sync_update_ui_with_results_sorted_containers(self):
-        """Test _sync_update_ui_with_results sorts containers by stack."""
-        app = MockDockTUIApp()
-        app.container_list.image_manager = Mock()
-        app.container_list.image_manager._preserve_selected_image_id = None
-        app.container_list.image_manager.image_rows = {}
-
-        containers = [
-            {"id": "c3", "stack": "stack3"},
-            {"id": "c1", "stack": "stack1"},
-            {"id": "c2", "stack": "stack2"},
-        ]
-
-        app._sync_update_ui_with_results({}, {}, {}, {}, containers)
-
-        # Verify containers were added in sorted order
-        calls = app.container_list.add_container_to_stack.call_args_list
-        assert len(calls) == 3
-        assert calls[0][0] == ("stack1", {"id": "c1", "stack": "stack1"})
-        assert calls[1][0] == ("stack2", {"id": "c2", "stack": "stack2"})
-        assert calls[2][0] == ("stack3", {"id": "c3", "stack": "stack3"})
-
     def test_sync_update_ui_with_results_no_handle_post_recreate(self):
         """Test _sync_update_ui_with_results when handle_post_recreate doesn't exist."""
         app = MockDockTUIApp()
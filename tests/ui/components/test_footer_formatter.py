@@ -0,0 +1,244 @@
+"""Tests for the FooterFormatter class."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from rich.style import Style
+
+from DockTUI.ui.components.footer_formatter import FooterFormatter
+
+
+class TestFooterFormatter:
+    """Test cases for the FooterFormatter class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.status_bar = Mock()
+        self.container_list = Mock()
+        self.container_list.screen.query_one.return_value = self.status_bar
+        self.container_list.selected_item = None
+        self.formatter = FooterFormatter(self.container_list)
+
+    @pytest.fixture(autouse=True)
+    def no_coalescing(self):
+        """Let every footer update run immediately, unless a test opts back in."""
+        with patch(
+            "DockTUI.ui.components.footer_formatter.FOOTER_UPDATE_INTERVAL", 0.0
+        ):
+            yield
+
+    def rendered(self):
+        """Get the Text last shown in the status bar."""
+        return self.status_bar.update.call_args[0][0]
+
+    def test_no_selection(self):
+        """Test the footer without a selection."""
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == "No selection"
+
+    def test_volume(self):
+        """Test the footer for a selected volume."""
+        self.container_list.selected_item = ("volume", "data")
+        self.container_list.selected_volume_data = {
+            "name": "data",
+            "driver": "local",
+            "stack": None,
+            "in_use": True,
+            "container_names": ["web", "db"],
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == (
+            "  Volume: data | Driver: local | Stack: None | In Use: Yes (web, db)"
+        )
+
+    def test_image(self):
+        """Test the footer for a selected image."""
+        self.container_list.selected_item = ("image", "sha256:abc")
+        self.container_list.selected_image_data = {
+            "id": "0123456789abcdef",
+            "tags": [],
+            "containers": 0,
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        assert (
+            self.rendered().plain == "  Image: 0123456789ab | <none>\nContainers: None"
+        )
+
+    def test_image_tags(self):
+        """Test the footer lists every tag of a selected image."""
+        self.container_list.selected_item = ("image", "sha256:abc")
+        self.container_list.selected_image_data = {
+            "id": "0123456789abcdef",
+            "tags": ["nginx:latest", "nginx:1.27"],
+            "container_names": ["web"],
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == (
+            "  Image: 0123456789ab | nginx:latest, nginx:1.27\nContainers: web"
+        )
+
+    def test_network(self):
+        """Test the footer for a selected network."""
+        self.container_list.selected_item = ("network", "bridge")
+        self.container_list.selected_network_data = {
+            "name": "bridge",
+            "driver": "bridge",
+            "scope": "local",
+            "total_containers": 2,
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == (
+            "  Network: bridge | Driver: bridge | Scope: local | Containers: 2"
+        )
+
+    def test_stack(self):
+        """Test the footer for a selected stack."""
+        self.container_list.selected_item = ("stack", "web")
+        self.container_list.selected_stack_data = {
+            "name": "web",
+            "running": 2,
+            "exited": 1,
+            "total": 3,
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == (
+            "  Stack: web | Running: 2 | Exited: 1 | Total: 3"
+        )
+
+    def test_container(self):
+        """Test the footer for a selected container, styled by its status."""
+        self.container_list.selected_item = ("container", "abc")
+        self.container_list.selected_container_data = {
+            "name": "web",
+            "status": "running",
+            "cpu": "1.00%",
+            "memory": "",
+            "image_id": "0123456789ab",
+            "image_name": "nginx:latest",
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        text = self.rendered()
+        assert text.plain == (
+            "web | Status: running | CPU: 1.00%\n"
+            "  Image: 0123456789ab - nginx:latest"
+        )
+        status_start = text.plain.index("running")
+        (status_span,) = [span for span in text.spans if span.start == status_start]
+        assert status_span.style == Style(color="green", bold=True)
+
+    @pytest.mark.parametrize(
+        "status,color",
+        [
+            ("Running", "green"),
+            ("exited", "yellow"),
+            ("paused", "red"),
+            ("starting...", "red"),
+        ],
+    )
+    def test_container_status_style(self, status, color):
+        """Test the container status is styled by its state."""
+        self.container_list.selected_item = ("container", "abc")
+        self.container_list.selected_container_data = {
+            "name": "web",
+            "status": status,
+        }
+
+        self.formatter.update_footer_with_selection()
+
+        text = self.rendered()
+        status_start = text.plain.index(status)
+        (status_span,) = [span for span in text.spans if span.start == status_start]
+        assert status_span.style == Style(color=color, bold=True)
+
+    def test_invalid_selection(self):
+        """Test the footer for an unknown item type."""
+        self.container_list.selected_item = ("unknown", "abc")
+
+        self.formatter.update_footer_with_selection()
+
+        assert self.rendered().plain == "Invalid selection: unknown - abc"
+
+    def test_unchanged_values_skip_update(self):
+        """Test the status bar is only updated when the shown values change."""
+        self.container_list.selected_item = ("stack", "web")
+        self.container_list.selected_stack_data = {
+            "name": "web",
+            "running": 2,
+            "exited": 1,
+            "total": 3,
+        }
+
+        self.formatter.update_footer_with_selection()
+        self.formatter.update_footer_with_selection()
+        assert self.status_bar.update.call_count == 1
+
+        self.container_list.selected_stack_data = {
+            "name": "web",
+            "running": 3,
+            "exited": 0,
+            "total": 3,
+        }
+        self.formatter.update_footer_with_selection()
+        assert self.status_bar.update.call_count == 2
+        assert "Running: 3" in self.rendered().plain
+
+    def test_no_selection_resets_last_values(self):
+        """Test reselecting an item after clearing the selection shows it again."""
+        self.container_list.selected_item = ("network", "bridge")
+        self.container_list.selected_network_data = {
+            "name": "bridge",
+            "driver": "bridge",
+            "scope": "local",
+            "total_containers": 2,
+        }
+        self.formatter.update_footer_with_selection()
+
+        self.container_list.selected_item = None
+        self.formatter.update_footer_with_selection()
+        self.container_list.selected_item = ("network", "bridge")
+        self.formatter.update_footer_with_selection()
+
+        assert self.status_bar.update.call_count == 3
+        assert self.rendered().plain.startswith("  Network: bridge")
+
+    def test_status_bar_looked_up_once(self):
+        """Test the status bar is only queried again once it's detached."""
+        self.formatter.update_footer_with_selection()
+        self.formatter.update_footer_with_selection()
+        self.container_list.screen.query_one.assert_called_once_with("#status_bar")
+
+        self.status_bar.is_attached = False
+        self.formatter.update_footer_with_selection()
+        assert self.container_list.screen.query_one.call_count == 2
+
+    @patch("DockTUI.ui.components.footer_formatter.FOOTER_UPDATE_INTERVAL", 60.0)
+    def test_updates_coalesced_within_interval(self):
+        """Test updates right after another run once, when the interval ends."""
+        self.formatter.update_footer_with_selection()
+        self.formatter.update_footer_with_selection()
+        self.formatter.update_footer_with_selection()
+
+        assert self.status_bar.update.call_count == 1
+        self.container_list.set_timer.assert_called_once()
+        delay, callback = self.container_list.set_timer.call_args[0]
+        assert 0 < delay <= 60.0
+
+        callback()
+        assert self.status_bar.update.call_count == 2
+
+        # A new timer is only started for updates after the coalesced one ran
+        self.formatter.update_footer_with_selection()
+        assert self.container_list.set_timer.call_count == 2
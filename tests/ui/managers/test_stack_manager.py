@@ -30,6 +30,7 @@ class TestStackManager(unittest.TestCase):
         self.parent.stacks_container.children = []
         self.parent._is_updating = False
         self.parent._status_overrides = {}
+        self.parent._status_override_times = {}
         # Stack status overrides no longer exist
         self.parent.screen = None
 
@@ -127,6 +128,36 @@ class TestStackManager(unittest.TestCase):
         self.assertEqual(mock_header.has_compose_file, True)
         mock_header._update_content.assert_called_once()
 
+    def test_add_stack_unchanged_skips_header_update(self):
+        """Test re-adding a stack with identical values doesn't touch its header."""
+        mock_header = Mock()
+        mock_header.expanded = False
+        self.manager.stack_headers["test-stack"] = mock_header
+        self.manager.stack_tables["test-stack"] = Mock()
+
+        self.manager.add_stack("test-stack", "/path/compose.yml", 2, 1, 3)
+        self.manager.reset_tracking()
+        self.manager.add_stack("test-stack", "/path/compose.yml", 2, 1, 3)
+
+        mock_header._update_content.assert_called_once()
+        # Stack must still be tracked so cleanup doesn't remove it
+        self.assertIn("test-stack", self.manager._stacks_in_new_data)
+
+        self.manager.add_stack("test-stack", "/path/compose.yml", 1, 2, 3)
+        self.assertEqual(mock_header._update_content.call_count, 2)
+        self.assertEqual(mock_header.running, 1)
+
+    def test_remove_stack_forgets_fingerprint(self):
+        """Test removing a stack drops its cached header values."""
+        self.manager.stack_headers["test-stack"] = Mock()
+        self.manager.stack_tables["test-stack"] = Mock()
+        self.manager.add_stack("test-stack", "/path/compose.yml", 2, 1, 3)
+        self.parent.stacks_container = None
+
+        self.manager.remove_stack("test-stack")
+
+        self.assertNotIn("test-stack", self.manager._stack_fingerprints)
+
     def test_add_stack_updates_selected_stack_data(self):
         """Test that adding selected stack updates selected_stack_data."""
         mock_header = Mock()
@@ -253,6 +284,105 @@ class TestStackManager(unittest.TestCase):
             # Check stack was created
             mock_add_stack.assert_called_once_with("new-stack", "N/A", 0, 0, 0)
 
+    def test_add_containers_to_stack_batch(self):
+        """Test adding a batch of containers to a stack."""
+        mock_table = Mock()
+        mock_table.row_count = 0
+        self.manager.stack_tables["test-stack"] = mock_table
+        self.parent._is_updating = True
+
+        containers = [
+            {
+                "id": cid,
+                "name": f"container-{cid}",
+                "status": "running",
+                "uptime": "1 hour",
+                "cpu": "2%",
+                "memory": "50MB",
+                "pids": "5",
+                "ports": "",
+            }
+            for cid in ("abc123", "def456")
+        ]
+
+        self.manager.add_containers_to_stack("test-stack", containers)
+
+        self.assertEqual(mock_table.add_row.call_count, 2)
+        self.assertIn("abc123", self.manager.container_rows)
+        self.assertIn("def456", self.manager.container_rows)
+
+    def _batch_containers(self, status="running"):
+        """Build container dicts for batch tests."""
+        return [
+            {
+                "id": cid,
+                "name": f"container-{cid}",
+                "status": status,
+                "uptime": "1 hour",
+                "cpu": "2%",
+                "memory": "50MB",
+                "pids": "5",
+                "ports": "",
+            }
+            for cid in ("abc123", "def456")
+        ]
+
+    def test_add_containers_to_stack_skips_unchanged_table(self):
+        """Test a stack's rows aren't rebuilt when its containers didn't change."""
+        mock_table = Mock()
+        mock_table.row_count = 0
+        mock_table.has_class.return_value = False
+        self.manager.stack_tables["test-stack"] = mock_table
+        self.parent._is_updating = True
+
+        self.manager.add_containers_to_stack("test-stack", self._batch_containers())
+        self.manager.reset_tracking()
+        self.manager.add_containers_to_stack("test-stack", self._batch_containers())
+
+        mock_table.clear.assert_called_once()
+        self.assertEqual(mock_table.add_row.call_count, 2)
+        self.assertIn("test-stack", self.manager._tables_in_new_data)
+        self.assertIn("abc123", self.manager.container_rows)
+
+        # Changed containers rebuild the table
+        self.manager.add_containers_to_stack(
+            "test-stack", self._batch_containers(status="exited")
+        )
+        self.assertEqual(mock_table.clear.call_count, 2)
+        self.assertEqual(mock_table.add_row.call_count, 4)
+
+    def test_add_containers_to_stack_rerenders_overridden_rows(self):
+        """Test rows with a status override are rebuilt on every update."""
+        mock_table = Mock()
+        mock_table.row_count = 0
+        mock_table.has_class.return_value = False
+        self.manager.stack_tables["test-stack"] = mock_table
+        self.parent._is_updating = True
+        self.parent._status_overrides = {"abc123": "stopping..."}
+
+        self.manager.add_containers_to_stack("test-stack", self._batch_containers())
+        self.parent._status_overrides = {}
+        self.manager.add_containers_to_stack("test-stack", self._batch_containers())
+
+        self.assertEqual(mock_table.clear.call_count, 2)
+
+    def test_cleanup_removed_stacks_clears_emptied_table(self):
+        """Test a stack that lost all its containers has its table cleared."""
+        mock_table = Mock()
+        mock_table.row_count = 0
+        mock_table.has_class.return_value = False
+        self.manager.stack_headers["test-stack"] = Mock()
+        self.manager.stack_tables["test-stack"] = mock_table
+        self.parent._is_updating = True
+        self.manager.add_containers_to_stack("test-stack", self._batch_containers())
+
+        self.manager.reset_tracking()
+        self.manager._stacks_in_new_data.add("test-stack")
+        self.manager.cleanup_removed_stacks()
+
+        self.assertEqual(mock_table.clear.call_count, 2)
+        self.assertEqual(self.manager.container_rows, {})
+
     def test_add_container_to_stack_update_existing(self):
         """Test updating an existing container."""
         mock_table = Mock()
@@ -558,9 +688,11 @@ class TestStackManager(unittest.TestCase):
         self.assertIsNone(self.parent.selected_item)
         self.parent.post_message.assert_not_called()
 
-    def test_clear_tables(self):
-        """Test clearing all tables."""
+    def test_clear_table(self):
+        """Test clearing a single stack table."""
         mock_table1 = Mock()
+        mock_table1.has_class.return_value = True
+        mock_table1._selected_row_key = "abc123"
         mock_table2 = Mock()
         self.manager.stack_tables = {
             "stack1": mock_table1,
@@ -570,15 +702,19 @@ class TestStackManager(unittest.TestCase):
             "abc123": ("stack1", 0),
             "def456": ("stack2", 0)
         }
+        self.manager._table_snapshots["stack1"] = ()
 
-        self.manager.clear_tables()
+        self.manager._clear_table("stack1")
 
-        # Check tables were cleared
+        # Only the given table and its rows are cleared
         mock_table1.clear.assert_called_once()
-        mock_table2.clear.assert_called_once()
+        mock_table1.remove_class.assert_called_once_with("has-selection")
+        mock_table2.clear.assert_not_called()
+        self.assertEqual(self.manager.container_rows, {"def456": ("stack2", 0)})
+        self.assertNotIn("stack1", self.manager._table_snapshots)
 
-        # Check container rows were cleared
-        self.assertEqual(self.manager.container_rows, {})
+        # The selected row is remembered for restoration
+        self.assertEqual(self.manager._pending_selection, ("stack1", "abc123"))
 
     def test_reset_tracking(self):
         """Test resetting tracking."""
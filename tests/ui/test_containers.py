@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 import pytest
 from textual.widgets import DataTable, Static
 
-from DockTUI.ui.containers import ContainerList
+from DockTUI.ui.containers import ContainerList, group_by_stack
 from DockTUI.ui.widgets.headers import NetworkHeader, SectionHeader, StackHeader, VolumeHeader
 
 if TYPE_CHECKING:
@@ -152,7 +152,6 @@ class TestContainerList:
         """Test begin_update method."""
         # Mock managers
         container_list.network_manager.clear_tables = Mock()
-        container_list.stack_manager.clear_tables = Mock()
         container_list.image_manager.reset_tracking = Mock()
         container_list.volume_manager.reset_tracking = Mock()
         container_list.network_manager.reset_tracking = Mock()
@@ -170,7 +169,6 @@ class TestContainerList:
 
         # Verify manager methods called
         container_list.network_manager.clear_tables.assert_called_once()
-        container_list.stack_manager.clear_tables.assert_called_once()
         container_list.image_manager.reset_tracking.assert_called_once()
         container_list.volume_manager.reset_tracking.assert_called_once()
         container_list.network_manager.reset_tracking.assert_called_once()
@@ -402,6 +400,171 @@ class TestContainerList:
         # Verify backward compatibility
         assert container_list.selected_container_data == {"id": "test-container"}
 
+    def test_add_containers_to_stack(self, container_list):
+        """Test add_containers_to_stack method."""
+        container_list.stack_manager.add_containers_to_stack = Mock()
+        container_list.stack_manager.selected_container_data = {"id": "c2"}
+
+        containers = [{"id": "c1"}, {"id": "c2"}]
+        container_list.add_containers_to_stack("test-stack", containers)
+
+        container_list.stack_manager.add_containers_to_stack.assert_called_once_with(
+            "test-stack", containers
+        )
+        assert container_list.selected_container_data == {"id": "c2"}
+
+    @staticmethod
+    def _mock_apply_state_targets(container_list):
+        """Replace the methods apply_state drives with mocks."""
+        for name in (
+            "begin_update",
+            "end_update",
+            "add_stack",
+            "add_image",
+            "add_volume",
+            "add_network",
+            "add_containers_to_network",
+            "add_containers_to_stack",
+        ):
+            setattr(container_list, name, Mock())
+        container_list.image_manager = Mock()
+        container_list.image_manager._preserve_selected_image_id = None
+        container_list.image_manager.image_rows = {}
+
+    def test_apply_state_renders_snapshot(self, container_list):
+        """Test apply_state adds every item in the snapshot in one batch."""
+        self._mock_apply_state_targets(container_list)
+        networks = {
+            "net1": {"name": "net1", "connected_containers": [{"id": "c1"}]}
+        }
+        stacks = {
+            "stack1": {
+                "config_file": "/path/compose.yml",
+                "running": 1,
+                "exited": 0,
+                "total": 1,
+            }
+        }
+        images = {"img1": {"id": "img1"}}
+        volumes = {"vol1": {"name": "vol1"}}
+        containers = [
+            Mock(stack="stack3"),
+            Mock(stack="stack3"),
+            Mock(stack="stack1"),
+        ]
+
+        assert container_list.apply_state(
+            networks, stacks, images, volumes, containers
+        )
+
+        container_list.begin_update.assert_called_once()
+        container_list.end_update.assert_called_once()
+        container_list.add_stack.assert_called_once_with(
+            "stack1", "/path/compose.yml", 1, 0, 1, True, True
+        )
+        container_list.add_image.assert_called_once_with({"id": "img1"})
+        container_list.add_volume.assert_called_once_with({"name": "vol1"})
+        container_list.add_network.assert_called_once_with(networks["net1"])
+        container_list.add_containers_to_network.assert_called_once_with(
+            "net1", [{"id": "c1"}]
+        )
+        assert container_list.add_containers_to_stack.call_args_list == [
+            call("stack3", [containers[0], containers[1]]),
+            call("stack1", [containers[2]]),
+        ]
+
+    def test_apply_state_uses_grouped_containers(self, container_list):
+        """Test apply_state uses containers already bucketed by the caller."""
+        self._mock_apply_state_targets(container_list)
+        containers = [Mock(stack="stack1"), Mock(stack="stack2")]
+        containers_by_stack = {
+            "stack1": [containers[0]],
+            "stack2": [containers[1]],
+        }
+
+        with patch("DockTUI.ui.containers.group_by_stack") as mock_group:
+            container_list.apply_state(
+                {}, {}, {}, {}, containers, containers_by_stack=containers_by_stack
+            )
+
+        mock_group.assert_not_called()
+        assert container_list.add_containers_to_stack.call_args_list == [
+            call("stack1", [containers[0]]),
+            call("stack2", [containers[1]]),
+        ]
+
+    def test_apply_state_skips_unchanged_snapshot(self, container_list):
+        """Test apply_state leaves the widgets alone when nothing changed."""
+        self._mock_apply_state_targets(container_list)
+        container_list._initial_load_complete = True
+        stacks = {
+            "stack1": {"config_file": "", "running": 1, "exited": 0, "total": 1}
+        }
+
+        assert container_list.apply_state({}, stacks, {}, {}, [])
+        assert not container_list.apply_state({}, dict(stacks), {}, {}, [])
+
+        container_list.begin_update.assert_called_once()
+        container_list.add_stack.assert_called_once()
+
+        # A changed snapshot is rendered again
+        changed = {"stack1": dict(stacks["stack1"], running=0, exited=1)}
+        assert container_list.apply_state({}, changed, {}, {}, [])
+        assert container_list.begin_update.call_count == 2
+
+    def test_apply_state_rerenders_while_status_overrides_pending(
+        self, container_list
+    ):
+        """Test apply_state keeps rendering while status overrides may expire."""
+        self._mock_apply_state_targets(container_list)
+        container_list._initial_load_complete = True
+        container_list._status_overrides = {"c1": "stopping..."}
+
+        container_list.apply_state({}, {}, {}, {}, [])
+        container_list.apply_state({}, {}, {}, {}, [])
+
+        assert container_list.begin_update.call_count == 2
+
+        # The first render after the overrides clear still redraws the rows
+        container_list._status_overrides = {}
+        container_list.apply_state({}, {}, {}, {}, [])
+        container_list.apply_state({}, {}, {}, {}, [])
+
+        assert container_list.begin_update.call_count == 3
+
+    def test_apply_state_no_images_message(self, container_list):
+        """Test apply_state shows the empty message in an expanded images section."""
+        self._mock_apply_state_targets(container_list)
+        container_list.images_section_collapsed = False
+        container_list.images_container = Mock()
+
+        container_list.apply_state({}, {}, {}, {}, [])
+
+        container_list.image_manager.show_no_images_message.assert_called_once()
+
+    def test_apply_state_preserves_image_selection(self, container_list):
+        """Test apply_state re-selects a preserved image."""
+        self._mock_apply_state_targets(container_list)
+        container_list.image_manager._preserve_selected_image_id = "img1"
+        container_list.image_manager.image_rows = {"img1": Mock()}
+
+        container_list.apply_state({}, {}, {"img1": {"id": "img1"}}, {}, [])
+
+        container_list.image_manager.select_image.assert_called_once_with("img1")
+        assert container_list.image_manager._preserve_selected_image_id is None
+
+    def test_apply_state_ends_update_on_error(self, container_list):
+        """Test apply_state always ends the batch and retries the snapshot later."""
+        self._mock_apply_state_targets(container_list)
+        container_list.add_stack.side_effect = Exception("Add error")
+        stacks = {"stack1": {"config_file": "", "running": 1, "exited": 0, "total": 1}}
+
+        with pytest.raises(Exception, match="Add error"):
+            container_list.apply_state({}, stacks, {}, {}, [])
+
+        container_list.end_update.assert_called_once()
+        assert container_list._state is None
+
     def test_add_container_to_network(self, container_list):
         """Test add_container_to_network method."""
         # Mock network manager
@@ -1007,4 +1170,22 @@ class TestContainerList:
 
             # Verify visibility states updated
             assert container_list.stacks_container.styles.display == "block"  # default not collapsed
-            assert container_list.images_container.styles.display == "none"  # collapsed by default
\ No newline at end of file
+            assert container_list.images_container.styles.display == "none"  # collapsed by default
+
+
+class TestGroupByStack:
+    """Test cases for group_by_stack."""
+
+    def test_interleaved_stacks_keep_every_container(self):
+        """Test containers of a stack are all kept when other stacks come between."""
+        containers = [
+            Mock(stack="web", name="a"),
+            Mock(stack="db", name="b"),
+            Mock(stack="web", name="c"),
+        ]
+
+        groups = group_by_stack(containers)
+
+        assert list(groups) == ["web", "db"]
+        assert groups["web"] == [containers[0], containers[2]]
+        assert groups["db"] == [containers[1]]